@@ -3,6 +3,10 @@
 Consolidates the logic for fetching perp account value + spot stablecoin
 collateral, which was previously duplicated across base_strategy,
 risk_manager, and margin_validator.
+
+The bot trades one account, so snapshots are fetched synchronously per
+address; the cache and single-flight below already collapse concurrent
+reads of that address into one request.
 """
 
 import logging
@@ -11,6 +15,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 from rate_limiter import api_wrapper, API_ERRORS
+from ttl_cache import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +28,11 @@ _DEFAULT_CACHE_TTL = 2.0
 
 @dataclass
 class AccountSnapshot:
-    """Minimal account state shared by all callers."""
+    """Minimal account state shared by all callers.
+
+    The ``user_state`` strings are converted to float once per fetch; cache
+    hits return this same object, so sizing calls do no parsing at all.
+    """
     account_value: float
     margin_used: float
 
@@ -34,6 +43,9 @@ class AccountSnapshot:
 _snapshot_cache: Dict[str, AccountSnapshot] = {}
 _snapshot_cache_time: Dict[str, float] = {}
 _snapshot_cache_ttl: float = _DEFAULT_CACHE_TTL
+# Concurrent misses for one address (e.g. the risk check and a strategy
+# thread) share a single user_state + spot_user_state round trip.
+_snapshot_flights: SingleFlight = SingleFlight()
 
 
 def set_snapshot_cache_ttl(ttl: float) -> None:
@@ -96,8 +108,21 @@ def get_account_snapshot(
         cached_time = _snapshot_cache_time.get(account_address, 0.0)
         if now - cached_time < _snapshot_cache_ttl and account_address in _snapshot_cache:
             return _snapshot_cache[account_address]
+        return _snapshot_flights.do(
+            account_address,
+            lambda: _build_snapshot(info, account_address, None, last_known_balance, now),
+        )
+    return _build_snapshot(info, account_address, user_state, last_known_balance, now)
+
 
-    # ---- fetch user_state if not provided ----
+def _build_snapshot(
+    info: Any,
+    account_address: str,
+    user_state: Optional[Dict],
+    last_known_balance: Optional[float],
+    now: float,
+) -> AccountSnapshot:
+    """Fetch (unless *user_state* is given), build and cache the snapshot."""
     if user_state is None:
         user_state = api_wrapper.call(info.user_state, account_address)
     if not user_state or 'marginSummary' not in user_state:
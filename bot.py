@@ -1,12 +1,15 @@
+import functools
 import logging
 import os
+import random
 import sys
 import time
 import signal
+import threading
 import types
 import warnings
 from importlib.metadata import PackageNotFoundError, version as _pkg_version
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from log_config import setup_logging
 setup_logging()
@@ -77,6 +80,7 @@ def _assert_sdk_version() -> None:
 
 _assert_sdk_version()
 
+from hyperliquid.api import API  # noqa: E402
 from hyperliquid.exchange import Exchange  # noqa: E402
 from config import Config  # noqa: E402
 from market_data import MarketDataManager  # noqa: E402
@@ -87,22 +91,16 @@ from validation.strategy_validator import known_market_making_keys  # noqa: E402
 from json_config_loader import ConfigError, load_json_configs  # noqa: E402
 from hip3 import DEXRegistry, MultiDexMarketData, MultiDexOrderManager  # noqa: E402
 from position_closer import close_position_market  # noqa: E402
-from rate_limiter import API_ERRORS  # noqa: E402
+from rate_limiter import API_ERRORS, api_wrapper  # noqa: E402
 from exceptions import TransientError, DataError, ConfigurationError  # noqa: E402
 from circuit_breaker import CircuitBreaker  # noqa: E402
+from http_session import build_http_session, share_http_session  # noqa: E402
+from order_signing import install_cached_l1_signer  # noqa: E402
 from ws import (  # noqa: E402
-    MarketDataFeed, FillFeed, BboGuard, ImbalanceGuard,
+    MarketDataFeed, FillFeed, OrderUpdateFeed, BboGuard, ImbalanceGuard,
     CloseRefreshGuard, BboVelocityGuard, AdverseSelectionTracker, WsReconnector,
 )
-from strategies import (  # noqa: E402
-    SimpleMAStrategy,
-    RSIStrategy,
-    BollingerBandsStrategy,
-    MACDStrategy,
-    GridTradingStrategy,
-    BreakoutStrategy,
-    MarketMakingStrategy
-)
+from strategies import STRATEGY_CLASS_NAMES, load_strategy_class  # noqa: E402
 
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL")
 
@@ -126,6 +124,7 @@ _RISK_PARAMS = [
 _COMMON_PARAMS = [
     'position_size_usd', 'max_positions', 'take_profit_percent',
     'stop_loss_percent', 'candle_interval', 'account_cap_pct',
+    'signal_workers', 'bulk_signal_orders',
 ]
 
 # Per-strategy parameter names. Each list contains the ``config_key``
@@ -239,6 +238,164 @@ _STRATEGY_PARAMS = {
 }
 
 
+def _collect_params(params: List[Any], source: Any, dest: Dict[str, Any]) -> None:
+    """Copy non-None CLI args named in *params* into *dest*.
+
+    Entries are config keys, or ``(arg_name, config_key)`` tuples for
+    renamed flags (see ``_STRATEGY_PARAMS``).
+    """
+    for entry in params:
+        if isinstance(entry, tuple):
+            arg_name, config_key = entry
+        else:
+            arg_name, config_key = entry, entry
+        val = getattr(source, arg_name, None)
+        if val is not None:
+            dest[config_key] = val
+
+
+# Default strategy configurations. Built once at import time and exposed
+# read-only; ``HyperliquidBot.__init__`` merges them under JSON / CLI layers.
+_DEFAULT_STRATEGY_CONFIGS: Mapping[str, Mapping[str, Any]] = types.MappingProxyType({
+    'simple_ma': types.MappingProxyType({
+        'fast_ma_period': 10,
+        'slow_ma_period': 30,
+        'position_size_usd': 100,
+        'max_positions': 3,
+        'take_profit_percent': 5,
+        'stop_loss_percent': 2,
+        'candle_interval': '5m',
+    }),
+    'rsi': types.MappingProxyType({
+        'rsi_period': 14,
+        'oversold_threshold': 30,
+        'overbought_threshold': 70,
+        'position_size_usd': 100,
+        'max_positions': 3,
+        'take_profit_percent': 5,
+        'stop_loss_percent': 2,
+        'candle_interval': '15m',
+        'rsi_extreme_low': 25,
+        'rsi_moderate_low': 35,
+        'size_multiplier_extreme': 1.5,
+        'size_multiplier_moderate': 1.2,
+    }),
+    'bollinger_bands': types.MappingProxyType({
+        'bb_period': 20,
+        'std_dev': 2,
+        'squeeze_threshold': 0.02,
+        'position_size_usd': 100,
+        'max_positions': 3,
+        'take_profit_percent': 5,
+        'stop_loss_percent': 2,
+        'candle_interval': '15m',
+        'volatility_expansion_threshold': 1.5,
+        'high_band_width_threshold': 0.05,
+        'high_band_width_multiplier': 0.8,
+        'low_band_width_threshold': 0.02,
+        'low_band_width_multiplier': 1.2,
+    }),
+    'macd': types.MappingProxyType({
+        'fast_ema': 12,
+        'slow_ema': 26,
+        'signal_ema': 9,
+        'position_size_usd': 100,
+        'max_positions': 3,
+        'take_profit_percent': 5,
+        'stop_loss_percent': 2,
+        'candle_interval': '15m',
+        'divergence_lookback': 20,
+        'histogram_strength_high': 0.5,
+        'histogram_strength_low': 0.1,
+        'histogram_multiplier_high': 1.3,
+        'histogram_multiplier_low': 0.7,
+    }),
+    'grid_trading': types.MappingProxyType({
+        'grid_levels': 10,
+        'grid_spacing_pct': 0.5,
+        'position_size_per_grid': 50,
+        'max_positions': 5,
+        'range_period': 100,
+        'take_profit_percent': 2,
+        'stop_loss_percent': 5,
+        'candle_interval': '15m',
+        'range_pct_threshold': 10,
+        'volatility_threshold': 0.15,
+        'grid_recalc_bars': 20,
+        'grid_saturation_threshold': 0.7,
+        'grid_boundary_margin_low': 0.98,
+        'grid_boundary_margin_high': 1.02,
+        'account_cap_pct': 0.05,
+    }),
+    'breakout': types.MappingProxyType({
+        'lookback_period': 20,
+        'volume_multiplier': 1.5,
+        'breakout_confirmation_bars': 2,
+        'atr_period': 14,
+        'position_size_usd': 100,
+        'max_positions': 3,
+        'take_profit_percent': 7,
+        'stop_loss_percent': 3,
+        'candle_interval': '15m',
+        'pivot_window': 5,
+        'avg_volume_lookback': 20,
+        'stop_loss_atr_multiplier': 1.5,
+        'position_stop_loss_atr_multiplier': 2.0,
+        'strong_breakout_multiplier': 1.5,
+        'high_atr_threshold': 3.0,
+        'low_atr_threshold': 1.0,
+        'high_atr_multiplier': 0.7,
+        'low_atr_multiplier': 1.3,
+    }),
+    'market_making': types.MappingProxyType({
+        'spread_bps': 5,
+        'order_size_usd': 50,
+        'max_open_orders': 4,
+        'refresh_interval_seconds': 30,
+        'refresh_tolerance_bp': 0,
+        'close_immediately': True,
+        'maker_only': False,
+        'max_positions': 3,
+        'take_profit_percent': 1,
+        'stop_loss_percent': 2,
+        'account_cap_pct': 0.05,
+        # Forager (composite-score auto-exclude). Defaults match the
+        # ForagerConfig dataclass; values can be overridden via env
+        # vars (e.g. FORAGER_WINDOW_SECONDS=3600) without adding a
+        # CLI flag for every internal formula constant.
+        'forager_enabled': False,
+        'forager_score_threshold': 30.0,
+        'forager_consecutive': 3,
+        'forager_cooldown_seconds': 1800,
+        'forager_weight_activity': 0.3,
+        'forager_weight_quality': 0.4,
+        'forager_weight_cost': 0.3,
+        'forager_window_seconds': 1800.0,
+        'forager_check_interval_seconds': 300.0,
+        'forager_activity_idle_min_seconds': 300.0,
+        'forager_cost_max_per_1k': 0.6,
+        'forager_min_closes_for_quality': 5,
+        # Per-coin entry-side position cap. When set, suppresses
+        # same-direction entries once |position| * mid_price reaches
+        # ``max_position_multiple`` × effective ``order_size_usd``.
+        # ``0.0`` (default) disables the cap.
+        'max_position_multiple': 0.0,
+    }),
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _wallet_from_key(private_key: str) -> Any:
+    """Derive the signing account once per key.
+
+    ``Account.from_key`` derives the public key and address with an
+    elliptic-curve multiplication; connection resets re-create the
+    Exchange but can reuse the same immutable account.
+    """
+    from eth_account import Account
+    return Account.from_key(private_key)
+
+
 def _apply_json_risk_overrides(json_overrides: Optional[Dict], args) -> None:
     """Wire risk parameters from JSON config into the ``Config`` class.
 
@@ -277,7 +434,7 @@ class HyperliquidBot:
         self.account_address = Config.ACCOUNT_ADDRESS
         self.running = False
         self.connection_retry_count = 0
-        self.last_connection_reset = time.time()
+        self.last_connection_reset = time.monotonic()
         self.main_loop_interval = main_loop_interval
         self.market_order_slippage = market_order_slippage
         self.api_timeout = Config.API_TIMEOUT
@@ -287,13 +444,34 @@ class HyperliquidBot:
         # when main_loop_interval is short (e.g. 3s). Risk checks cost 4 weight
         # and don't need sub-10s frequency.
         self._risk_check_interval: float = Config.RISK_CHECK_INTERVAL
-        # epoch 0 ensures the first cycle always triggers a risk check
-        self._last_risk_check: float = 0.0
+        # Monotonic deadline for the next check; 0 makes the first cycle check
+        self._next_risk_check: float = 0.0
         # Fail-safe: default to blocking until first real check completes
         self._last_risk_result: dict = {'all_checks_passed': False, 'action': 'none'}
+        # Monotonic deadline for the periodic risk-summary log line.
+        self._risk_summary_interval: float = 60.0
+        self._next_risk_summary: float = time.monotonic() + self._risk_summary_interval
+        # Sleep after a non-transient main-loop error (see _error_backoff_delay).
+        self._error_backoff_jitter: bool = Config.ERROR_BACKOFF_JITTER
+        self._error_backoff: float = 1.0
         self._enable_ws = enable_ws
+        # Event-driven wake-up: set by the WS l2Book listener so the main
+        # loop can react to pushed data instead of sleeping the full interval.
+        self._ws_min_cycle_interval: float = Config.WS_MIN_CYCLE_INTERVAL
+        self._cycle_wakeup = threading.Event()
+        # Set by the signal handler so main-loop sleeps end at once on shutdown.
+        self._shutdown_event = threading.Event()
+        # Keep the OrderManager mids cache fed from a WS allMids subscription.
+        self._ws_all_mids: bool = Config.WS_ALL_MIDS
+        # Push-based order status from a WS orderUpdates subscription; while
+        # it runs, the REST order-status poll becomes a periodic reconcile.
+        self._ws_order_updates: bool = Config.WS_ORDER_UPDATES
+        self._order_reconcile_interval: float = Config.ORDER_RECONCILE_INTERVAL
+        # Monotonic deadline for the next reconcile; 0 makes the first cycle poll
+        self._next_order_reconcile: float = 0.0
         self.ws_feed: Optional[MarketDataFeed] = None
         self.fill_feed: Optional[FillFeed] = None
+        self.order_update_feed: Optional[OrderUpdateFeed] = None
         self.bbo_guard: Optional[BboGuard] = None
         self.imbalance_guard: Optional[ImbalanceGuard] = None
         self.close_refresh_guard: Optional[CloseRefreshGuard] = None
@@ -312,142 +490,15 @@ class HyperliquidBot:
             self.info, self.account_address, self.risk_config,
             hip3_dexes=self.hip3_dexes,
             market_data=self.market_data if self.hip3_dexes else None,
+            user_state_source=self.order_manager.get_user_state,
         )
 
-        # Default strategy configurations
-        default_configs = {
-            'simple_ma': {
-                'fast_ma_period': 10,
-                'slow_ma_period': 30,
-                'position_size_usd': 100,
-                'max_positions': 3,
-                'take_profit_percent': 5,
-                'stop_loss_percent': 2,
-                'candle_interval': '5m',
-            },
-            'rsi': {
-                'rsi_period': 14,
-                'oversold_threshold': 30,
-                'overbought_threshold': 70,
-                'position_size_usd': 100,
-                'max_positions': 3,
-                'take_profit_percent': 5,
-                'stop_loss_percent': 2,
-                'candle_interval': '15m',
-                'rsi_extreme_low': 25,
-                'rsi_moderate_low': 35,
-                'size_multiplier_extreme': 1.5,
-                'size_multiplier_moderate': 1.2,
-            },
-            'bollinger_bands': {
-                'bb_period': 20,
-                'std_dev': 2,
-                'squeeze_threshold': 0.02,
-                'position_size_usd': 100,
-                'max_positions': 3,
-                'take_profit_percent': 5,
-                'stop_loss_percent': 2,
-                'candle_interval': '15m',
-                'volatility_expansion_threshold': 1.5,
-                'high_band_width_threshold': 0.05,
-                'high_band_width_multiplier': 0.8,
-                'low_band_width_threshold': 0.02,
-                'low_band_width_multiplier': 1.2,
-            },
-            'macd': {
-                'fast_ema': 12,
-                'slow_ema': 26,
-                'signal_ema': 9,
-                'position_size_usd': 100,
-                'max_positions': 3,
-                'take_profit_percent': 5,
-                'stop_loss_percent': 2,
-                'candle_interval': '15m',
-                'divergence_lookback': 20,
-                'histogram_strength_high': 0.5,
-                'histogram_strength_low': 0.1,
-                'histogram_multiplier_high': 1.3,
-                'histogram_multiplier_low': 0.7,
-            },
-            'grid_trading': {
-                'grid_levels': 10,
-                'grid_spacing_pct': 0.5,
-                'position_size_per_grid': 50,
-                'max_positions': 5,
-                'range_period': 100,
-                'take_profit_percent': 2,
-                'stop_loss_percent': 5,
-                'candle_interval': '15m',
-                'range_pct_threshold': 10,
-                'volatility_threshold': 0.15,
-                'grid_recalc_bars': 20,
-                'grid_saturation_threshold': 0.7,
-                'grid_boundary_margin_low': 0.98,
-                'grid_boundary_margin_high': 1.02,
-                'account_cap_pct': 0.05,
-            },
-            'breakout': {
-                'lookback_period': 20,
-                'volume_multiplier': 1.5,
-                'breakout_confirmation_bars': 2,
-                'atr_period': 14,
-                'position_size_usd': 100,
-                'max_positions': 3,
-                'take_profit_percent': 7,
-                'stop_loss_percent': 3,
-                'candle_interval': '15m',
-                'pivot_window': 5,
-                'avg_volume_lookback': 20,
-                'stop_loss_atr_multiplier': 1.5,
-                'position_stop_loss_atr_multiplier': 2.0,
-                'strong_breakout_multiplier': 1.5,
-                'high_atr_threshold': 3.0,
-                'low_atr_threshold': 1.0,
-                'high_atr_multiplier': 0.7,
-                'low_atr_multiplier': 1.3,
-            },
-            'market_making': {
-                'spread_bps': 5,
-                'order_size_usd': 50,
-                'max_open_orders': 4,
-                'refresh_interval_seconds': 30,
-                'refresh_tolerance_bp': 0,
-                'close_immediately': True,
-                'maker_only': False,
-                'max_positions': 3,
-                'take_profit_percent': 1,
-                'stop_loss_percent': 2,
-                'account_cap_pct': 0.05,
-                # Forager (composite-score auto-exclude). Defaults match the
-                # ForagerConfig dataclass; values can be overridden via env
-                # vars (e.g. FORAGER_WINDOW_SECONDS=3600) without adding a
-                # CLI flag for every internal formula constant.
-                'forager_enabled': False,
-                'forager_score_threshold': 30.0,
-                'forager_consecutive': 3,
-                'forager_cooldown_seconds': 1800,
-                'forager_weight_activity': 0.3,
-                'forager_weight_quality': 0.4,
-                'forager_weight_cost': 0.3,
-                'forager_window_seconds': 1800.0,
-                'forager_check_interval_seconds': 300.0,
-                'forager_activity_idle_min_seconds': 300.0,
-                'forager_cost_max_per_1k': 0.6,
-                'forager_min_closes_for_quality': 5,
-                # Per-coin entry-side position cap. When set, suppresses
-                # same-direction entries once |position| * mid_price reaches
-                # ``max_position_multiple`` × effective ``order_size_usd``.
-                # ``0.0`` (default) disables the cap.
-                'max_position_multiple': 0.0,
-            }
-        }
-
         # Merge layers (lowest precedence first):
         #   dataclass defaults < JSON overrides < CLI / env (strategy_config).
         # JSON is opt-in via --config / $BOT_CONFIG; when both unset,
         # ``json_overrides`` is None and the layering matches prior releases.
         config = {
-            **default_configs.get(strategy_name, {}),
+            **_DEFAULT_STRATEGY_CONFIGS.get(strategy_name, {}),
             **(json_overrides or {}),
             **(strategy_config or {}),
         }
@@ -484,26 +535,16 @@ class HyperliquidBot:
             logger.info(f"HIP-3 coins: {hip3_coins}")
         logger.info(f"All trading coins: {self.trading_coins}")
 
-        # Strategy factory
-        strategy_map = {
-            'simple_ma': SimpleMAStrategy,
-            'rsi': RSIStrategy,
-            'bollinger_bands': BollingerBandsStrategy,
-            'macd': MACDStrategy,
-            'grid_trading': GridTradingStrategy,
-            'breakout': BreakoutStrategy,
-            'market_making': MarketMakingStrategy
-        }
-
-        if strategy_name in strategy_map:
-            self.strategy = strategy_map[strategy_name](
+        # Strategy factory: only the selected strategy module is imported
+        if strategy_name in STRATEGY_CLASS_NAMES:
+            self.strategy = load_strategy_class(strategy_name)(
                 self.market_data,
                 self.order_manager,
                 config
             )
             logger.info(f"Initialized {strategy_name} strategy")
         else:
-            available_strategies = ', '.join(strategy_map.keys())
+            available_strategies = ', '.join(STRATEGY_CLASS_NAMES.keys())
             raise ValueError(f"Unknown strategy: {strategy_name}. Available strategies: {available_strategies}")
 
         self.coins = self.trading_coins
@@ -526,8 +567,7 @@ class HyperliquidBot:
         return unique, dups
 
     def _load_wallet(self) -> Any:
-        from eth_account import Account
-        return Account.from_key(Config.PRIVATE_KEY)
+        return _wallet_from_key(Config.PRIVATE_KEY)
 
     def _init_connections(self) -> None:
         """Create Exchange, Info, MarketData, and OrderManager instances.
@@ -535,21 +575,40 @@ class HyperliquidBot:
         Handles both standard Hyperliquid and HIP-3 multi-DEX modes.
         Called from ``__init__`` and ``_reset_connections``.
         """
-        self.registry = DEXRegistry(Config.API_URL)
+        # Fresh pooled session on every (re)init; the previous one is closed
+        # so a connection reset really drops the old sockets.
+        old_session = getattr(self, 'http_session', None)
+        if old_session is not None:
+            old_session.close()
+        self.http_session = build_http_session(pool_size=Config.HTTP_POOL_SIZE,
+                                               busy_poll_us=Config.HTTP_BUSY_POLL_US)
+        if Config.FAST_ORDER_SIGNING:
+            install_cached_l1_signer()
+
+        self.registry = DEXRegistry(Config.API_URL, session=self.http_session)
+        self._base_meta, self._base_spot_meta = self._fetch_base_metadata()
 
         if self.hip3_dexes:
             self.registry.discover(self.hip3_dexes)
             self.exchange = Exchange(
                 wallet=self._load_wallet(),
                 base_url=Config.API_URL,
+                meta=self._base_meta,
+                spot_meta=self._base_spot_meta,
                 perp_dexs=self._build_perp_dexs(),
                 timeout=self.api_timeout,
             )
             self.info = self.exchange.info
+            share_http_session(self.http_session, self.exchange, self.info)
             logger.info("Registered DEXes:\n" + self.registry.summary())
             self.market_data = MultiDexMarketData(
                 self.info, self.registry, Config.API_URL,
                 meta_cache_ttl=Config.META_CACHE_TTL,
+                session=self.http_session,
+                candle_buffer_size=Config.CANDLE_BUFFER_SIZE,
+                candle_cache_dir=Config.CANDLE_CACHE_DIR or None,
+                meta_cache_max_ttl=Config.META_CACHE_MAX_TTL,
+                candle_cache_ttl=Config.CANDLE_CACHE_TTL,
             )
             self.order_manager = MultiDexOrderManager(
                 exchange=self.exchange,
@@ -560,26 +619,56 @@ class HyperliquidBot:
                 hip3_dexes=self.hip3_dexes,
                 default_slippage=self.market_order_slippage,
                 mids_cache_ttl=Config.MIDS_CACHE_TTL,
+                fetch_workers=Config.HIP3_FETCH_WORKERS,
             )
         else:
             self.exchange = Exchange(
                 wallet=self._load_wallet(),
                 base_url=Config.API_URL,
+                meta=self._base_meta,
+                spot_meta=self._base_spot_meta,
                 timeout=self.api_timeout,
             )
             self.info = self.exchange.info
-            self.market_data = MarketDataManager(self.info, meta_cache_ttl=Config.META_CACHE_TTL)
+            share_http_session(self.http_session, self.exchange, self.info)
+            self.market_data = MarketDataManager(
+                self.info, meta_cache_ttl=Config.META_CACHE_TTL,
+                candle_buffer_size=Config.CANDLE_BUFFER_SIZE,
+                candle_cache_dir=Config.CANDLE_CACHE_DIR or None,
+                meta_cache_max_ttl=Config.META_CACHE_MAX_TTL,
+                candle_cache_ttl=Config.CANDLE_CACHE_TTL,
+            )
             self.order_manager = OrderManager(
                 self.exchange, self.info, self.account_address,
                 default_slippage=self.market_order_slippage,
                 mids_cache_ttl=Config.MIDS_CACHE_TTL,
             )
 
+        if self._base_meta is not None:
+            self.market_data.seed_meta(self._base_meta)
+
         # Pre-approve any per-DEX builder codes (e.g. for HIP-3 deployers
         # whose rewards programs require attaching a builder to each
         # order).  Idempotent — safe to re-run on every startup.
         self.order_manager.approve_configured_builders()
 
+    def _fetch_base_metadata(self) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Fetch standard-HL ``meta`` and ``spotMeta`` once per connection init.
+
+        Every SDK ``Info`` constructor otherwise downloads both documents
+        itself (REST Info, WS Info, and again on each WS reconnect).  On
+        failure ``(None, None)`` is returned and the SDK fetches as before.
+        """
+        api = API(Config.API_URL, timeout=self.api_timeout)
+        share_http_session(self.http_session, api)
+        try:
+            meta = api_wrapper.call(api.post, "/info", {"type": "meta", "dex": ""})
+            spot_meta = api_wrapper.call(api.post, "/info", {"type": "spotMeta"})
+            return meta, spot_meta
+        except API_ERRORS as e:
+            logger.warning(f"Prefetching exchange metadata failed, SDK will fetch it: {e}")
+            return None, None
+
     @staticmethod
     def _build_risk_config() -> Dict:
         """Build a risk-manager config dict from :class:`Config` class attrs."""
@@ -625,7 +714,9 @@ class HyperliquidBot:
         if user_state:
             logger.info(f"Account: {self.account_address}")
 
-        # Validate margin requirements before starting
+        # Validate margin requirements before starting.  This is the only
+        # validation pass: the trading loop never re-validates, so there is
+        # no per-tick validation result to memoize.
         if not self._validate_trading_configuration():
             logger.error("Bot startup cancelled due to configuration validation failure")
             logger.error("Please adjust your configuration based on the recommendations above")
@@ -650,11 +741,27 @@ class HyperliquidBot:
             ws_info = WsInfo(
                 base_url=Config.API_URL,
                 skip_ws=False,
+                meta=self._base_meta,
+                spot_meta=self._base_spot_meta,
                 perp_dexs=perp_dexs,
                 timeout=self.api_timeout,
             )
-            self.ws_feed = MarketDataFeed(ws_info, self.market_data, self.coins)
+            self.ws_feed = MarketDataFeed(
+                ws_info, self.market_data, self.coins,
+                mids_sink=self._on_ws_all_mids if self._ws_all_mids else None,
+            )
             self.ws_feed.start()
+            if self._ws_min_cycle_interval > 0:
+                self.ws_feed.add_listener(self._on_ws_book_update)
+                logger.info(
+                    f"[ws] Event-driven main loop enabled "
+                    f"(min cycle interval={self._ws_min_cycle_interval:.1f}s)"
+                )
+            if self._ws_order_updates:
+                self.order_update_feed = OrderUpdateFeed(
+                    ws_info, self.account_address, self._on_ws_order_updates,
+                )
+                self.order_update_feed.start()
 
             # Phase 2: instant fill detection → opposite-side cancel
             tracker = getattr(self.strategy, 'order_tracker', None)
@@ -774,9 +881,11 @@ class HyperliquidBot:
 
         while self.running:
             try:
+                cycle_start = time.monotonic()
+
                 # Check if we should reset connections due to too many errors
-                current_time = time.time()
                 if consecutive_errors > 10:
+                    current_time = time.monotonic()
                     if current_time - self.last_connection_reset > 300:  # 5 minutes
                         self._reset_connections()
                         self.last_connection_reset = current_time
@@ -788,24 +897,25 @@ class HyperliquidBot:
 
                 self._trading_loop()
                 consecutive_errors = 0  # Reset on successful iteration
-                time.sleep(self.main_loop_interval)
+                self._error_backoff = 1.0
+                self._wait_for_next_cycle(cycle_start)
 
             except TransientError as e:
                 consecutive_errors += 1
                 wait = min(consecutive_errors * 5, 60)
                 logger.error(f"Transient error (#{consecutive_errors}), retry in {wait}s: {e}")
-                time.sleep(wait)
+                self._sleep(wait)
 
             except (DataError, ConfigurationError) as e:
                 consecutive_errors += 1
                 logger.error(f"Non-transient error (#{consecutive_errors}): {e}")
-                time.sleep(10)
+                self._sleep(self._error_backoff_delay())
 
             except ConnectionError as e:
                 consecutive_errors += 1
                 wait = min(consecutive_errors * 5, 60)
                 logger.error(f"Connection error (#{consecutive_errors}): {e}")
-                time.sleep(wait)
+                self._sleep(wait)
 
             except KeyboardInterrupt:
                 logger.info("Stopping bot...")
@@ -814,15 +924,89 @@ class HyperliquidBot:
             except Exception as e:
                 consecutive_errors += 1
                 logger.error(f"Error in main loop (#{consecutive_errors}): {e}")
-                time.sleep(10)
+                self._sleep(self._error_backoff_delay())
+
+        self._release_worker_pools()
+
+    def _release_worker_pools(self) -> None:
+        """Shut down worker pools once the main loop has exited.
+
+        Not done from the signal handler: it runs on the main thread, which
+        may be inside a cycle's ``pool.map`` and would see the cancelled
+        futures raise ``CancelledError``.
+        """
+        self.strategy.shutdown()
+        self.order_manager.shutdown()
+
+    def _sleep(self, seconds: float) -> None:
+        """Sleep for *seconds*, returning early once shutdown is requested."""
+        self._shutdown_event.wait(seconds)
+
+    def _error_backoff_delay(self) -> float:
+        """Seconds to sleep after a non-transient main-loop error.
+
+        Legacy behaviour is a fixed 10s.  With ``ERROR_BACKOFF_JITTER`` the
+        delay follows decorrelated-jitter backoff: ``uniform(1, prev * 3)``
+        capped at 60s, so a one-off error retries quickly while a burst of
+        errors spreads out.  A successful cycle resets ``prev`` to 1s.
+        """
+        if not self._error_backoff_jitter:
+            return 10.0
+        delay = min(60.0, random.uniform(1.0, self._error_backoff * 3))
+        self._error_backoff = delay
+        return delay
+
+    def _on_ws_book_update(self, coin: str, levels: Any) -> None:
+        """MarketDataFeed listener: wake the main loop on fresh L2 data."""
+        self._cycle_wakeup.set()
+
+    def _on_ws_all_mids(self, mids: Dict[str, str]) -> None:
+        """MarketDataFeed mids sink: refresh the current OrderManager's mids cache."""
+        self.order_manager.update_mids_from_ws(mids)
+
+    def _on_ws_order_updates(self, updates: List[Dict]) -> None:
+        """OrderUpdateFeed sink: apply pushed statuses to the current OrderManager."""
+        self.order_manager.apply_order_updates(updates)
+
+    def _update_order_status(self) -> None:
+        """Poll order status, or only reconcile periodically while the WS order feed runs."""
+        feed = self.order_update_feed
+        if feed is not None and feed.is_running:
+            now = time.monotonic()
+            if now < self._next_order_reconcile:
+                return
+            self._next_order_reconcile = now + self._order_reconcile_interval
+        self.order_manager.update_order_status()
+
+    def _wait_for_next_cycle(self, cycle_start: float) -> None:
+        """Block until the next trading cycle should start.
+
+        Without the event-driven mode this is a plain sleep of
+        ``main_loop_interval``.  With ``WS_MIN_CYCLE_INTERVAL > 0`` and a
+        live WS feed, an l2Book push ends the wait early — but never before
+        ``WS_MIN_CYCLE_INTERVAL`` seconds have passed since *cycle_start*,
+        so a busy book cannot drive the REST calls inside the cycle past
+        the rate limit.  ``main_loop_interval`` remains the upper bound.
+        """
+        if self._ws_min_cycle_interval <= 0 or self.ws_feed is None:
+            self._sleep(self.main_loop_interval)
+            return
+
+        floor = self._ws_min_cycle_interval - (time.monotonic() - cycle_start)
+        if floor > 0:
+            self._sleep(floor)
+        remaining = self.main_loop_interval - (time.monotonic() - cycle_start)
+        if remaining > 0:
+            self._cycle_wakeup.wait(timeout=remaining)
+        self._cycle_wakeup.clear()
 
     def _trading_loop(self) -> None:
         # Throttle risk checks to avoid burning API weight every cycle.
         # With MAIN_LOOP_INTERVAL=3s, checking every 30s saves ~36 weight/min.
-        now = time.time()
-        if now - self._last_risk_check >= self._risk_check_interval:
+        now = time.monotonic()
+        if now >= self._next_risk_check:
             self._last_risk_result = self.risk_manager.check_risk_limits()
-            self._last_risk_check = now
+            self._next_risk_check = now + self._risk_check_interval
         risk_checks = self._last_risk_result
         action = risk_checks.get('action', 'none')
 
@@ -874,14 +1058,14 @@ class HyperliquidBot:
 
             if action == 'block_new_orders':
                 # Block new orders but continue managing existing positions
-                self.order_manager.update_order_status()
+                self._update_order_status()
                 self._check_per_trade_stops()
                 return
 
             # pause: orders already cancelled above
             return
 
-        self.order_manager.update_order_status()
+        self._update_order_status()
 
         # Per-trade stop loss check (every cycle, if enabled)
         self._check_per_trade_stops()
@@ -904,12 +1088,15 @@ class HyperliquidBot:
                 logger.error(f"Strategy execution failed: {e}")
                 self.circuit_breaker.record_failure("strategy")
 
-        if int(time.time()) % 60 == 0:
-            risk_summary = self.risk_manager.get_risk_summary()
-            cb_status = self.circuit_breaker.get_status()
-            logger.info(f"Risk summary: {risk_summary}")
-            if cb_status:
-                logger.info(f"Circuit breaker status: {cb_status}")
+        now_mono = time.monotonic()
+        if now_mono >= self._next_risk_summary:
+            self._next_risk_summary = now_mono + self._risk_summary_interval
+            if logger.isEnabledFor(logging.INFO):
+                risk_summary = self.risk_manager.get_risk_summary()
+                cb_status = self.circuit_breaker.get_status()
+                logger.info(f"Risk summary: {risk_summary}")
+                if cb_status:
+                    logger.info(f"Circuit breaker status: {cb_status}")
 
     # ------------------------------------------------------------------ #
     #  Position management helpers
@@ -954,6 +1141,9 @@ class HyperliquidBot:
     def _signal_handler(self, signum: int, frame: Optional[types.FrameType]) -> None:
         logger.info("Received shutdown signal")
         self.running = False
+        # Wake the main loop out of its inter-cycle / backoff wait.
+        self._shutdown_event.set()
+        self._cycle_wakeup.set()
 
         if self.imbalance_guard:
             self.imbalance_guard.stop()
@@ -973,15 +1163,16 @@ class HyperliquidBot:
         if self.fill_feed:
             self.fill_feed.stop()
             self.fill_feed = None
+        if self.order_update_feed:
+            self.order_update_feed.stop()
+            self.order_update_feed = None
         if self.ws_feed:
             self.ws_feed.stop()
             self.ws_feed = None
 
         try:
             # Set a timeout for order cancellation to avoid hanging
-            import threading
-
-            def cancel_orders():
+            def cancel_orders() -> None:
                 self.order_manager.cancel_all_orders()
                 logger.info("All orders cancelled")
 
@@ -994,14 +1185,6 @@ class HyperliquidBot:
         except Exception as e:
             logger.error(f"Error during shutdown (order cancellation): {e}", exc_info=True)
 
-        # Force exit if still running after a short delay
-        import sys
-        import time
-        time.sleep(1)
-        if self.running:
-            logger.info("Forcing immediate shutdown")
-            sys.exit(0)
-
     def _validate_trading_configuration(self) -> bool:
         """Validate trading configuration and margin requirements"""
         try:
@@ -1017,9 +1200,16 @@ class HyperliquidBot:
                         logger.error(f"  • {rec}")
                 return False
 
-            # Get current prices for position size calculation
+            # Get current prices for position size calculation.  One
+            # all_mids round-trip covers the standard perps; coins it does
+            # not list (e.g. HIP-3) fall back to a per-coin L2 fetch.
+            all_mids = self.market_data.get_all_mids()
             current_prices = {}
             for coin in self.trading_coins:
+                mid = all_mids.get(coin)
+                if mid is not None:
+                    current_prices[coin] = float(mid)
+                    continue
                 market_data = self.market_data.get_market_data(coin)
                 if market_data:
                     current_prices[coin] = market_data.mid_price
@@ -1086,21 +1276,23 @@ class HyperliquidBot:
             logger.info("Resetting connections due to persistent errors...")
             time.sleep(5)  # Give some time before reconnecting
 
+            # _init_connections builds a new order manager; release the old
+            # one's worker threads first.
+            self.order_manager.shutdown()
             self._init_connections()
 
-            # Preserve cooldown state across connection resets
-            prev_emergency_stop_time = self.risk_manager._emergency_stop_time
-            prev_daily_starting_balance = self.risk_manager.daily_starting_balance
-            self.risk_manager = RiskManager(
-                self.info, self.account_address, self.risk_config,
-                hip3_dexes=self.hip3_dexes,
+            # RiskManager holds no connection state of its own: rebind it to
+            # the new objects so cooldown and balance baselines carry over.
+            self.risk_manager.rebind(
+                self.info,
                 market_data=self.market_data if self.hip3_dexes else None,
+                user_state_source=self.order_manager.get_user_state,
             )
-            self.risk_manager._emergency_stop_time = prev_emergency_stop_time
-            self.risk_manager.daily_starting_balance = prev_daily_starting_balance
 
             # Re-initialize strategy with new connections
             strategy_config = self.strategy.config if hasattr(self.strategy, 'config') else {}
+            # __init__ builds a fresh signal pool; release the old one first.
+            self.strategy.shutdown()
             self.strategy.__init__(self.market_data, self.order_manager, strategy_config)
 
             logger.info("Connections reset successfully")
@@ -1114,7 +1306,7 @@ class HyperliquidBot:
                 logger.critical("Max connection retry attempts reached. Exiting...")
                 self.running = False
 
-    def stop(self):
+    def stop(self) -> None:
         self.running = False
         logger.info("Bot stopped")
 
@@ -1128,7 +1320,7 @@ if __name__ == "__main__":
         '--strategy',
         type=str,
         default='simple_ma',
-        choices=['simple_ma', 'rsi', 'bollinger_bands', 'macd', 'grid_trading', 'breakout', 'market_making'],
+        choices=list(STRATEGY_CLASS_NAMES),
         help='Trading strategy to use'
     )
     parser.add_argument(
@@ -1172,6 +1364,12 @@ if __name__ == "__main__":
     parser.add_argument('--main-loop-interval', type=float, help='Main loop sleep interval in seconds (default: 10)')
     parser.add_argument('--account-cap-pct', type=float,
                         help='Max position as %% of account for sizing (grid_trading/market_making)')
+    parser.add_argument('--signal-workers', type=int,
+                        help='Threads used to evaluate coins concurrently each cycle '
+                             '(signal strategies, default: 1 = sequential)')
+    parser.add_argument('--bulk-signal-orders', action='store_true', default=None,
+                        help='Send all signal orders of a cycle in one bulk_orders request '
+                             '(signal strategies, including grid_trading)')
     parser.add_argument('--config', dest='config_paths', action='append', default=None,
                         help='Path to a JSON config file. Repeat for layered configs '
                              '(later files override earlier). Also reads $BOT_CONFIG '
@@ -1470,24 +1668,10 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    # ``_COMMON_PARAMS`` and ``_STRATEGY_PARAMS`` are defined at module
-    # level (top of this file) so the JSON config layer's typo detector
-    # (``validation.strategy_validator.known_market_making_keys``) can
-    # introspect them without circular-import gymnastics. The local
-    # references below preserve the existing call-site shape of
-    # ``_collect_params``.
-
-    def _collect_params(params, source, dest):
-        """Copy non-None CLI args into *dest* dict."""
-        for entry in params:
-            if isinstance(entry, tuple):
-                arg_name, config_key = entry
-            else:
-                arg_name, config_key = entry, entry
-            val = getattr(source, arg_name, None)
-            if val is not None:
-                dest[config_key] = val
-
+    # ``_COMMON_PARAMS``, ``_STRATEGY_PARAMS`` and ``_collect_params`` are
+    # defined at module level (top of this file) so the JSON config layer's
+    # typo detector (``validation.strategy_validator.known_market_making_keys``)
+    # can introspect them without circular-import gymnastics.
     strategy_config = {}
     _collect_params(_COMMON_PARAMS, args, strategy_config)
     _collect_params(_STRATEGY_PARAMS.get(args.strategy, []), args, strategy_config)
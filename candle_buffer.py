@@ -0,0 +1,168 @@
+"""Fixed-capacity struct-of-arrays candle store.
+
+Each :class:`CandleRingBuffer` keeps one contiguous ``float64`` array per
+OHLCV field plus an ``int64`` timestamp array, written as a ring.  After
+an initial full load, :class:`MarketDataManager` only needs to fetch the
+candles newer than :attr:`last_ts` and append them here, instead of
+re-downloading the whole lookback window on every call.
+
+Buffers can be persisted with :meth:`CandleRingBuffer.save` and restored
+with :meth:`CandleRingBuffer.load` (``.npz``), so a restart only fetches
+the candles formed while the bot was down.
+"""
+
+import os
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+_API_KEYS = ('o', 'h', 'l', 'c', 'v')
+
+
+def frame_from_api(candles: Iterable[Dict]) -> pd.DataFrame:
+    """Build the ``get_candles`` DataFrame from SDK ``candles_snapshot`` dicts.
+
+    Parses all OHLCV strings into one ``float64`` block in a single NumPy
+    conversion instead of building an object-dtype frame and casting it
+    column by column.  Same shape as :meth:`CandleRingBuffer.to_frame`.
+    """
+    candles = list(candles)
+    if not candles:
+        return pd.DataFrame()
+    ts = np.fromiter((c['t'] for c in candles), dtype=np.int64, count=len(candles))
+    values = np.array([[c[k] for k in _API_KEYS] for c in candles], dtype=np.float64)
+    return _frame(values, ts)
+
+
+def _frame(values: np.ndarray, ts: np.ndarray) -> pd.DataFrame:
+    """``get_candles`` frame from an ``(n, len(FIELDS))`` block and ms timestamps.
+
+    The OHLCV columns become a single float64 block, and the index is a
+    ``datetime64[ms]`` view of *ts* -- the dtype ``pd.to_datetime(ts,
+    unit='ms')`` gives, without its per-call parsing overhead.
+    """
+    index = pd.DatetimeIndex(ts.astype('datetime64[ms]'), name='timestamp')
+    df = pd.DataFrame(values, columns=list(FIELDS), index=index)
+    df['t'] = ts
+    return df
+
+
+class CandleRingBuffer:
+    """Ring buffer of candles in struct-of-arrays layout."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self._ts = np.zeros(capacity, dtype=np.int64)
+        # One row per field in FIELDS order; each row is contiguous.
+        self._data = np.zeros((len(FIELDS), capacity), dtype=np.float64)
+        self._head = 0  # next write slot
+        self._size = 0
+        # Earliest timestamp (ms) for which the buffer is known complete.
+        self.covered_from: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        if self._size == 0:
+            return None
+        return int(self._ts[(self._head - 1) % self.capacity])
+
+    @property
+    def first_ts(self) -> Optional[int]:
+        if self._size == 0:
+            return None
+        return int(self._ts[(self._head - self._size) % self.capacity])
+
+    def append(self, ts: int, values: Iterable[float]) -> None:
+        """Append one candle; a repeat of the last timestamp overwrites it.
+
+        Candles older than :attr:`last_ts` are ignored.
+        """
+        last = self.last_ts
+        if last is not None and ts < last:
+            return
+        if last is not None and ts == last:
+            slot = (self._head - 1) % self.capacity
+        else:
+            slot = self._head
+            self._head = (self._head + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+            elif self.covered_from is not None:
+                # Oldest candle evicted: coverage now starts at the new oldest.
+                self.covered_from = self.first_ts
+        self._ts[slot] = ts
+        self._data[:, slot] = tuple(values)
+
+    def extend_from_api(self, candles: Iterable[Dict]) -> None:
+        """Append candles in the SDK ``candles_snapshot`` dict format."""
+        for c in candles:
+            self.append(int(c['t']), (float(c[k]) for k in _API_KEYS))
+
+    def _order(self, start: int) -> np.ndarray:
+        """Chronological slot indices of candles with ``ts >= start``."""
+        idx = (np.arange(self._size) + (self._head - self._size)) % self.capacity
+        return idx[self._ts[idx] >= start]
+
+    def field(self, name: str, start: int = 0) -> np.ndarray:
+        """Chronological values of one field for candles with ``ts >= start``."""
+        return self._data[FIELDS.index(name), self._order(start)]
+
+    def save(self, path: str) -> None:
+        """Write the buffered candles to *path* atomically (``.npz``)."""
+        idx = self._order(0)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                ts=self._ts[idx],
+                data=self._data[:, idx],
+                covered_from=np.int64(-1 if self.covered_from is None else self.covered_from),
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, capacity: int) -> Optional["CandleRingBuffer"]:
+        """Restore a buffer written by :meth:`save`; ``None`` if unreadable.
+
+        If the file holds more candles than *capacity*, only the newest
+        are kept and coverage starts at the oldest one kept.
+        """
+        try:
+            with np.load(path) as npz:
+                ts = npz["ts"].astype(np.int64)
+                data = npz["data"].astype(np.float64)
+                covered_from = int(npz["covered_from"])
+        except (OSError, ValueError, KeyError):
+            return None
+        if data.shape != (len(FIELDS), len(ts)):
+            return None
+
+        buf = cls(capacity)
+        n = min(len(ts), capacity)
+        if n == 0:
+            return buf
+        buf._ts[:n] = ts[-n:]
+        buf._data[:, :n] = data[:, -n:]
+        buf._size = n
+        buf._head = n % capacity
+        if covered_from < 0:
+            buf.covered_from = None
+        elif n < len(ts):
+            buf.covered_from = int(ts[-n])
+        else:
+            buf.covered_from = covered_from
+        return buf
+
+    def to_frame(self, start: int = 0) -> pd.DataFrame:
+        """Candles with ``ts >= start`` as the DataFrame shape ``get_candles`` returns."""
+        idx = self._order(start)
+        # The transpose of the (fields, n) selection is already laid out as
+        # pandas stores a float block, so no further copy is needed.
+        return _frame(self._data[:, idx].T, self._ts[idx])
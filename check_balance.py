@@ -5,6 +5,7 @@ Simple script to check Hyperliquid account balance and positions
 
 from config import Config
 from coin_utils import make_hip3_coin
+from http_session import build_http_session
 from rate_limiter import API_ERRORS
 from datetime import datetime
 import requests
@@ -20,9 +21,9 @@ DISPLAY_COINS = {"USDC", "USDH", "USDT0"}
 KNOWN_HIP3_DEXES = ["xyz", "flx", "cash", "km", "vntl", "hyna"]
 
 
-def _api_post(req_type: str, address: str, **extra) -> dict:
+def _api_post(session: requests.Session, req_type: str, address: str, **extra) -> dict:
     payload = {"type": req_type, "user": address, **extra}
-    resp = requests.post(
+    resp = session.post(
         f"{Config.API_URL}/info",
         json=payload,
         headers={"Content-Type": "application/json"},
@@ -50,13 +51,26 @@ def _collect_positions(user_state: dict, prefix: str = "") -> list:
     return result
 
 
+def _format_position(p: dict) -> str:
+    side = "LONG" if p['size'] > 0 else "SHORT"
+    pnl_color = "🟢" if p['unrealized_pnl'] >= 0 else "🔴"
+    return (
+        f"{p['coin']:12} | {side:5} | Size: {abs(p['size']):8.4f} "
+        f"| Entry: ${p['entry_px']:8.2f} | PnL: {pnl_color}${p['unrealized_pnl']:8.2f}"
+    )
+
+
 def main():
     try:
         address = Config.ACCOUNT_ADDRESS
         Config.validate()
 
-        spot_state = _api_post("spotClearinghouseState", address)
-        user_state = _api_post("clearinghouseState", address)
+        # One keep-alive connection for all the sequential queries below
+        # instead of a new TCP+TLS handshake per request.
+        session = build_http_session(pool_size=1)
+
+        spot_state = _api_post(session, "spotClearinghouseState", address)
+        user_state = _api_post(session, "clearinghouseState", address)
 
         # ── Spot Balance ──
         spot_balances = [
@@ -74,7 +88,7 @@ def main():
 
         for dex in KNOWN_HIP3_DEXES:
             try:
-                dex_state = _api_post("clearinghouseState", address, dex=dex)
+                dex_state = _api_post(session, "clearinghouseState", address, dex=dex)
                 dex_positions = _collect_positions(dex_state, prefix=dex)
                 all_positions.extend(dex_positions)
 
@@ -103,17 +117,8 @@ def main():
         print("=" * 50)
 
         if all_positions:
-            total_pnl = 0
-
-            for p in all_positions:
-                total_pnl += p['unrealized_pnl']
-                side = "LONG" if p['size'] > 0 else "SHORT"
-                pnl_color = "🟢" if p['unrealized_pnl'] >= 0 else "🔴"
-
-                print(
-                    f"{p['coin']:12} | {side:5} | Size: {abs(p['size']):8.4f} "
-                    f"| Entry: ${p['entry_px']:8.2f} | PnL: {pnl_color}${p['unrealized_pnl']:8.2f}"
-                )
+            total_pnl = sum(p['unrealized_pnl'] for p in all_positions)
+            print("\n".join(_format_position(p) for p in all_positions))
 
             print("-" * 50)
             total_pnl_color = "🟢" if total_pnl >= 0 else "🔴"
@@ -12,6 +12,15 @@ def _parse_list(env_val: str) -> list:
 
 
 class Config:
+    """Process-wide settings, read from the environment once at import.
+
+    Attribute reads are plain class-attribute lookups; nothing is re-read
+    from ``os.environ`` afterwards (``RISK_LEVEL`` and ``MIN_ORDER_VALUE_*``
+    are the deliberate exceptions, see below).  The class is intentionally
+    mutable: the JSON config layer and the CLI overrides in ``bot.py`` write
+    the resolved values back onto it before the bot is constructed.
+    """
+
     ACCOUNT_ADDRESS = os.getenv("HYPERLIQUID_ACCOUNT_ADDRESS")
     PRIVATE_KEY = os.getenv("HYPERLIQUID_PRIVATE_KEY")
     USE_TESTNET = os.getenv("USE_TESTNET", "true").lower() == "true"
@@ -44,6 +53,10 @@ class Config:
         if _val:
             DEX_COINS[_dex] = _parse_list(_val)
 
+    # Threads used to fetch per-DEX positions / open orders concurrently
+    # (one round trip of latency instead of one per DEX).  1 = sequential.
+    HIP3_FETCH_WORKERS: int = max(int(os.getenv("HIP3_FETCH_WORKERS", "1")), 1)
+
     # ------------------------------------------------------------------ #
     # Builder fee configuration (per-DEX)
     # ------------------------------------------------------------------ #
@@ -133,12 +146,48 @@ class Config:
     # How long (seconds) to cache asset metadata (sz_decimals etc.).
     META_CACHE_TTL: float = float(os.getenv("META_CACHE_TTL", "3600"))
 
+    # Upper bound for an adaptive meta TTL: every refetch that returns an
+    # unchanged meta doubles the TTL up to this cap, and a changed meta
+    # resets it to META_CACHE_TTL.  0 (or <= META_CACHE_TTL) = fixed TTL.
+    META_CACHE_MAX_TTL: float = float(os.getenv("META_CACHE_MAX_TTL", "0"))
+
     # How long (seconds) to cache mid prices in OrderManager.
     MIDS_CACHE_TTL: float = float(os.getenv("MIDS_CACHE_TTL", "5.0"))
 
+    # Per-(coin, interval) candle ring buffer capacity.  When > 0, candles
+    # are fetched in full once and then incrementally (only new bars), as
+    # long as the requested lookback is smaller than this.  0 = disabled.
+    CANDLE_BUFFER_SIZE: int = max(int(os.getenv("CANDLE_BUFFER_SIZE", "0")), 0)
+
+    # Directory for persisting the candle ring buffers between runs (one
+    # .npz per coin/interval).  Requires CANDLE_BUFFER_SIZE > 0; after a
+    # restart only the candles formed while the bot was down are fetched.
+    # Empty = disabled.
+    CANDLE_CACHE_DIR: str = os.getenv("CANDLE_CACHE_DIR", "")
+
+    # Seconds to reuse a fetched candle frame for an identical
+    # (coin, interval, lookback) request, so strategies sharing a window
+    # within one cycle share the fetch.  Keep it below the loop interval so
+    # every cycle still sees the latest in-progress bar.  0 = disabled.
+    CANDLE_CACHE_TTL: float = max(float(os.getenv("CANDLE_CACHE_TTL", "0")), 0.0)
+
     # Timeout (seconds) for Hyperliquid API calls.
     API_TIMEOUT: float = float(os.getenv("API_TIMEOUT", "10"))
 
+    # Size of the shared keep-alive HTTP connection pool used by Info,
+    # Exchange and the HIP-3 raw REST helpers.
+    HTTP_POOL_SIZE: int = max(int(os.getenv("HTTP_POOL_SIZE", "16")), 1)
+
+    # SO_BUSY_POLL (microseconds) on pooled REST sockets: the kernel spins on
+    # the NIC queue instead of sleeping for the response.  Linux only; values
+    # above net.core.busy_read need CAP_NET_ADMIN.  0 = disabled.
+    HTTP_BUSY_POLL_US: int = max(int(os.getenv("HTTP_BUSY_POLL_US", "0")), 0)
+
+    # Sign orders with precomputed EIP-712 domain/type hashes and a parsed
+    # private key instead of rebuilding them per order (see order_signing.py).
+    # Signatures are identical to the SDK's; roughly halves signing CPU.
+    FAST_ORDER_SIGNING: bool = os.getenv("FAST_ORDER_SIGNING", "false").lower() == "true"
+
     # How often (seconds) to run risk checks in the trading loop.
     # With fast MAIN_LOOP_INTERVAL (e.g. 3s), risk checks don't need to
     # run every cycle. Default 10s matches the previous 10s loop interval.
@@ -146,6 +195,36 @@ class Config:
         float(os.getenv("RISK_CHECK_INTERVAL", "10")), 1.0
     )
 
+    # Event-driven main loop (requires --enable-ws).  When > 0, each l2Book
+    # push from the WebSocket feed wakes the main loop early instead of
+    # waiting the full MAIN_LOOP_INTERVAL, but never sooner than this many
+    # seconds after the previous cycle started (protects REST weight budget).
+    # 0 (default) keeps the fixed-interval polling loop.
+    WS_MIN_CYCLE_INTERVAL: float = max(
+        float(os.getenv("WS_MIN_CYCLE_INTERVAL", "0")), 0.0
+    )
+
+    # With --enable-ws, also subscribe to allMids and push every snapshot
+    # into the OrderManager mids cache so mid-price lookups stop polling
+    # all_mids over REST.  MIDS_CACHE_TTL still bounds staleness: if the
+    # feed stalls, lookups fall back to REST once the snapshot expires.
+    WS_ALL_MIDS: bool = os.getenv("WS_ALL_MIDS", "false").lower() == "true"
+
+    # With --enable-ws, also subscribe to orderUpdates and drop filled /
+    # cancelled orders from active_orders as the pushes arrive.  The REST
+    # open_orders + user_fills poll then only runs as a reconciliation every
+    # ORDER_RECONCILE_INTERVAL seconds (while the feed is running) instead
+    # of every cycle.  false (default) keeps polling every cycle.
+    WS_ORDER_UPDATES: bool = os.getenv("WS_ORDER_UPDATES", "false").lower() == "true"
+    ORDER_RECONCILE_INTERVAL: float = max(
+        float(os.getenv("ORDER_RECONCILE_INTERVAL", "30")), 0.0
+    )
+
+    # Main-loop error backoff.  false (default) keeps the fixed 10s sleep
+    # after a non-transient error; true uses decorrelated-jitter exponential
+    # backoff (1s..60s) that resets after the next successful cycle.
+    ERROR_BACKOFF_JITTER: bool = os.getenv("ERROR_BACKOFF_JITTER", "false").lower() == "true"
+
     # ------------------------------------------------------------------ #
     # Margin validation constants
     # ------------------------------------------------------------------ #
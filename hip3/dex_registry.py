@@ -25,13 +25,15 @@ class DEXRegistry:
         asset_id = registry.get_asset_id("xyz", "XYZ100")  # → e.g. 110000
     """
 
-    def __init__(self, api_url: str):
+    def __init__(self, api_url: str, session: Optional[requests.Session] = None):
         self.api_url = api_url.rstrip("/")
+        # Shared keep-alive session if provided, else one-off requests.post
+        self._http = session if session is not None else requests
         # dex_name → {perp_dex_index, assets: {coin → {asset_id, sz_decimals}}, meta}
         self._dexes: Dict[str, Dict] = {}
 
     def _post(self, payload: dict) -> Any:
-        resp = requests.post(
+        resp = self._http.post(
             f"{self.api_url}/info",
             json=payload,
             headers={"Content-Type": "application/json"},
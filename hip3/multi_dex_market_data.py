@@ -34,10 +34,16 @@ class MultiDexMarketData(MarketDataManager):
     """
 
     def __init__(self, info, registry: DEXRegistry, api_url: str, meta_cache_ttl: float = 3600,
-                 user_state_cache_ttl: float = 2.0):
-        super().__init__(info, meta_cache_ttl=meta_cache_ttl)
+                 user_state_cache_ttl: float = 2.0, session: Optional[requests.Session] = None,
+                 candle_buffer_size: int = 0, candle_cache_dir: Optional[str] = None,
+                 meta_cache_max_ttl: float = 0, candle_cache_ttl: float = 0):
+        super().__init__(info, meta_cache_ttl=meta_cache_ttl, candle_buffer_size=candle_buffer_size,
+                         candle_cache_dir=candle_cache_dir, meta_cache_max_ttl=meta_cache_max_ttl,
+                         candle_cache_ttl=candle_cache_ttl)
         self.registry = registry
         self.api_url = api_url.rstrip("/")
+        # Shared keep-alive session if provided, else one-off requests.post
+        self._http = session if session is not None else requests
         # Per-DEX user_state cache keyed by (address, dex)
         self._dex_user_state_cache: TTLCacheMap[Tuple[str, str], Dict] = TTLCacheMap(user_state_cache_ttl)
         self._user_state_cache_ttl = user_state_cache_ttl
@@ -83,10 +89,14 @@ class MultiDexMarketData(MarketDataManager):
         cached = self._dex_user_state_cache.get(cache_key)
         if cached is not None:
             return cached
-        try:
+
+        def fetch() -> Dict:
             result = self.info.user_state(address, dex=dex or "")
             self._dex_user_state_cache.set(cache_key, result)
             return result
+
+        try:
+            return self._flights.do(f"user_state:{address}:{dex or ''}", fetch)
         except API_ERRORS as e:
             logger.error(f"Error fetching user state (dex={dex}): {e}")
             self._dex_user_state_cache.invalidate(cache_key)
@@ -102,17 +112,21 @@ class MultiDexMarketData(MarketDataManager):
         cached = self._dex_open_orders_cache.get(cache_key)
         if cached is not None:
             return cached
-        try:
+
+        def fetch() -> List[Dict]:
             result = self.info.open_orders(address, dex=dex or "")
             self._dex_open_orders_cache.set(cache_key, result)
             return result
+
+        try:
+            return self._flights.do(f"open_orders:{address}:{dex or ''}", fetch)
         except API_ERRORS as e:
             logger.error(f"Error fetching open orders (dex={dex}): {e}")
             return []
 
     def _fetch_user_fills_dex(self, address: str, dex: str) -> List[Dict]:
         """Raw HTTP call for user fills (SDK user_fills has no dex param)."""
-        resp = requests.post(
+        resp = self._http.post(
             f"{self.api_url}/info",
             json={"type": "userFills", "user": address, "dex": dex},
             headers={"Content-Type": "application/json"},
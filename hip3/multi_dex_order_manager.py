@@ -10,6 +10,7 @@ As of hyperliquid-python-sdk 0.22.0:
 Coins are represented as "dex:coin" strings for HIP-3 (e.g. "xyz:GOLD", "flx:NVDA").
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional
 
 from hip3.dex_registry import DEXRegistry
@@ -33,6 +34,8 @@ class MultiDexOrderManager(OrderManager):
         registry:      Populated DEXRegistry (for coin listing and parsing).
         market_data:   MultiDexMarketData instance.
         hip3_dexes:    Names of HIP-3 DEXes this manager should cover.
+        fetch_workers: Threads used to query the HIP-3 DEXes concurrently
+                       (1 = one DEX after another).
     """
 
     def __init__(
@@ -45,16 +48,25 @@ class MultiDexOrderManager(OrderManager):
         hip3_dexes: Optional[List[str]] = None,
         default_slippage: float = 0.01,
         mids_cache_ttl: float = 5.0,
+        fetch_workers: int = 1,
     ):
         super().__init__(exchange, info, account_address,
                          default_slippage=default_slippage, mids_cache_ttl=mids_cache_ttl)
         self.registry = registry
         self.market_data_ext = market_data
         self.hip3_dexes: List[str] = hip3_dexes or []
+        self._fetch_workers = max(int(fetch_workers), 1)
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
 
         n = len(self.info.coin_to_asset)
         logger.info(f"MultiDexOrderManager ready — {n} assets in coin_to_asset (incl. HIP-3)")
 
+    def shutdown(self) -> None:
+        """Release the HIP-3 fetch pool, if one was started."""
+        if self._fetch_pool is not None:
+            self._fetch_pool.shutdown(wait=False)
+            self._fetch_pool = None
+
     # ------------------------------------------------------------------ #
     # Shared HIP-3 helpers
     # ------------------------------------------------------------------ #
@@ -102,15 +114,30 @@ class MultiDexOrderManager(OrderManager):
         list[dict]
             Collected items with ``"coin"`` prefixed as ``"dex:coin"``.
         """
-        results: List[Dict] = []
-        for dex in dexes:
+        def fetch(dex: str) -> list:
             try:
-                for item in fetch_fn(dex):
-                    prefixed = dict(item)
-                    prefixed["coin"] = make_hip3_coin(dex, prefixed.get("coin", ""))
-                    results.append(prefixed)
+                return list(fetch_fn(dex))
             except API_ERRORS as e:
                 logger.error(f"Error fetching {error_context} for DEX '{dex}': {e}")
+                return []
+
+        if self._fetch_workers > 1 and len(dexes) > 1:
+            # One round trip of wall-clock instead of one per DEX; results
+            # keep the DEX order.  The rate limiter is thread-safe.
+            if self._fetch_pool is None:
+                self._fetch_pool = ThreadPoolExecutor(
+                    max_workers=self._fetch_workers, thread_name_prefix="hip3-fetch",
+                )
+            batches = list(self._fetch_pool.map(fetch, dexes))
+        else:
+            batches = [fetch(dex) for dex in dexes]
+
+        results: List[Dict] = []
+        for dex, items in zip(dexes, batches):
+            for item in items:
+                prefixed = dict(item)
+                prefixed["coin"] = make_hip3_coin(dex, prefixed.get("coin", ""))
+                results.append(prefixed)
         return results
 
     # ------------------------------------------------------------------ #
@@ -216,9 +243,11 @@ class MultiDexOrderManager(OrderManager):
             open_orders = self.get_open_orders()
             open_order_ids = {int(o["oid"]) for o in open_orders}
 
-            # Find orders that are no longer on the book
+            # Find orders that are no longer on the book.  Iterate a
+            # snapshot: the order-update feed prunes active_orders from
+            # the WebSocket thread.
             disappeared = [
-                (oid, order) for oid, order in self.active_orders.items()
+                (oid, order) for oid, order in list(self.active_orders.items())
                 if oid not in open_order_ids
             ]
             if not disappeared:
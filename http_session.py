@@ -0,0 +1,108 @@
+"""Shared keep-alive HTTP session for all REST traffic.
+
+The SDK gives every ``API`` object (``Exchange``, ``Info``) its own
+``requests.Session`` with the default 10-connection pool, and the HIP-3
+helpers post through the module-level ``requests.post`` which opens a new
+TCP+TLS connection per call.  :func:`build_http_session` creates a single
+pooled session that :func:`share_http_session` installs on the SDK objects
+so every REST call reuses the same warm connections.
+
+Pooled HTTP/1.1 keep-alive already removes the per-call TCP+TLS handshake.
+HTTP/2 multiplexing would need ``httpx``/``h2``, which are not dependencies,
+and its exceptions do not derive from ``OSError``, so they would slip past
+``API_ERRORS``; size the pool with ``HTTP_POOL_SIZE`` instead.
+
+Usage::
+
+    session = build_http_session(pool_size=Config.HTTP_POOL_SIZE)
+    share_http_session(session, exchange, exchange.info)
+"""
+
+import logging
+import socket
+import sys
+from typing import Any, List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+logger = logging.getLogger(__name__)
+
+# urllib3 already sets TCP_NODELAY by default; add SO_KEEPALIVE so idle
+# pooled connections are not silently dropped by NAT/load balancers.
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Linux-only; the socket module does not export the constant.
+_SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46)
+
+
+def _busy_poll_option(busy_poll_us: int) -> List[Tuple[int, int, int]]:
+    """Return the ``SO_BUSY_POLL`` socket option, or ``[]`` if unusable.
+
+    Raising the value above ``net.core.busy_read`` needs CAP_NET_ADMIN; a
+    socket option that fails would break every connection, so probe it on a
+    throwaway socket first and fall back to the defaults.
+    """
+    if busy_poll_us <= 0:
+        return []
+    if not sys.platform.startswith("linux"):
+        logger.warning("HTTP_BUSY_POLL_US is only supported on Linux; ignoring")
+        return []
+    option = (socket.SOL_SOCKET, _SO_BUSY_POLL, busy_poll_us)
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.setsockopt(*option)
+    except OSError as e:
+        logger.warning(f"SO_BUSY_POLL={busy_poll_us} not permitted ({e}); ignoring")
+        return []
+    return [option]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that applies :data:`_SOCKET_OPTIONS` to pooled sockets."""
+
+    def __init__(self, *args: Any, extra_socket_options: Any = (), **kwargs: Any) -> None:
+        self._socket_options = _SOCKET_OPTIONS + list(extra_socket_options)
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_http_session(pool_size: int = 16, busy_poll_us: int = 0) -> requests.Session:
+    """Return a ``requests.Session`` with a connection pool of *pool_size*.
+
+    *busy_poll_us* > 0 sets ``SO_BUSY_POLL`` on pooled sockets (Linux).
+    """
+    session = requests.Session()
+    adapter = _KeepAliveAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                extra_socket_options=_busy_poll_option(busy_poll_us))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def share_http_session(session: requests.Session, *clients: Any) -> None:
+    """Replace the private ``session`` of each SDK client with *session*.
+
+    The replaced sessions are closed so their sockets are released.
+    """
+    for client in clients:
+        old = getattr(client, "session", None)
+        if old is session:
+            continue
+        client.session = session
+        if old is not None:
+            try:
+                old.close()
+            except Exception:
+                pass
+    logger.debug(f"Shared HTTP session installed on {len(clients)} client(s)")
@@ -6,6 +6,10 @@ Supports two output formats controlled by the ``LOG_FORMAT`` env var:
 - ``json``: Structured JSON, one object per line — suitable for log
   aggregation tools (Datadog, CloudWatch, Loki, etc.).
 
+With ``LOG_QUEUE=true`` records are handed to a background
+``QueueListener`` thread, so formatting and the write to stderr no longer
+run on the thread that logged them (the trading loop, WS callbacks).
+
 Usage
 -----
 Call ``setup_logging()`` once at startup (before any ``getLogger`` calls
@@ -13,11 +17,16 @@ produce output).  All existing loggers that use the root handler will
 automatically pick up the configured formatter.
 """
 
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import traceback
 from datetime import datetime, timezone
+from typing import Optional
 
 
 class JSONFormatter(logging.Formatter):
@@ -49,16 +58,44 @@ class JSONFormatter(logging.Formatter):
 
 TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps ``exc_info`` and extras on the record.
+
+    The stock ``prepare()`` pre-formats the record and drops ``exc_info`` so
+    it can be pickled; the queue here never leaves the process, so only the
+    message args are resolved (they may be mutated once the call returns)
+    and the real formatter -- e.g. :class:`JSONFormatter`'s structured
+    ``exception`` field -- runs on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()  # drains pending records
+        _queue_listener = None
+
 
 def setup_logging() -> None:
     """Configure the root logger based on ``LOG_FORMAT`` and ``LOG_LEVEL`` env vars."""
     log_format = os.getenv("LOG_FORMAT", "text").lower().strip()
     log_level = os.getenv("LOG_LEVEL", "INFO").upper().strip()
+    use_queue = os.getenv("LOG_QUEUE", "false").lower().strip() == "true"
 
     root = logging.getLogger()
     root.setLevel(getattr(logging, log_level, logging.INFO))
 
     # Remove any pre-existing handlers (e.g. from basicConfig)
+    _stop_queue_listener()
     for handler in root.handlers[:]:
         root.removeHandler(handler)
 
@@ -69,4 +106,14 @@ def setup_logging() -> None:
     else:
         handler.setFormatter(logging.Formatter(TEXT_FORMAT))
 
-    root.addHandler(handler)
+    if use_queue:
+        global _queue_listener
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, handler)
+        _queue_listener.start()
+        root.addHandler(_InProcessQueueHandler(log_queue))
+    else:
+        root.addHandler(handler)
+
+
+atexit.register(_stop_queue_listener)
@@ -1,18 +1,37 @@
 import logging
+import os
 import time
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from hyperliquid.info import Info
 from coin_utils import is_hip3
 from rate_limiter import api_wrapper, API_ERRORS
-from ttl_cache import TTLCacheEntry, TTLCacheMap
+from ttl_cache import SingleFlight, TTLCacheEntry, TTLCacheMap
+from candle_buffer import CandleRingBuffer, frame_from_api
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Candle interval lengths used to turn a lookback into a start time.
+_INTERVAL_MS: Dict[str, int] = {
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 3_600_000,
+    '2h': 2 * 3_600_000,
+    '4h': 4 * 3_600_000,
+    '12h': 12 * 3_600_000,
+    '1d': 86_400_000,
+    '1w': 7 * 86_400_000,
+    '1M': 30 * 86_400_000,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class MarketData:
     symbol: str
     mid_price: float
@@ -29,13 +48,41 @@ class MarketData:
 class MarketDataManager:
     def __init__(self, info: Info, meta_cache_ttl: float = 3600,
                  market_data_cache_ttl: float = 2.0,
-                 imbalance_depth: int = 5):
+                 imbalance_depth: int = 5,
+                 candle_buffer_size: int = 0,
+                 candle_cache_dir: Optional[str] = None,
+                 meta_cache_max_ttl: float = 0,
+                 candle_cache_ttl: float = 0):
         self.info = info
+        # Incremental candle ring buffers keyed by (coin, interval).
+        # 0 disables buffering: every get_candles call fetches the full window.
+        self._candle_buffer_size = candle_buffer_size
+        self._candle_buffers: Dict[Tuple[str, str], CandleRingBuffer] = {}
+        # Optional on-disk copy of the ring buffers so restarts only fetch
+        # the candles formed while the bot was down.  None disables it.
+        self._candle_cache_dir = candle_cache_dir
+        self._candle_saved_ts: Dict[Tuple[str, str], Optional[int]] = {}
+        # Short-lived cache of whole candle frames keyed by (coin, interval,
+        # lookback), so several strategies or timeframes asking for the same
+        # window within one cycle share a fetch.  0 disables it.
+        self._candle_cache_ttl = candle_cache_ttl
+        self._candle_frames: TTLCacheMap[Tuple[str, str, int], pd.DataFrame] = TTLCacheMap(candle_cache_ttl)
         self._cache: TTLCacheMap[str, MarketData] = TTLCacheMap(market_data_cache_ttl)
         self._cache_ttl = market_data_cache_ttl
         self._imbalance_depth = imbalance_depth
         self._meta_cache: TTLCacheEntry[Dict] = TTLCacheEntry(meta_cache_ttl)
         self._meta_cache_ttl = meta_cache_ttl
+        # Adaptive meta TTL: each refetch that returns an unchanged meta
+        # doubles the TTL up to this cap; a changed meta resets it to
+        # meta_cache_ttl.  <= meta_cache_ttl keeps the TTL fixed.
+        self._meta_cache_max_ttl = meta_cache_max_ttl
+        self._last_meta: Optional[Dict] = None
+        # (meta, {coin: szDecimals}) built from the meta document it indexes,
+        # so a refetched or re-seeded meta rebuilds it on the next lookup.
+        self._sz_decimals_index: Tuple[Optional[Dict], Dict[str, int]] = (None, {})
+        # Coalesces concurrent cache misses (signal workers, WS thread) for
+        # the same meta / L2 fetch into one request.
+        self._flights: SingleFlight[str, Any] = SingleFlight()
 
     def get_all_mids(self) -> Dict[str, float]:
         try:
@@ -44,34 +91,65 @@ class MarketDataManager:
             logger.error(f"Error fetching mid prices: {e}")
             return {}
 
+    def seed_meta(self, meta: Dict) -> None:
+        """Prime the meta cache with an already-fetched ``meta`` document."""
+        self._meta_cache.set(meta)
+        self._last_meta = meta
+
     def get_meta(self) -> Dict:
         """Get meta information including sz_decimals for all assets"""
         try:
             cached = self._meta_cache.get()
             if cached is not None:
                 return cached
-
-            meta = api_wrapper.call(self.info.meta)
-            self._meta_cache.set(meta)
-            return meta
+            return self._flights.do('meta', self._fetch_meta)
         except API_ERRORS as e:
             logger.error(f"Error fetching meta data: {e}")
             return {}
 
+    def _fetch_meta(self) -> Dict:
+        meta = api_wrapper.call(self.info.meta)
+        self._adapt_meta_ttl(meta)
+        self._meta_cache.set(meta)
+        self._last_meta = meta
+        return meta
+
+    def _adapt_meta_ttl(self, meta: Dict) -> None:
+        """Lengthen the meta TTL while refetches keep returning the same universe."""
+        if self._meta_cache_max_ttl <= self._meta_cache_ttl:
+            return
+        if self._last_meta is not None and meta == self._last_meta:
+            ttl = min(self._meta_cache.ttl * 2, self._meta_cache_max_ttl)
+        else:
+            ttl = self._meta_cache_ttl
+        if ttl != self._meta_cache.ttl:
+            logger.debug(f"Meta cache TTL {self._meta_cache.ttl:.0f}s -> {ttl:.0f}s")
+            self._meta_cache.ttl = ttl
+
     def get_sz_decimals(self, coin: str) -> int:
         """Get the number of decimal places allowed for order size"""
         try:
-            meta = self.get_meta()
-            if 'universe' in meta:
-                for asset in meta['universe']:
-                    if asset['name'] == coin:
-                        return asset['szDecimals']
+            sz_decimals = self._sz_decimals_by_name(self.get_meta()).get(coin)
+            if sz_decimals is not None:
+                return sz_decimals
             logger.warning(f"sz_decimals not found for {coin}, using default=3")
             return 3
         except API_ERRORS as e:
             logger.error(f"Error getting sz_decimals for {coin} (using default=3): {e}")
             return 3
 
+    def _sz_decimals_by_name(self, meta: Dict) -> Dict[str, int]:
+        """``{coin: szDecimals}`` for *meta*, rebuilt only when meta changes.
+
+        An empty *meta* (``get_meta`` failed) keeps the last index: size
+        decimals are static per coin, so a known value beats the default.
+        """
+        indexed_meta, index = self._sz_decimals_index
+        if indexed_meta is not meta and meta:
+            index = {asset['name']: asset['szDecimals'] for asset in meta.get('universe', [])}
+            self._sz_decimals_index = (meta, index)
+        return index
+
     def price_rounding_params(self, coin: str) -> Tuple[int, bool]:
         """Return ``(sz_decimals, is_perp)`` for use with :func:`round_price`."""
         return self.get_sz_decimals(coin), not is_hip3(coin)
@@ -92,22 +170,24 @@ class MarketDataManager:
             cached = self._cache.get(coin)
             if cached is not None:
                 return cached
-
-            l2_data = self.get_l2_snapshot(coin)
-            if not l2_data or 'levels' not in l2_data:
-                return None
-
-            market_data = self._parse_levels(coin, l2_data['levels'])
-            if market_data is None:
-                return None
-
-            self._cache.set(coin, market_data)
-            return market_data
+            return self._flights.do(f'l2:{coin}', lambda: self._fetch_market_data(coin))
 
         except API_ERRORS as e:
             logger.error(f"Error getting market data for {coin}: {e}")
             return None
 
+    def _fetch_market_data(self, coin: str) -> Optional[MarketData]:
+        l2_data = self.get_l2_snapshot(coin)
+        if not l2_data or 'levels' not in l2_data:
+            return None
+
+        market_data = self._parse_levels(coin, l2_data['levels'])
+        if market_data is None:
+            return None
+
+        self._cache.set(coin, market_data)
+        return market_data
+
     def _parse_levels(self, coin: str, levels) -> Optional[MarketData]:
         """Build a :class:`MarketData` from raw L2 ``levels`` (list of bid/ask arrays)."""
         if len(levels) < 2 or not levels[0] or not levels[1]:
@@ -132,9 +212,13 @@ class MarketDataManager:
             if top_total > 0 else mid_price
         )
 
+        # Sizes summed in book order, starting from the already-parsed top level.
         depth = min(self._imbalance_depth, len(bids), len(asks))
-        bid_size = sum(float(bids[i]['sz']) for i in range(depth))
-        ask_size = sum(float(asks[i]['sz']) for i in range(depth))
+        bid_size = bid_size_top if depth else 0.0
+        ask_size = ask_size_top if depth else 0.0
+        for i in range(1, depth):
+            bid_size += float(bids[i]['sz'])
+            ask_size += float(asks[i]['sz'])
         total_size = bid_size + ask_size
         book_imbalance = (bid_size - ask_size) / total_size if total_size > 0 else 0.0
 
@@ -162,33 +246,65 @@ class MarketDataManager:
             self._cache.set(coin, md)
 
     def get_candles(self, coin: str, interval: str, lookback: int = 100) -> pd.DataFrame:
+        """OHLCV frame for the last *lookback* bars of *interval*.
+
+        With ``candle_cache_ttl`` set, a repeat request for the same window
+        within the TTL gets a shallow copy of the cached frame: callers may
+        add columns without affecting it, but must not edit values in place.
+        """
+        if self._candle_cache_ttl <= 0:
+            return self._fetch_candles(coin, interval, lookback)
+        key = (coin, interval, lookback)
+        frame = self._candle_frames.get(key)
+        if frame is None:
+            frame = self._fetch_candles(coin, interval, lookback)
+            if frame.empty:
+                return frame
+            self._candle_frames.set(key, frame)
+        return frame.copy(deep=False)
+
+    def get_candle_field(self, coin: str, interval: str, lookback: int = 100,
+                         field: str = 'close') -> np.ndarray:
+        """One OHLCV *field* of the :meth:`get_candles` window as a float64 array.
+
+        When the window is served from a ring buffer (and the frame cache is
+        off), the values are read straight from the buffer without building
+        a DataFrame; otherwise this is the column of :meth:`get_candles`.
+        Empty when no candles are available.
+        """
+        if self._candle_cache_ttl <= 0 and 0 < lookback < self._candle_buffer_size:
+            try:
+                start_time, end_time = self._candle_window(interval, lookback)
+                buf = self._refresh_candle_buffer(coin, interval, start_time, end_time)
+            except API_ERRORS as e:
+                logger.error(f"Error fetching candles for {coin} (interval={interval}, lookback={lookback}): {e}")
+                return np.empty(0)
+            return buf.field(field, start_time)
+        candles = self.get_candles(coin, interval, lookback)
+        if field not in candles:
+            return np.empty(0)
+        return candles[field].to_numpy(dtype=float)
+
+    @staticmethod
+    def _candle_window(interval: str, lookback: int) -> Tuple[int, int]:
+        """``(start_time, end_time)`` in ms covering the last *lookback* bars."""
+        end_time = int(time.time() * 1000)  # Current time in milliseconds
+
+        interval_ms = _INTERVAL_MS.get(interval)
+        if interval_ms is None:
+            logger.warning(
+                "Unknown candle interval '%s', falling back to 1m", interval
+            )
+            interval_ms = 60_000
+
+        return end_time - (lookback * interval_ms), end_time
+
+    def _fetch_candles(self, coin: str, interval: str, lookback: int) -> pd.DataFrame:
         try:
-            # Calculate time range
-            end_time = int(time.time() * 1000)  # Current time in milliseconds
-
-            # Calculate start time based on interval and lookback
-            _INTERVAL_MS = {
-                '1m': 60_000,
-                '3m': 3 * 60_000,
-                '5m': 5 * 60_000,
-                '15m': 15 * 60_000,
-                '30m': 30 * 60_000,
-                '1h': 3_600_000,
-                '2h': 2 * 3_600_000,
-                '4h': 4 * 3_600_000,
-                '12h': 12 * 3_600_000,
-                '1d': 86_400_000,
-                '1w': 7 * 86_400_000,
-                '1M': 30 * 86_400_000,
-            }
-            interval_ms = _INTERVAL_MS.get(interval)
-            if interval_ms is None:
-                logger.warning(
-                    "Unknown candle interval '%s', falling back to 1m", interval
-                )
-                interval_ms = 60_000
-
-            start_time = end_time - (lookback * interval_ms)
+            start_time, end_time = self._candle_window(interval, lookback)
+
+            if 0 < lookback < self._candle_buffer_size:
+                return self._get_candles_buffered(coin, interval, start_time, end_time)
 
             # Use the correct API call format with positional arguments
             candles = api_wrapper.call(
@@ -199,31 +315,96 @@ class MarketDataManager:
                 end_time
             )
 
-            if not candles:
-                return pd.DataFrame()
-
-            df = pd.DataFrame(candles)
-            df['timestamp'] = pd.to_datetime(df['t'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-
-            for col in ['o', 'h', 'l', 'c', 'v']:
-                if col in df.columns:
-                    df[col] = df[col].astype(float)
-
-            df.rename(columns={
-                'o': 'open',
-                'h': 'high',
-                'l': 'low',
-                'c': 'close',
-                'v': 'volume'
-            }, inplace=True)
-
-            return df
+            return frame_from_api(candles or [])
 
         except API_ERRORS as e:
             logger.error(f"Error fetching candles for {coin} (interval={interval}, lookback={lookback}): {e}")
             return pd.DataFrame()
 
+    def _get_candles_buffered(self, coin: str, interval: str,
+                              start_time: int, end_time: int) -> pd.DataFrame:
+        """Serve ``get_candles`` from a per-(coin, interval) ring buffer."""
+        buf = self._refresh_candle_buffer(coin, interval, start_time, end_time)
+        if len(buf) == 0:
+            return pd.DataFrame()
+        return buf.to_frame(start_time)
+
+    def _refresh_candle_buffer(self, coin: str, interval: str,
+                               start_time: int, end_time: int) -> CandleRingBuffer:
+        """Bring the (coin, interval) ring buffer up to *end_time* and return it.
+
+        The first call (or one reaching further back than the buffer
+        covers) loads the full window; later calls only fetch candles from
+        the last buffered timestamp onward, refreshing the in-progress bar.
+        """
+        key = (coin, interval)
+        buf = self._candle_buffers.get(key)
+        if buf is None and self._candle_cache_dir:
+            buf = self._load_cached_candles(key, start_time)
+        if buf is None or buf.covered_from is None or start_time < buf.covered_from:
+            buf = CandleRingBuffer(self._candle_buffer_size)
+            since = start_time
+        else:
+            since = buf.last_ts if buf.last_ts is not None else start_time
+
+        candles = api_wrapper.call(self.info.candles_snapshot, coin, interval, since, end_time)
+        buf.extend_from_api(candles or [])
+        if buf.covered_from is None:
+            buf.covered_from = start_time
+        self._candle_buffers[key] = buf
+        if self._candle_cache_dir:
+            self._save_cached_candles(key, buf)
+        return buf
+
+    def _candle_cache_path(self, key: Tuple[str, str]) -> str:
+        coin, interval = key
+        # HIP-3 coins are "dex:COIN"; keep the file name portable.
+        return os.path.join(self._candle_cache_dir, f"{coin.replace(':', '_')}_{interval}.npz")
+
+    def _load_cached_candles(self, key: Tuple[str, str],
+                             start_time: int) -> Optional[CandleRingBuffer]:
+        """Restore a persisted buffer if it still overlaps the requested window."""
+        buf = CandleRingBuffer.load(self._candle_cache_path(key), self._candle_buffer_size)
+        if buf is None or buf.last_ts is None or buf.last_ts < start_time:
+            return None
+        self._candle_saved_ts[key] = buf.last_ts
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Candle cache {key[0]} {key[1]}: hit={len(buf)} since={buf.last_ts}")
+        return buf
+
+    def _save_cached_candles(self, key: Tuple[str, str], buf: CandleRingBuffer) -> None:
+        """Persist *buf* once a new candle has been appended since the last save."""
+        if buf.last_ts == self._candle_saved_ts.get(key):
+            return
+        try:
+            os.makedirs(self._candle_cache_dir, exist_ok=True)
+            buf.save(self._candle_cache_path(key))
+            self._candle_saved_ts[key] = buf.last_ts
+        except OSError as e:
+            logger.warning(f"Could not persist candle cache for {key[0]} {key[1]}: {e}")
+
+    def get_close_matrix(self, coins: List[str], interval: str, lookback: int = 100,
+                         min_periods: int = 1) -> Tuple[List[str], np.ndarray]:
+        """Close prices for several coins stacked into one ``(n_coins, n_bars)`` array.
+
+        Coins with fewer than *min_periods* candles are dropped.  Rows are
+        right-aligned on the most recent bar and truncated to the shortest
+        remaining history, so column ``-1`` is every coin's latest close.
+        Returns the coins kept (row order) and the matrix.
+        """
+        kept: List[str] = []
+        rows: List[np.ndarray] = []
+        for coin in coins:
+            closes = self.get_candle_field(coin, interval, lookback)
+            if len(closes) < min_periods or len(closes) == 0:
+                continue
+            kept.append(coin)
+            rows.append(closes)
+        if not rows:
+            return [], np.empty((0, 0))
+        width = min(len(r) for r in rows)
+        return kept, np.vstack([r[len(r) - width:] for r in rows])
+
     def get_funding_rate(self, coin: str) -> Optional[float]:
         try:
             funding_data = api_wrapper.call(self.info.funding_rates)
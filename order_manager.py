@@ -1,6 +1,6 @@
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -10,7 +10,7 @@ from rate_limiter import api_wrapper, API_ERRORS
 from config import Config
 from exceptions import ConfigurationError
 from coin_utils import is_hip3, parse_coin
-from ttl_cache import TTLCacheEntry, TTLCacheMap
+from ttl_cache import SingleFlight, TTLCacheEntry, TTLCacheMap
 
 if TYPE_CHECKING:
     from order_rejection_tracker import OrderRejectionTracker
@@ -55,7 +55,7 @@ class OrderStatus(Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     id: Optional[int]
     coin: str
@@ -86,6 +86,9 @@ class OrderManager:
         self._mids_cache: TTLCacheMap[str, Dict[str, str]] = TTLCacheMap(mids_cache_ttl)
         self._user_state_cache: TTLCacheEntry[Dict] = TTLCacheEntry(user_state_cache_ttl)
         self._user_state_cache_ttl = user_state_cache_ttl
+        # (user_state, {coin: position}) for the user_state it indexes, so a
+        # refetched snapshot rebuilds it on the next get_position.
+        self._position_index: Tuple[Optional[Dict], Dict[str, Dict]] = (None, {})
 
         # Per-cycle open orders cache. Multiple callers (update_order_status,
         # cancel_stale_orders, _is_order_alive) share a single API call.
@@ -93,11 +96,18 @@ class OrderManager:
         # Not thread-safe; bot runs single-threaded.
         self._open_orders_cache: TTLCacheEntry[List[Dict]] = TTLCacheEntry(user_state_cache_ttl)
 
+        # Coalesces concurrent cache misses (signal workers, HIP-3 fetch
+        # pool) for the same user_state / open_orders / mids fetch.
+        self._flights: SingleFlight[str, Any] = SingleFlight()
+
         # Optional rejection tracker: when set, routine post-only rejections
         # are routed through it for log-level downgrade and aggregation.
         # When ``None`` the legacy ERROR-level path is used (unchanged).
         self._rejection_tracker: Optional["OrderRejectionTracker"] = None
 
+    def shutdown(self) -> None:
+        """Release background workers.  The base manager starts none."""
+
     def set_rejection_tracker(self, tracker: "OrderRejectionTracker") -> None:
         """Wire a tracker so future rejections are classified and aggregated.
 
@@ -284,8 +294,11 @@ class OrderManager:
     def _get_sz_decimals(self, coin: str) -> int:
         """Return sz_decimals for *coin* from exchange metadata.
 
-        Results are cached per coin to avoid redundant API calls.
-        Default is 3 (aligned with MarketDataManager.get_sz_decimals).
+        Results are cached per coin to avoid redundant API calls: one
+        ``meta`` response fills the cache for the whole universe, and a
+        coin it does not list (e.g. a HIP-3 coin) caches the default so
+        later orders for it skip the call.  Default is 3 (aligned with
+        MarketDataManager.get_sz_decimals); API errors are not cached.
         """
         if not hasattr(self, '_sz_decimals_cache'):
             self._sz_decimals_cache: Dict[str, int] = {}
@@ -293,13 +306,11 @@ class OrderManager:
             return self._sz_decimals_cache[coin]
         try:
             meta = api_wrapper.call(self.info.meta)
-            for asset in meta.get('universe', []):
-                if asset['name'] == coin:
-                    self._sz_decimals_cache[coin] = asset['szDecimals']
-                    return asset['szDecimals']
         except API_ERRORS:
-            pass
-        return 3
+            return 3
+        for asset in meta.get('universe', []):
+            self._sz_decimals_cache.setdefault(asset['name'], asset['szDecimals'])
+        return self._sz_decimals_cache.setdefault(coin, 3)
 
     def create_limit_order(
         self,
@@ -310,6 +321,20 @@ class OrderManager:
         reduce_only: bool = False,
         post_only: bool = True
     ) -> Optional[Order]:
+        return self._place_order(
+            self.build_limit_order(coin, side, size, price, reduce_only, post_only)
+        )
+
+    def build_limit_order(
+        self,
+        coin: str,
+        side: OrderSide,
+        size: float,
+        price: float,
+        reduce_only: bool = False,
+        post_only: bool = True
+    ) -> Order:
+        """Build a limit :class:`Order` without sending it (see :meth:`bulk_place_orders`)."""
         order = Order(
             id=None,
             coin=coin,
@@ -323,7 +348,7 @@ class OrderManager:
         if post_only:
             order.order_type["limit"]["tif"] = "Alo"
 
-        return self._place_order(order)
+        return order
 
     def create_market_order(
         self,
@@ -339,6 +364,23 @@ class OrderManager:
         Instead we use an IOC (Immediate-or-Cancel) limit order with a
         slippage-adjusted price to simulate market execution.
         """
+        order = self.build_market_order(coin, side, size, reduce_only, slippage)
+        if order is None:
+            return None
+        return self._place_order(order)
+
+    def build_market_order(
+        self,
+        coin: str,
+        side: OrderSide,
+        size: float,
+        reduce_only: bool = False,
+        slippage: Optional[float] = None
+    ) -> Optional[Order]:
+        """Build the IOC order :meth:`create_market_order` would send.
+
+        Returns ``None`` when no mid price is available.
+        """
         if slippage is None:
             slippage = self.default_slippage
         try:
@@ -368,7 +410,7 @@ class OrderManager:
             reduce_only=reduce_only
         )
 
-        return self._place_order(order)
+        return order
 
     @staticmethod
     def _extract_oid(status_info: Dict) -> Optional[int]:
@@ -549,15 +591,26 @@ class OrderManager:
 
         return results
 
+    def update_mids_from_ws(self, mids: Dict[str, str]) -> None:
+        """Refresh the standard-DEX mids cache from a WebSocket allMids message.
+
+        Called on the SDK's WS thread.  The cache TTL still applies, so a
+        dead feed falls back to REST once the last snapshot expires.
+        """
+        self._mids_cache.set('', mids)
+
     def _get_cached_mids(self, dex: str = '') -> Dict[str, str]:
         """Return all_mids for a DEX, using a short-lived cache."""
         cached = self._mids_cache.get(dex)
         if cached is not None:
             return cached
 
-        mids = api_wrapper.call(self.info.all_mids, dex=dex) if dex else api_wrapper.call(self.info.all_mids)
-        self._mids_cache.set(dex, mids)
-        return mids
+        def fetch() -> Dict[str, str]:
+            mids = api_wrapper.call(self.info.all_mids, dex=dex) if dex else api_wrapper.call(self.info.all_mids)
+            self._mids_cache.set(dex, mids)
+            return mids
+
+        return self._flights.do(f'mids:{dex}', fetch)
 
     def _get_mid_price(self, coin: str) -> float:
         """Get mid price for a coin. Works with both standard and HIP-3 coins.
@@ -594,9 +647,11 @@ class OrderManager:
             result = api_wrapper.call(self.exchange.cancel, coin, order_id)
 
             if result and 'status' in result and result['status'] == 'ok':
-                if order_id in self.active_orders:
-                    self.active_orders[order_id].status = OrderStatus.CANCELLED
-                    del self.active_orders[order_id]
+                # pop() rather than check-then-del: the order-update feed
+                # may remove the same oid from the WebSocket thread.
+                order = self.active_orders.pop(order_id, None)
+                if order is not None:
+                    order.status = OrderStatus.CANCELLED
                 logger.info(f"Order {order_id} cancelled successfully")
                 self._invalidate_open_orders_cache()
                 return True
@@ -635,10 +690,9 @@ class OrderManager:
                     if status == 'success':
                         cancelled += 1
                         if i < len(cancel_requests):
-                            oid = cancel_requests[i]['oid']
-                            if oid in self.active_orders:
-                                self.active_orders[oid].status = OrderStatus.CANCELLED
-                                del self.active_orders[oid]
+                            order = self.active_orders.pop(cancel_requests[i]['oid'], None)
+                            if order is not None:
+                                order.status = OrderStatus.CANCELLED
 
                 if cancelled < len(cancel_requests):
                     logger.debug(
@@ -655,8 +709,14 @@ class OrderManager:
             return 0
 
     def cancel_all_orders(self, coin: Optional[str] = None) -> int:
+        """Cancel every open order (optionally only *coin*'s) in one signed bulk_cancel."""
         try:
+            # Always fetch fresh: this is the emergency/shutdown path.  The
+            # result seeds the open-orders cache so get_open_orders and
+            # update_order_status reuse it when nothing needed cancelling
+            # (bulk_cancel_orders invalidates it otherwise).
             open_orders = api_wrapper.call(self.info.open_orders, self.account_address)
+            self._open_orders_cache.set(open_orders)
 
             to_cancel = [
                 {"coin": o['coin'], "oid": int(o['oid'])}
@@ -686,8 +746,7 @@ class OrderManager:
         open_orders = self._open_orders_cache.get()
         if open_orders is None:
             try:
-                open_orders = api_wrapper.call(self.info.open_orders, self.account_address)
-                self._open_orders_cache.set(open_orders)
+                open_orders = self._flights.do('open_orders', self._fetch_open_orders)
             except API_ERRORS as e:
                 logger.error(f"Error fetching open orders: {e}")
                 return []
@@ -696,6 +755,11 @@ class OrderManager:
             return [o for o in open_orders if o['coin'] == coin]
         return open_orders
 
+    def _fetch_open_orders(self) -> List[Dict]:
+        open_orders = api_wrapper.call(self.info.open_orders, self.account_address)
+        self._open_orders_cache.set(open_orders)
+        return open_orders
+
     def update_order_status(self) -> None:
         try:
             open_orders = self.get_open_orders()
@@ -703,7 +767,7 @@ class OrderManager:
 
             # Find orders that are no longer on the book
             disappeared = [
-                (oid, order) for oid, order in self.active_orders.items()
+                (oid, order) for oid, order in list(self.active_orders.items())
                 if oid not in open_order_ids
             ]
             if not disappeared:
@@ -735,30 +799,81 @@ class OrderManager:
                 f"{len(self.active_orders)} active orders): {e}"
             )
 
+    def apply_order_updates(self, updates: List[Dict]) -> int:
+        """Drop orders a WS ``orderUpdates`` push reports as no longer resting.
+
+        ``filled`` marks the order FILLED, statuses ending in ``rejected``
+        mark it REJECTED and every other non-resting status (``canceled``,
+        ``marginCanceled``, ...) CANCELLED.  ``open`` and ``triggered``
+        leave it tracked.  Returns the number of orders removed.
+        """
+        removed = 0
+        for update in updates:
+            status = update.get('status', '')
+            if status in ('open', 'triggered'):
+                continue
+            raw = update.get('order', {})
+            try:
+                oid = int(raw['oid'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            # pop() for the same reason as update_order_status: the main
+            # thread may have removed the order already.
+            order = self.active_orders.pop(oid, None)
+            if order is None:
+                continue
+            if status == 'filled':
+                order.status = OrderStatus.FILLED
+                try:
+                    order.filled_size = float(raw['origSz']) - float(raw['sz'])
+                except (KeyError, TypeError, ValueError):
+                    order.filled_size = order.size
+            elif status.lower().endswith('rejected'):
+                order.status = OrderStatus.REJECTED
+            else:
+                order.status = OrderStatus.CANCELLED
+            removed += 1
+        if removed:
+            self._invalidate_open_orders_cache()
+        return removed
+
     def _get_cached_user_state(self) -> Dict:
         """Return user_state, using a short-lived cache to avoid redundant API calls."""
         cached = self._user_state_cache.get()
         if cached is not None:
             return cached
+        return self._flights.do('user_state', self._fetch_user_state)
 
+    def _fetch_user_state(self) -> Dict:
         user_state = api_wrapper.call(self.info.user_state, self.account_address)
         self._user_state_cache.set(user_state)
         return user_state
 
+    def get_user_state(self) -> Dict:
+        """Cached clearinghouse state shared with other components.
+
+        Lets RiskManager read the same snapshot the order path uses within a
+        cycle instead of issuing its own ``user_state`` request.  API errors
+        propagate to the caller.
+        """
+        return self._get_cached_user_state()
+
     def get_position(self, coin: str) -> Optional[Dict]:
         try:
-            user_state = self._get_cached_user_state()
-
-            if 'assetPositions' in user_state:
-                for position in user_state['assetPositions']:
-                    if position['position']['coin'] == coin:
-                        return position['position']
-            return None
+            return self._positions_by_coin(self._get_cached_user_state()).get(coin)
 
         except API_ERRORS as e:
             logger.error(f"Error fetching position for {coin}: {e}")
             return None
 
+    def _positions_by_coin(self, user_state: Dict) -> Dict[str, Dict]:
+        """``{coin: position}`` for *user_state*, rebuilt only when the snapshot changes."""
+        indexed_state, index = self._position_index
+        if indexed_state is not user_state:
+            index = {p['position']['coin']: p['position'] for p in user_state.get('assetPositions', [])}
+            self._position_index = (user_state, index)
+        return index
+
     def get_all_positions(self) -> List[Dict]:
         try:
             user_state = self._get_cached_user_state()
@@ -0,0 +1,72 @@
+"""Cached EIP-712 signing for Hyperliquid L1 actions.
+
+Every order, cancel and modify is signed through the SDK's
+``sign_l1_action``, which on each call rebuilds the full typed-data
+structure, re-hashes the constant ``Exchange`` domain and ``Agent`` type,
+and lets ``eth_account`` re-parse the private key -- deriving the public
+key with a full elliptic-curve multiplication before the actual ECDSA
+signature.  The domain and type hashes never change and the key only
+needs parsing once, so :func:`sign_l1_action_cached` precomputes them and
+only hashes the per-action message before signing.
+
+Signatures are byte-identical to the SDK's (ECDSA nonces are RFC 6979
+deterministic).  :func:`install_cached_l1_signer` swaps the function the
+SDK's ``Exchange`` calls; wallets without a raw ``key`` fall back to the
+SDK implementation.
+"""
+
+import functools
+import logging
+from typing import Any, Dict, Optional
+
+import hyperliquid.exchange as _sdk_exchange
+from eth_keys.datatypes import PrivateKey
+from eth_utils import keccak, to_hex
+from hyperliquid.utils.signing import action_hash, sign_l1_action
+
+logger = logging.getLogger(__name__)
+
+# Constant parts of the SDK's l1_payload(): the "Exchange" domain and the
+# "Agent(string source,bytes32 connectionId)" message type.
+_DOMAIN_SEPARATOR = keccak(
+    keccak(text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+    + keccak(text="Exchange")
+    + keccak(text="1")
+    + (1337).to_bytes(32, "big")
+    + bytes(32)  # verifyingContract = 0x0
+)
+_AGENT_TYPE_HASH = keccak(text="Agent(string source,bytes32 connectionId)")
+_SOURCE_HASH = {True: keccak(text="a"), False: keccak(text="b")}
+
+
+@functools.lru_cache(maxsize=4)
+def _private_key(key: bytes) -> PrivateKey:
+    """Parse *key* once; deriving its public key is the expensive part."""
+    return PrivateKey(bytes(key))
+
+
+def l1_action_digest(action: Any, active_pool: Optional[str], nonce: int,
+                     expires_after: Optional[int], is_mainnet: bool) -> bytes:
+    """EIP-712 digest the SDK signs for an L1 action."""
+    connection_id = action_hash(action, active_pool, nonce, expires_after)
+    struct_hash = keccak(_AGENT_TYPE_HASH + _SOURCE_HASH[is_mainnet] + connection_id)
+    return keccak(b"\x19\x01" + _DOMAIN_SEPARATOR + struct_hash)
+
+
+def sign_l1_action_cached(wallet: Any, action: Any, active_pool: Optional[str], nonce: int,
+                          expires_after: Optional[int], is_mainnet: bool) -> Dict[str, Any]:
+    """Drop-in replacement for the SDK's ``sign_l1_action``."""
+    key = getattr(wallet, "key", None)
+    if key is None:
+        return sign_l1_action(wallet, action, active_pool, nonce, expires_after, is_mainnet)
+    digest = l1_action_digest(action, active_pool, nonce, expires_after, is_mainnet)
+    signature = _private_key(key).sign_msg_hash(digest)
+    return {"r": to_hex(signature.r), "s": to_hex(signature.s), "v": signature.v + 27}
+
+
+def install_cached_l1_signer() -> None:
+    """Route the SDK ``Exchange``'s L1 signing through :func:`sign_l1_action_cached`."""
+    if _sdk_exchange.sign_l1_action is sign_l1_action_cached:
+        return
+    _sdk_exchange.sign_l1_action = sign_l1_action_cached
+    logger.info("Cached order signing enabled")
@@ -1,4 +1,5 @@
 import os
+import re
 import time
 import logging
 from typing import Any, Callable, Optional, Tuple, Type
@@ -18,6 +19,11 @@ from exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Message patterns used by APICallWrapper._classify when the exception
+# carries no HTTP status of its own.
+_RATE_LIMIT_RE = re.compile(r"429|rate limit", re.IGNORECASE)
+_TIMEOUT_RE = re.compile(r"timeout|timed out", re.IGNORECASE)
+
 # Expected exceptions from API calls.  Catch these for graceful degradation;
 # programming errors (AttributeError, NameError, etc.) will propagate.
 #
@@ -56,31 +62,35 @@ class RateLimiter:
         self._current_backoff = 0.0
 
     def wait_if_needed(self) -> None:
-        """Wait if necessary to respect rate limits"""
+        """Wait if necessary to respect rate limits.
+
+        Each caller reserves its send slot under the lock and sleeps until
+        that slot *after* releasing it, so concurrent callers (signal
+        workers, HIP-3 fetch pool) queue up in spaced slots without one
+        sleeping thread blocking the others from reserving theirs.  Slots
+        are on ``time.monotonic()``, so wall-clock jumps cannot stall calls.
+        """
         with self._lock:
-            current_time = time.time()
+            now = time.monotonic()
 
-            # Calculate wait time based on minimum interval
-            time_since_last = current_time - self._last_request_time
-            min_wait = self.min_interval + self._current_backoff
+            # Minimum interval (plus any 429 backoff) after the previous slot
+            slot = max(now, self._last_request_time + self.min_interval + self._current_backoff)
 
-            if time_since_last < min_wait:
-                wait_time = min_wait - time_since_last
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-                time.sleep(wait_time)
-                current_time = time.time()
+            # Burst limit: at most burst_limit slots in any 1s window
+            window = max(self.burst_limit - 1, 1)
+            if len(self._request_times) >= window:
+                oldest = self._request_times[-window]
+                if slot - oldest < 1.0:
+                    slot = oldest + 1.1
 
-            # Check burst limit
-            self._request_times.append(current_time)
-            if len(self._request_times) >= self.burst_limit:
-                oldest_request = self._request_times[0]
-                if current_time - oldest_request < 1.0:
-                    # Too many requests in the last second
-                    burst_wait = 1.0 - (current_time - oldest_request) + 0.1
-                    logger.debug(f"Burst limit: waiting {burst_wait:.2f}s")
-                    time.sleep(burst_wait)
+            self._request_times.append(slot)
+            self._last_request_time = slot
 
-            self._last_request_time = time.time()
+        wait_time = slot - now
+        if wait_time > 0:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
+            time.sleep(wait_time)
 
     def on_429_error(self) -> None:
         """Called when a 429 error is received to increase backoff"""
@@ -126,15 +136,18 @@ class APICallWrapper:
         traceback is preserved.
         """
         error_str = str(e)
-        error_lower = error_str.lower()
 
         def _chain(cls: type) -> HyperliquidBotError:
             wrapped = cls(error_str)
             wrapped.__cause__ = e
             return wrapped
 
-        # Rate-limit detection
-        if "429" in error_str or "rate limit" in error_lower:
+        # Rate-limit detection: the HTTP status when the error carries one
+        # (SDK ClientError, requests.HTTPError), else the message.
+        status = getattr(e, "status_code", None)
+        if status is None:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+        if status == 429 or (status is None and _RATE_LIMIT_RE.search(error_str)):
             return _chain(RateLimitError)
 
         # Network / timeout detection
@@ -153,9 +166,7 @@ class APICallWrapper:
 
         # HyperliquidAPIError — classify by message
         if isinstance(e, HyperliquidAPIError):
-            if "429" in error_str or "rate limit" in error_lower:
-                return _chain(RateLimitError)
-            if any(kw in error_lower for kw in ("timeout", "timed out")):
+            if _TIMEOUT_RE.search(error_str):
                 return _chain(NetworkError)
             return _chain(DataError)
 
@@ -179,11 +190,13 @@ class APICallWrapper:
                 if isinstance(classified, RateLimitError):
                     self.rate_limiter.on_429_error()
                     if attempt < self.MAX_RETRIES:
+                        # No sleep here: the retry's wait_if_needed() reserves
+                        # its slot backoff seconds after the failed one, in
+                        # order with slots other threads reserve meanwhile.
                         logger.warning(
                             "Rate limited (attempt %d/%d), retrying after %.1fs",
                             attempt, self.MAX_RETRIES, self.rate_limiter._current_backoff,
                         )
-                        time.sleep(self.rate_limiter._current_backoff)
                         continue
                     logger.error("Rate limited after %d attempts, giving up", self.MAX_RETRIES)
                     raise classified
@@ -2,7 +2,7 @@ import logging
 import os
 import time
 from collections import deque
-from typing import Deque, Dict, List, Optional
+from typing import Callable, Deque, Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from rate_limiter import api_wrapper, API_ERRORS
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 VALID_RISK_LEVELS = ("green", "yellow", "red", "black")
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskMetrics:
     total_balance: float
     available_balance: float
@@ -40,9 +40,16 @@ _ACTION_PRIORITY = {
 }
 
 
+def _more_severe(current: str, new: str) -> str:
+    """Return whichever of *current* / *new* has the higher priority."""
+    if _ACTION_PRIORITY.get(new, 0) > _ACTION_PRIORITY.get(current, 0):
+        return new
+    return current
+
+
 class RiskManager:
     def __init__(self, info, account_address: str, config: Dict, hip3_dexes: Optional[List[str]] = None,
-                 market_data=None):
+                 market_data=None, user_state_source: Optional[Callable[[], Dict]] = None) -> None:
         self.info = info
         self.account_address = account_address
         self.config = config
@@ -50,6 +57,9 @@ class RiskManager:
         # When set, HIP-3 user_state queries go through the shared cache in
         # MultiDexMarketData instead of making direct API calls per DEX.
         self._market_data = market_data
+        # When set, the standard-HL user_state comes from this callable
+        # (OrderManager's TTL cache) so both components share one API call.
+        self._user_state_source = user_state_source
 
         # Legacy parameters (backwards compatible)
         self.max_leverage = config.get('max_leverage', 3.0)
@@ -72,6 +82,9 @@ class RiskManager:
         self._last_metrics_time: float = 0.0
         self.starting_balance: Optional[float] = None
         self.daily_starting_balance: Optional[float] = None
+        # Local calendar date of the last daily baseline reset.  The daily
+        # loss window rolls over at local midnight, so this stays a local
+        # date rather than a UTC day number (time.time() // 86400).
         self.last_reset_date = datetime.now().date()
 
         # Emergency stop cooldown tracking
@@ -80,6 +93,19 @@ class RiskManager:
         # Last known balance (for spot API failure fallback)
         self._last_known_balance: Optional[float] = None
 
+    def rebind(self, info, market_data=None,
+               user_state_source: Optional[Callable[[], Dict]] = None) -> None:
+        """Point at freshly created connection objects after a reset.
+
+        All tracking state (starting/daily balances, cooldown, metrics
+        history) is kept; only the cached metrics are marked stale so the
+        next check fetches through the new connections.
+        """
+        self.info = info
+        self._market_data = market_data
+        self._user_state_source = user_state_source
+        self._last_metrics_time = 0.0
+
     # ------------------------------------------------------------------ #
     #  Risk level helpers (runtime-reloadable via env var)
     # ------------------------------------------------------------------ #
@@ -144,13 +170,17 @@ class RiskManager:
 
     def get_current_metrics(self) -> Optional[RiskMetrics]:
         try:
-            user_state = api_wrapper.call(self.info.user_state, self.account_address)
+            if self._user_state_source is not None:
+                user_state = self._user_state_source()
+            else:
+                user_state = api_wrapper.call(self.info.user_state, self.account_address)
 
             if not user_state or 'marginSummary' not in user_state:
                 return None
 
             margin_summary = user_state['marginSummary']
-            logger.debug(f"Available keys in margin_summary: {list(margin_summary.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Available keys in margin_summary: {list(margin_summary.keys())}")
 
             total_position_value = float(margin_summary.get('totalNtlPos', 0))
 
@@ -208,6 +238,7 @@ class RiskManager:
             leverage = total_position_value / account_value if account_value > 0 else 0
             margin_ratio = total_margin_used / account_value if account_value > 0 else 0
 
+            now = datetime.now()
             metrics = RiskMetrics(
                 total_balance=account_value,
                 available_balance=available_balance,
@@ -218,16 +249,16 @@ class RiskManager:
                 leverage=leverage,
                 margin_ratio=margin_ratio,
                 num_positions=num_positions,
-                timestamp=datetime.now()
+                timestamp=now
             )
 
             if self.starting_balance is None:
                 self.starting_balance = metrics.total_balance
                 self.daily_starting_balance = metrics.total_balance
 
-            if datetime.now().date() > self.last_reset_date:
+            if now.date() > self.last_reset_date:
                 self.daily_starting_balance = metrics.total_balance
-                self.last_reset_date = datetime.now().date()
+                self.last_reset_date = now.date()
 
             self.risk_metrics_history.append(metrics)
             self._last_metrics_time = time.monotonic()
@@ -252,7 +283,10 @@ class RiskManager:
         When multiple conditions fire simultaneously, the most severe action
         wins (see ``_ACTION_PRIORITY``).
         """
-        metrics = self._get_cached_metrics()
+        return self._evaluate_risk_limits(self._get_cached_metrics())
+
+    def _evaluate_risk_limits(self, metrics: Optional[RiskMetrics]) -> Dict:
+        """:meth:`check_risk_limits` against an already-fetched *metrics*."""
         if not metrics:
             return {
                 'all_checks_passed': False,
@@ -267,25 +301,21 @@ class RiskManager:
         stop_bot = False
         reasons: List[str] = []
 
-        def _escalate(new_action: str) -> None:
-            nonlocal action
-            if _ACTION_PRIORITY.get(new_action, 0) > _ACTION_PRIORITY.get(action, 0):
-                action = new_action
-
         # --- Risk level checks ------------------------------------------------
         risk_level = self.get_risk_level()
         if risk_level == "black":
             force_close_all = True
-            _escalate("close_all")
+            action = _more_severe(action, "close_all")
             reasons.append("RISK_LEVEL is 'black' – closing all positions")
         elif risk_level == "red":
-            _escalate("pause")
+            action = _more_severe(action, "pause")
             reasons.append("RISK_LEVEL is 'red' – pausing trading")
 
         # --- Cooldown check ---------------------------------------------------
-        if self.is_in_cooldown():
-            remaining = self.cooldown_remaining_seconds()
-            _escalate("cooldown")
+        # One clock read: remaining > 0 is exactly is_in_cooldown().
+        remaining = self.cooldown_remaining_seconds()
+        if remaining > 0:
+            action = _more_severe(action, "cooldown")
             reasons.append(
                 f"In cooldown after emergency stop ({remaining:.0f}s remaining)"
             )
@@ -299,27 +329,28 @@ class RiskManager:
             'max_positions_ok': metrics.num_positions <= self.max_open_positions,
         }
 
-        if not checks['leverage_ok']:
-            reasons.append(f"Leverage too high: {metrics.leverage:.2f}")
-        if not checks['margin_ratio_ok']:
-            reasons.append(f"Margin ratio too high: {metrics.margin_ratio:.2f}")
-        if not checks['drawdown_ok']:
-            reasons.append("Max drawdown exceeded")
-        if not checks['daily_loss_ok']:
-            reasons.append("Daily loss limit (%) exceeded")
-        if not checks['max_positions_ok']:
-            reasons.append(
-                f"Max open positions exceeded: {metrics.num_positions}/{self.max_open_positions}"
-            )
-
+        # Reasons are only worked out when something failed; the common
+        # all-pass path is the single all() below.
         if not all(checks.values()):
-            _escalate("block_new_orders")
+            action = _more_severe(action, "block_new_orders")
+            if not checks['leverage_ok']:
+                reasons.append(f"Leverage too high: {metrics.leverage:.2f}")
+            if not checks['margin_ratio_ok']:
+                reasons.append(f"Margin ratio too high: {metrics.margin_ratio:.2f}")
+            if not checks['drawdown_ok']:
+                reasons.append("Max drawdown exceeded")
+            if not checks['daily_loss_ok']:
+                reasons.append("Daily loss limit (%) exceeded")
+            if not checks['max_positions_ok']:
+                reasons.append(
+                    f"Max open positions exceeded: {metrics.num_positions}/{self.max_open_positions}"
+                )
 
         # --- Force close margin (opt-in) --------------------------------------
         if self.force_close_margin is not None:
             if metrics.margin_ratio >= self.force_close_margin:
                 force_close_all = True
-                _escalate("force_close")
+                action = _more_severe(action, "force_close")
                 reasons.append(
                     f"Margin ratio {metrics.margin_ratio:.2%} >= force_close threshold "
                     f"{self.force_close_margin:.2%}"
@@ -329,7 +360,7 @@ class RiskManager:
         if self.force_close_leverage is not None:
             if metrics.leverage >= self.force_close_leverage:
                 force_close_all = True
-                _escalate("force_close")
+                action = _more_severe(action, "force_close")
                 reasons.append(
                     f"Leverage {metrics.leverage:.2f}x >= force_close threshold "
                     f"{self.force_close_leverage:.2f}x"
@@ -370,21 +401,19 @@ class RiskManager:
                         )
                 elif daily_pnl < 0 and abs(daily_pnl) >= self.daily_loss_limit:
                     stop_bot = True
-                    _escalate("stop_bot")
+                    action = _more_severe(action, "stop_bot")
                     reasons.append(
                         f"Daily loss ${abs(daily_pnl):.2f} >= limit ${self.daily_loss_limit:.2f}"
                     )
 
-        all_passed = action == 'none'
-
-        return {
-            'all_checks_passed': all_passed,
-            'action': action,
-            'force_close_all': force_close_all,
-            'stop_bot': stop_bot,
-            'reason': "; ".join(reasons) if reasons else "",
-            **checks,
-        }
+        # The per-call ``checks`` dict doubles as the result, so no second
+        # dict is built and merged on every risk check.
+        checks['all_checks_passed'] = action == 'none'
+        checks['action'] = action
+        checks['force_close_all'] = force_close_all
+        checks['stop_bot'] = stop_bot
+        checks['reason'] = "; ".join(reasons) if reasons else ""
+        return checks
 
     # ------------------------------------------------------------------ #
     #  Per-trade stop loss
@@ -453,8 +482,10 @@ class RiskManager:
     #  Position sizing
     # ------------------------------------------------------------------ #
 
-    def calculate_position_size_limit(self, coin: str, current_price: float) -> float:
-        metrics = self._get_cached_metrics()
+    def calculate_position_size_limit(self, coin: str, current_price: float,
+                                      metrics: Optional[RiskMetrics] = None) -> float:
+        if metrics is None:
+            metrics = self._get_cached_metrics()
         if not metrics:
             return 0
 
@@ -471,12 +502,14 @@ class RiskManager:
         return max_size
 
     def should_allow_new_position(self, coin: str, size: float, price: float) -> bool:
-        risk_checks = self.check_risk_limits()
+        # One metrics snapshot for both checks, even with METRICS_CACHE_TTL=0.
+        metrics = self._get_cached_metrics()
+        risk_checks = self._evaluate_risk_limits(metrics)
         if not risk_checks['all_checks_passed']:
             logger.warning(f"Risk check failed: {risk_checks.get('reason')}")
             return False
 
-        max_size = self.calculate_position_size_limit(coin, price)
+        max_size = self.calculate_position_size_limit(coin, price, metrics)
         if size > max_size:
             logger.warning(f"Position size {size} exceeds limit {max_size}")
             return False
@@ -492,7 +525,7 @@ class RiskManager:
         if not metrics:
             return {'status': 'No data available'}
 
-        risk_checks = self.check_risk_limits()
+        risk_checks = self._evaluate_risk_limits(metrics)
 
         summary = {
             'current_balance': metrics.total_balance,
@@ -1,11 +1,54 @@
+"""Trading strategies.
+
+Strategy classes are imported lazily (PEP 562) so that loading one
+strategy, e.g. ``strategies.market_making_strategy``, does not import
+every other strategy module as a side effect.
+"""
+
+import importlib
+from typing import Any
+
 from .base_strategy import BaseStrategy
-from .simple_ma_strategy import SimpleMAStrategy
-from .rsi_strategy import RSIStrategy
-from .bollinger_bands_strategy import BollingerBandsStrategy
-from .macd_strategy import MACDStrategy
-from .grid_trading_strategy import GridTradingStrategy
-from .breakout_strategy import BreakoutStrategy
-from .market_making_strategy import MarketMakingStrategy
+
+# Public class name -> submodule that defines it.
+_LAZY_CLASSES = {
+    'SimpleMAStrategy': 'simple_ma_strategy',
+    'RSIStrategy': 'rsi_strategy',
+    'BollingerBandsStrategy': 'bollinger_bands_strategy',
+    'MACDStrategy': 'macd_strategy',
+    'GridTradingStrategy': 'grid_trading_strategy',
+    'BreakoutStrategy': 'breakout_strategy',
+    'MarketMakingStrategy': 'market_making_strategy',
+}
+
+# CLI strategy name -> public class name.
+STRATEGY_CLASS_NAMES = {
+    'simple_ma': 'SimpleMAStrategy',
+    'rsi': 'RSIStrategy',
+    'bollinger_bands': 'BollingerBandsStrategy',
+    'macd': 'MACDStrategy',
+    'grid_trading': 'GridTradingStrategy',
+    'breakout': 'BreakoutStrategy',
+    'market_making': 'MarketMakingStrategy',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def load_strategy_class(strategy_name: str) -> type:
+    """Import and return the strategy class registered as *strategy_name*.
+
+    Raises ``KeyError`` for unknown names.
+    """
+    return __getattr__(STRATEGY_CLASS_NAMES[strategy_name])
+
 
 __all__ = [
     'BaseStrategy',
@@ -16,4 +59,6 @@ __all__ = [
     'GridTradingStrategy',
     'BreakoutStrategy',
     'MarketMakingStrategy',
+    'STRATEGY_CLASS_NAMES',
+    'load_strategy_class',
 ]
@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import logging
 import math
 import time
 import pandas as pd
 from market_data import MarketDataManager, MarketData
-from order_manager import OrderManager, OrderSide, round_price
+from order_manager import Order, OrderManager, OrderSide, round_price
 from position_closer import close_position_market
 from account_utils import get_account_snapshot
 from rate_limiter import API_ERRORS
@@ -30,6 +31,22 @@ class BaseStrategy(ABC):
         self._last_heartbeat: float = 0.0
         self._max_coin_status_display: int = config.get('max_coin_status_display', 10)
 
+        # Concurrent per-coin evaluation.  With ``signal_workers > 1`` the
+        # I/O-bound part of each cycle (close checks, candle fetches and
+        # indicator math) runs on a thread pool; order placement stays on
+        # the calling thread in coin order.  1 = fully sequential (legacy).
+        self._signal_workers: int = config.get('signal_workers', 1)
+        # Created on first use and kept for the strategy's lifetime so each
+        # cycle reuses warm worker threads; released by shutdown().
+        self._signal_pool: Optional[ThreadPoolExecutor] = None
+        # When True, signal orders are collected during run() and sent in a
+        # single bulk_orders call at the end of the cycle.
+        self._bulk_signal_orders: bool = config.get('bulk_signal_orders', False)
+        self._pending_orders: List[Order] = []
+        # Market data pinned per coin while execute_signal() runs, so sizing
+        # and limit pricing read one book snapshot instead of re-fetching.
+        self._md_snapshot: Dict[str, Optional[MarketData]] = {}
+
     @abstractmethod
     def generate_signals(self, coin: str) -> Optional[Dict]:
         pass
@@ -46,7 +63,7 @@ class BaseStrategy(ABC):
             if self._check_max_positions(coin):
                 return 0
 
-            market_data = self.market_data.get_market_data(coin)
+            market_data = self._signal_market_data(coin)
             if not market_data:
                 return 0
 
@@ -65,6 +82,18 @@ class BaseStrategy(ABC):
             logger.error(f"Error calculating position size for {coin}: {e}")
             return 0
 
+    def _signal_market_data(self, coin: str) -> Optional[MarketData]:
+        """Market data for *coin*, reusing the snapshot pinned by execute_signal().
+
+        Outside execute_signal() this is a plain ``get_market_data`` call.
+        """
+        market_data = self._md_snapshot.get(coin)
+        if market_data is None:
+            market_data = self.market_data.get_market_data(coin)
+            if coin in self._md_snapshot:
+                self._md_snapshot[coin] = market_data
+        return market_data
+
     def _adjust_size_usd(self, base_size_usd: float, signal: Dict,
                          market_data: 'MarketData') -> float:
         """Apply strategy-specific dynamic sizing. Override in subclasses."""
@@ -110,9 +139,18 @@ class BaseStrategy(ABC):
     # Shared signal helpers
     # ------------------------------------------------------------------ #
 
+    def _position_size(self, coin: str) -> float:
+        """Signed size of the open position in *coin*, 0.0 when there is none.
+
+        One lookup serves both the ``_has_position`` check (``!= 0``) and the
+        long-only check (``> 0``) the signal strategies make.
+        """
+        position = self.positions.get(coin)
+        return position['size'] if position is not None else 0.0
+
     def _has_position(self, coin: str) -> bool:
         """Return True if *coin* has a non-zero open position."""
-        return coin in self.positions and self.positions[coin]['size'] != 0
+        return self._position_size(coin) != 0
 
     def _get_candles_or_none(self, coin: str, min_periods: int,
                              interval: Optional[str] = None,
@@ -124,13 +162,17 @@ class BaseStrategy(ABC):
         """
         ival = interval or getattr(self, 'candle_interval', '15m')
         lb = lookback or getattr(self, 'lookback', min_periods + 10)
-        logger.debug(f"Fetching {lb} candles ({ival}) for {coin}")
+        # Per-coin, per-cycle debug lines: skip f-string formatting unless enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Fetching {lb} candles ({ival}) for {coin}")
         try:
             candles = self.market_data.get_candles(coin=coin, interval=ival, lookback=lb)
         except (API_ERRORS, ValueError, KeyError) as e:
             logger.warning(f"Failed to fetch candles for {coin}: {e}")
             return None
-        logger.debug(f"Got {len(candles)} candles for {coin}")
+        if debug:
+            logger.debug(f"Got {len(candles)} candles for {coin}")
         if len(candles) < min_periods:
             return None
         return candles
@@ -141,8 +183,10 @@ class BaseStrategy(ABC):
 
     def _check_max_positions(self, coin: str) -> bool:
         """Returns True (and logs) if already at max open positions for a new coin."""
+        if coin in self.positions:
+            return False
         max_pos = getattr(self, 'max_positions', None)
-        if max_pos is not None and len(self.positions) >= max_pos and coin not in self.positions:
+        if max_pos is not None and len(self.positions) >= max_pos:
             logger.info(f"Max positions reached, skipping {coin}")
             return True
         return False
@@ -173,6 +217,9 @@ class BaseStrategy(ABC):
         if not signal:
             return
 
+        # Pin lazily: the first _signal_market_data() call below fetches
+        # and every later one in this signal reuses it.
+        self._md_snapshot[coin] = None
         try:
             side = signal.get('side')
             if not side:
@@ -184,13 +231,17 @@ class BaseStrategy(ABC):
 
             position_size = self.market_data.round_size(coin, position_size)
 
-            market_data = self.market_data.get_market_data(coin)
+            market_data = self._signal_market_data(coin)
             if not market_data:
                 logger.warning(f"No market data available for {coin}")
                 return
 
+            # In bulk mode the order is only built here and sent with the
+            # rest of the cycle's orders by _flush_pending_orders().
+            bulk = self._bulk_signal_orders
             if signal.get('order_type') == 'market':
-                order = self.order_manager.create_market_order(
+                place = self.order_manager.build_market_order if bulk else self.order_manager.create_market_order
+                order = place(
                     coin=coin,
                     side=OrderSide.BUY if side == 'buy' else OrderSide.SELL,
                     size=position_size,
@@ -198,7 +249,8 @@ class BaseStrategy(ABC):
                 )
             else:
                 price = self._calculate_limit_price(market_data, side, coin)
-                order = self.order_manager.create_limit_order(
+                place = self.order_manager.build_limit_order if bulk else self.order_manager.create_limit_order
+                order = place(
                     coin=coin,
                     side=OrderSide.BUY if side == 'buy' else OrderSide.SELL,
                     size=position_size,
@@ -207,11 +259,15 @@ class BaseStrategy(ABC):
                     post_only=signal.get('post_only', True)
                 )
 
-            if order:
+            if order and bulk:
+                self._pending_orders.append(order)
+            elif order:
                 logger.info(f"Executed {side} order for {coin}: size={position_size}")
 
         except API_ERRORS as e:
             logger.error(f"Error executing signal for {coin}: {e}")
+        finally:
+            self._md_snapshot.pop(coin, None)
 
     def _calculate_limit_price(self, market_data: MarketData, side: str,
                                coin: Optional[str] = None) -> float:
@@ -239,22 +295,22 @@ class BaseStrategy(ABC):
             return False
 
         position = self.positions[coin]
-        market_data = self.market_data.get_market_data(coin)
-
-        if not market_data:
-            return False
-
         pnl_percent = (position['unrealized_pnl'] / position['margin_used']) * 100
 
         if pnl_percent >= self.config.get('take_profit_percent', 10):
-            logger.info(f"Take profit triggered for {coin}: {pnl_percent:.2f}%")
-            return True
+            reason = "Take profit"
+        elif pnl_percent <= -self.config.get('stop_loss_percent', 5):
+            reason = "Stop loss"
+        else:
+            return False
 
-        if pnl_percent <= -self.config.get('stop_loss_percent', 5):
-            logger.info(f"Stop loss triggered for {coin}: {pnl_percent:.2f}%")
-            return True
+        # The threshold check needs only the position, so the book is read
+        # for positions that would actually close, not every held coin.
+        if not self.market_data.get_market_data(coin):
+            return False
 
-        return False
+        logger.info(f"{reason} triggered for {coin}: {pnl_percent:.2f}%")
+        return True
 
     def close_position(self, coin: str) -> None:
         position = self.positions.get(coin)
@@ -280,27 +336,75 @@ class BaseStrategy(ABC):
             coin, position['size'], self.market_data, self.order_manager,
         )
 
+    def _evaluate_coin(self, coin: str) -> Tuple[bool, Optional[Dict]]:
+        """Return ``(should_close, signal)`` for *coin* without placing orders.
+
+        Read-only with respect to exchange state, so it is safe to call from
+        worker threads.  ``signal`` is ``None`` when the coin should close.
+        """
+        if self.should_close_position(coin):
+            return True, None
+        return False, self.generate_signals(coin)
+
+    def _evaluate_coins_concurrently(self, coins: List[str]) -> List[Tuple[bool, Optional[Dict]]]:
+        """Evaluate all *coins* on the persistent thread pool, preserving input order."""
+        if self._signal_pool is None:
+            self._signal_pool = ThreadPoolExecutor(
+                max_workers=self._signal_workers, thread_name_prefix='signal',
+            )
+        return list(self._signal_pool.map(self._evaluate_coin, coins))
+
+    def shutdown(self) -> None:
+        """Release the signal worker pool, if one was started."""
+        if self._signal_pool is not None:
+            self._signal_pool.shutdown(wait=False, cancel_futures=True)
+            self._signal_pool = None
+
+    def prepare_signals(self, coins: List[str]) -> None:
+        """Hook run once per cycle before per-coin evaluation.
+
+        Strategies can override this to compute indicators for all coins in
+        one batch.  The default does nothing.
+        """
+
     def run(self, coins: List[str]) -> None:
         self.update_positions()
+        self.prepare_signals(coins)
 
         signals_generated = 0
         signals_attempted = 0
         coin_statuses = []
 
-        for coin in coins:
-            if self.should_close_position(coin):
-                self.close_position(coin)
-                coin_statuses.append(f"{coin}:close")
-            else:
-                signal = self.generate_signals(coin)
-                signal = self._validate_signal(signal)
-                if signal:
-                    signals_generated += 1
-                    self.execute_signal(coin, signal)
-                    signals_attempted += 1
-                    coin_statuses.append(f"{coin}:{signal.get('side', '?')}")
+        evaluations = (
+            self._evaluate_coins_concurrently(coins)
+            if self._signal_workers > 1 and len(coins) > 1 else None
+        )
+
+        try:
+            for idx, coin in enumerate(coins):
+                should_close, signal = (
+                    evaluations[idx] if evaluations is not None else self._evaluate_coin(coin)
+                )
+                if should_close:
+                    self.close_position(coin)
+                    coin_statuses.append(f"{coin}:close")
                 else:
-                    coin_statuses.append(f"{coin}:{self._coin_status(coin)}")
+                    signal = self._validate_signal(signal)
+                    if signal:
+                        signals_generated += 1
+                        self.execute_signal(coin, signal)
+                        signals_attempted += 1
+                        coin_statuses.append(f"{coin}:{signal.get('side', '?')}")
+                    else:
+                        coin_statuses.append(f"{coin}:{self._coin_status(coin)}")
+
+            self._flush_pending_orders()
+        finally:
+            # Orders queued before an exception are priced off this cycle's
+            # mids; never let them carry over into the next cycle.
+            if self._pending_orders:
+                logger.warning(f"Discarding {len(self._pending_orders)} queued order(s) from a failed cycle")
+                self._pending_orders = []
 
         pos_count = len(self.positions)
 
@@ -319,6 +423,16 @@ class BaseStrategy(ABC):
         # monitoring tools that grep for "[heartbeat]")
         self._log_heartbeat(len(coins), signals_generated, signals_attempted)
 
+    def _flush_pending_orders(self) -> None:
+        """Send orders queued by :meth:`execute_signal` in one bulk request."""
+        if not self._pending_orders:
+            return
+        orders, self._pending_orders = self._pending_orders, []
+        results = self.order_manager.bulk_place_orders(orders)
+        for order, placed in zip(orders, results):
+            if placed:
+                logger.info(f"Executed {order.side.value} order for {order.coin}: size={order.size}")
+
     def _log_heartbeat(self, coins_checked: int, signals_generated: int,
                        signals_attempted: int) -> None:
         """Emit a periodic ``[heartbeat]`` log line for monitoring tools."""
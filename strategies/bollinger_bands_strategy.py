@@ -1,11 +1,16 @@
 import logging
 from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import rolling_mean, rolling_std
 from rate_limiter import API_ERRORS
 
 logger = logging.getLogger(__name__)
 
+# Band widths averaged by the squeeze breakout check.
+_BREAKOUT_BARS = 5
+
 
 class BollingerBandsStrategy(BaseStrategy):
     """Bollinger Bands mean-reversion and breakout strategy.
@@ -15,7 +20,7 @@ class BollingerBandsStrategy(BaseStrategy):
     the squeeze threshold.
     """
 
-    def __init__(self, market_data_manager, order_manager, config):
+    def __init__(self, market_data_manager, order_manager, config: Dict) -> None:
         super().__init__(market_data_manager, order_manager, config)
         self.bb_period = config.get('bb_period', 20)
         self.std_dev = config.get('std_dev', 2)
@@ -30,14 +35,38 @@ class BollingerBandsStrategy(BaseStrategy):
         self.low_band_width_threshold = config.get('low_band_width_threshold', 0.02)
         self.low_band_width_multiplier = config.get('low_band_width_multiplier', 1.2)
 
+    def _bands(self, closes: np.ndarray) -> Dict[str, np.ndarray]:
+        """Band arrays for *closes*, keyed by their DataFrame column names.
+
+        Runs on the arrays with the same float64 ops as the Series
+        expressions they replace.
+        """
+        sma = rolling_mean(closes, self.bb_period)
+        std = rolling_std(closes, self.bb_period)
+        offset = std * self.std_dev
+        upper = sma + offset
+        lower = sma - offset
+        spread = upper - lower
+        with np.errstate(divide='ignore', invalid='ignore'):
+            band_width = spread / sma
+            price_position = (closes - lower) / spread
+        return {
+            'sma': sma, 'std': std, 'upper_band': upper, 'lower_band': lower,
+            'band_width': band_width, 'price_position': price_position,
+        }
+
     def calculate_bollinger_bands(self, df: pd.DataFrame) -> pd.DataFrame:
-        df['sma'] = df['close'].rolling(window=self.bb_period).mean()
-        df['std'] = df['close'].rolling(window=self.bb_period).std()
-        df['upper_band'] = df['sma'] + (df['std'] * self.std_dev)
-        df['lower_band'] = df['sma'] - (df['std'] * self.std_dev)
-        df['band_width'] = (df['upper_band'] - df['lower_band']) / df['sma']
-        df['price_position'] = (df['close'] - df['lower_band']) / (df['upper_band'] - df['lower_band'])
-        return df
+        """Return *df* with the band columns appended.
+
+        The six columns are attached with one concat instead of six column
+        inserts, so the result is a new frame; band columns already on *df*
+        are replaced.
+        """
+        bands = pd.DataFrame(self._bands(df['close'].to_numpy(dtype=float)), index=df.index)
+        stale = df.columns.intersection(bands.columns)
+        if len(stale):
+            df = df.drop(columns=stale)
+        return pd.concat([df, bands], axis=1)
 
     def generate_signals(self, coin: str) -> Optional[Dict]:
         try:
@@ -45,20 +74,27 @@ class BollingerBandsStrategy(BaseStrategy):
             if candles is None:
                 return None
 
-            df = self.calculate_bollinger_bands(candles)
+            # The checks below read at most the last _BREAKOUT_BARS band
+            # widths, so compute the bands over just those windows instead
+            # of the full history.
+            closes = candles['close'].to_numpy(dtype=float)
+            tail = closes[-(self.bb_period + _BREAKOUT_BARS - 1):]
+            bands = self._bands(tail)
 
-            current_close = df['close'].iloc[-1]
-            current_upper = df['upper_band'].iloc[-1]
-            current_lower = df['lower_band'].iloc[-1]
-            current_sma = df['sma'].iloc[-1]
-            band_width = df['band_width'].iloc[-1]
-            price_position = df['price_position'].iloc[-1]
+            current_close = tail[-1]
+            current_upper = bands['upper_band'][-1]
+            current_lower = bands['lower_band'][-1]
+            current_sma = bands['sma'][-1]
+            band_width = bands['band_width'][-1]
+            price_position = bands['price_position'][-1]
 
-            prev_close = df['close'].iloc[-2]
-            prev_upper = df['upper_band'].iloc[-2]
-            prev_lower = df['lower_band'].iloc[-2]
+            prev_close = tail[-2]
+            prev_upper = bands['upper_band'][-2]
+            prev_lower = bands['lower_band'][-2]
 
-            has_position = self._has_position(coin)
+            position_size = self._position_size(coin)
+            has_position = position_size != 0
+            is_long = position_size > 0
 
             if prev_close >= prev_lower and current_close < current_lower:
                 if not has_position and band_width > self.squeeze_threshold:
@@ -72,7 +108,7 @@ class BollingerBandsStrategy(BaseStrategy):
                     }
 
             elif current_close < current_lower * 0.995:
-                if not self._has_position(coin):
+                if not has_position:
                     logger.info(f"BB strong oversold for {coin}: Price={current_close:.2f}, Lower={current_lower:.2f}")
                     return {
                         'side': 'buy',
@@ -82,7 +118,7 @@ class BollingerBandsStrategy(BaseStrategy):
                     }
 
             elif prev_close <= prev_upper and current_close > current_upper:
-                if self._has_position(coin) and self.positions[coin]['size'] > 0:
+                if is_long:
                     logger.info(f"BB upper band touch for {coin}: Price={current_close:.2f}, Upper={current_upper:.2f}")
                     return {
                         'side': 'sell',
@@ -92,7 +128,7 @@ class BollingerBandsStrategy(BaseStrategy):
                         'band_width': band_width,
                     }
 
-            elif self._has_position(coin) and self.positions[coin]['size'] > 0:
+            elif is_long:
                 if current_close > current_sma and price_position > 0.8:
                     return {
                         'side': 'sell',
@@ -103,8 +139,8 @@ class BollingerBandsStrategy(BaseStrategy):
                     }
 
             if band_width < self.squeeze_threshold:
-                volatility_signal = self._detect_volatility_breakout(df)
-                if volatility_signal and not self._has_position(coin):
+                volatility_signal = self._detect_volatility_breakout(bands['band_width'], tail)
+                if volatility_signal and not has_position:
                     volatility_signal['band_width'] = band_width
                     return volatility_signal
 
@@ -114,12 +150,17 @@ class BollingerBandsStrategy(BaseStrategy):
             logger.error(f"Error generating BB signals for {coin}: {e}")
             return None
 
-    def _detect_volatility_breakout(self, df: pd.DataFrame) -> Optional[Dict]:
-        recent_volatility = df['band_width'].iloc[-5:].mean()
-        current_volatility = df['band_width'].iloc[-1]
+    def _detect_volatility_breakout(self, band_width: np.ndarray, closes: np.ndarray) -> Optional[Dict]:
+        """Bullish breakout when the latest band width expands past its recent mean.
+
+        NaN widths (short history) are skipped in the mean, as
+        ``Series.mean()`` did.
+        """
+        recent_volatility = np.nanmean(band_width[-_BREAKOUT_BARS:])
+        current_volatility = band_width[-1]
 
         if current_volatility > recent_volatility * self.volatility_expansion_threshold:
-            price_movement = df['close'].iloc[-1] - df['close'].iloc[-2]
+            price_movement = closes[-1] - closes[-2]
             if price_movement > 0:
                 logger.info("Volatility expansion detected - bullish breakout")
                 return {
@@ -1,13 +1,54 @@
 import logging
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 import pandas as pd
 import numpy as np
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import rolling_mean, true_range
 from rate_limiter import API_ERRORS
 
 logger = logging.getLogger(__name__)
 
 
+def _pivot_values(values: np.ndarray, pw: int, reduce: np.ufunc) -> List[float]:
+    """Return ``values[i]`` for bars that equal the extreme of ``values[i-pw:i+pw]``.
+
+    Vectorised over a sliding window instead of a per-bar Python loop.
+    *reduce* is ``np.fmax`` (pivot highs) or ``np.fmin`` (pivot lows); the
+    ``fmax``/``fmin`` variants skip NaN like ``Series.max``/``min`` did.
+    """
+    n = len(values) - 2 * pw
+    if pw <= 0 or n <= 0:
+        return []
+    windows = np.lib.stride_tricks.sliding_window_view(values, 2 * pw)[:n]
+    centre = values[pw:pw + n]
+    return centre[centre == reduce.reduce(windows, axis=1)].tolist()
+
+
+def _last_window_extreme(values: np.ndarray, window: int, reduce: Callable) -> float:
+    """``rolling(window).max()/.min()`` at the last bar, without the full series.
+
+    NaN with fewer than *window* bars; a NaN inside the window propagates,
+    as it leaves pandas short of ``min_periods``.
+    """
+    if window <= 0 or len(values) < window:
+        return np.nan
+    return float(reduce(values[-window:]))
+
+
+def _most_frequent_level(pivots: Sequence[float]) -> Optional[float]:
+    """Most common pivot rounded to 2 dp; ties go to the first seen, or None.
+
+    ``np.unique`` orders levels by value, so ties are broken on each
+    level's first index rather than taking ``counts.argmax()`` directly.
+    """
+    rounded = np.round(np.asarray(pivots, dtype=float), 2)
+    if not rounded.size:
+        return None
+    levels, first, counts = np.unique(rounded, return_index=True, return_counts=True)
+    tied = np.flatnonzero(counts == counts.max())
+    return float(levels[tied[first[tied].argmin()]])
+
+
 class BreakoutStrategy(BaseStrategy):
     """Support/resistance breakout strategy.
 
@@ -16,7 +57,7 @@ class BreakoutStrategy(BaseStrategy):
     Uses ATR-based stop losses and dynamic position sizing.
     """
 
-    def __init__(self, market_data_manager, order_manager, config):
+    def __init__(self, market_data_manager, order_manager, config: Dict) -> None:
         super().__init__(market_data_manager, order_manager, config)
         self.lookback_period = config.get('lookback_period', 20)
         self.volume_multiplier = config.get('volume_multiplier', 1.5)
@@ -37,71 +78,59 @@ class BreakoutStrategy(BaseStrategy):
         self.support_resistance_levels = {}
 
     def calculate_atr(self, df: pd.DataFrame) -> pd.DataFrame:
-        high_low = df['high'] - df['low']
-        high_close = np.abs(df['high'] - df['close'].shift())
-        low_close = np.abs(df['low'] - df['close'].shift())
-
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = np.max(ranges, axis=1)
-        df['atr'] = true_range.rolling(self.atr_period).mean()
+        tr = true_range(
+            df['high'].to_numpy(dtype=float),
+            df['low'].to_numpy(dtype=float),
+            df['close'].to_numpy(dtype=float),
+        )
+        df['atr'] = rolling_mean(tr, self.atr_period)
         return df
 
-    def identify_support_resistance(self, df: pd.DataFrame) -> Dict:
-        highs = df['high'].rolling(window=self.lookback_period).max()
-        lows = df['low'].rolling(window=self.lookback_period).min()
+    def _latest_atr(self, df: pd.DataFrame) -> float:
+        """``calculate_atr(df)['atr'].iloc[-1]`` from the last ``atr_period + 1`` bars.
 
-        current_resistance = highs.iloc[-1]
-        current_support = lows.iloc[-1]
+        The extra bar supplies the previous close for the first true range in
+        the window, so the value is identical to the full-history column.
+        """
+        n = self.atr_period + 1
+        tr = true_range(
+            df['high'].to_numpy(dtype=float)[-n:],
+            df['low'].to_numpy(dtype=float)[-n:],
+            df['close'].to_numpy(dtype=float)[-n:],
+        )
+        return rolling_mean(tr, self.atr_period)[-1]
 
-        pivot_highs = []
-        pivot_lows = []
+    def identify_support_resistance(self, df: pd.DataFrame) -> Dict:
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
 
         pw = self.pivot_window
-        for i in range(pw, len(df) - pw):
-            if df['high'].iloc[i] == max(df['high'].iloc[i-pw:i+pw]):
-                pivot_highs.append(df['high'].iloc[i])
-            if df['low'].iloc[i] == min(df['low'].iloc[i-pw:i+pw]):
-                pivot_lows.append(df['low'].iloc[i])
-
-        strong_resistance = None
-        strong_support = None
-
-        if pivot_highs:
-            resistance_counts = {}
-            for high in pivot_highs:
-                rounded = round(high, 2)
-                resistance_counts[rounded] = resistance_counts.get(rounded, 0) + 1
-            strong_resistance = max(resistance_counts, key=resistance_counts.get)
-
-        if pivot_lows:
-            support_counts = {}
-            for low in pivot_lows:
-                rounded = round(low, 2)
-                support_counts[rounded] = support_counts.get(rounded, 0) + 1
-            strong_support = max(support_counts, key=support_counts.get)
-
         return {
-            'resistance': current_resistance,
-            'support': current_support,
-            'strong_resistance': strong_resistance,
-            'strong_support': strong_support
+            'resistance': _last_window_extreme(high, self.lookback_period, np.max),
+            'support': _last_window_extreme(low, self.lookback_period, np.min),
+            'strong_resistance': _most_frequent_level(_pivot_values(high, pw, np.fmax)),
+            'strong_support': _most_frequent_level(_pivot_values(low, pw, np.fmin)),
         }
 
-    def detect_breakout(self, df: pd.DataFrame, levels: Dict) -> Optional[str]:
-        recent_bars = df.iloc[-self.breakout_confirmation_bars:]
-        current_close = df['close'].iloc[-1]
-        current_volume = df['volume'].iloc[-1]
-        avg_volume = df['volume'].iloc[-self.avg_volume_lookback:].mean()
+    def detect_breakout(self, closes: np.ndarray, volumes: np.ndarray, levels: Dict) -> Optional[str]:
+        """Classify the latest bars against *levels* (close/volume arrays, oldest first)."""
+        recent_closes = closes[-self.breakout_confirmation_bars:]
+        current_close = closes[-1]
+        current_volume = volumes[-1]
+        # nanmean: Series.mean() skipped NaN volumes
+        avg_volume = np.nanmean(volumes[-self.avg_volume_lookback:])
 
         if current_volume < avg_volume * self.volume_multiplier:
             return None
 
-        if levels['resistance'] and all(recent_bars['close'] > levels['resistance']):
+        # min()/max() of the window is NaN when any close is, failing the
+        # comparison just as all() over the element-wise test did.
+        if levels['resistance'] and recent_closes.min() > levels['resistance']:
             if levels['strong_resistance'] and current_close > levels['strong_resistance']:
                 return 'strong_bullish'
             return 'bullish'
 
-        if levels['support'] and all(recent_bars['close'] < levels['support']):
+        if levels['support'] and recent_closes.max() < levels['support']:
             if levels['strong_support'] and current_close < levels['strong_support']:
                 return 'strong_bearish'
             return 'bearish'
@@ -118,18 +147,22 @@ class BreakoutStrategy(BaseStrategy):
             if candles is None:
                 return None
 
-            df = self.calculate_atr(candles)
-            levels = self.identify_support_resistance(df)
+            levels = self.identify_support_resistance(candles)
 
             if coin not in self.support_resistance_levels:
                 self.support_resistance_levels[coin] = levels
             else:
                 self.support_resistance_levels[coin].update(levels)
 
-            breakout_type = self.detect_breakout(df, levels)
-            atr = df['atr'].iloc[-1]
+            closes = candles['close'].to_numpy(dtype=float)
+            breakout_type = self.detect_breakout(
+                closes, candles['volume'].to_numpy(dtype=float), levels,
+            )
+            # Only the latest ATR is used, so skip the full-history column.
+            atr = self._latest_atr(candles)
 
-            has_position = self._has_position(coin)
+            position_size = self._position_size(coin)
+            has_position = position_size != 0
 
             if breakout_type in ['bullish', 'strong_bullish'] and not has_position:
                 confidence = 0.7 if breakout_type == 'bullish' else 0.85
@@ -144,7 +177,7 @@ class BreakoutStrategy(BaseStrategy):
                 }
 
             elif (breakout_type in ['bearish', 'strong_bearish']
-                  and self._has_position(coin) and self.positions[coin]['size'] > 0):
+                  and position_size > 0):
                 confidence = 0.75 if breakout_type == 'bearish' else 0.9
                 logger.info(f"{breakout_type.upper()} breakout detected for {coin} below {levels['support']:.2f}")
                 return {
@@ -156,9 +189,9 @@ class BreakoutStrategy(BaseStrategy):
                     'atr': atr,
                 }
 
-            if self._has_position(coin) and self.positions[coin]['size'] > 0:
+            if position_size > 0:
                 entry_price = self.positions[coin]['entry_price']
-                current_price = df['close'].iloc[-1]
+                current_price = closes[-1]
 
                 if current_price < entry_price - (atr * self.position_stop_loss_atr_multiplier):
                     logger.info(f"Stop loss triggered for {coin}")
@@ -1,3 +1,4 @@
+import bisect
 import logging
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
@@ -9,6 +10,41 @@ from order_manager import round_price
 logger = logging.getLogger(__name__)
 
 
+class _GridSide:
+    """One side of a grid's levels, ascending by price, for bisect lookups.
+
+    *thresholds* are the trigger prices the signal loop compares against
+    (``grid_price * 1.001`` for buys, ``* 0.999`` for sells); multiplying by
+    a positive constant keeps them sorted.  *keys* are the ``filled_orders``
+    keys, formatted once here instead of on every tick.
+    """
+
+    __slots__ = ('positions', 'prices', 'thresholds', 'keys')
+
+    def __init__(self, levels: List[Tuple[str, float]], side: str, factor: float) -> None:
+        entries = [(pos, price) for pos, (order_type, price) in enumerate(levels) if order_type == side]
+        self.positions = [pos for pos, _ in entries]
+        self.prices = [price for _, price in entries]
+        self.thresholds = [price * factor for price in self.prices]
+        self.keys = [f"{side}_{price:.2f}" for price in self.prices]
+
+    def first_unfilled(self, start: int, stop: int, filled: Dict) -> Optional[int]:
+        for i in range(start, stop):
+            if self.keys[i] not in filled:
+                return i
+        return None
+
+
+def _grid_sides(grid_info: Dict) -> Tuple[_GridSide, _GridSide]:
+    """Buy/sell lookup tables for *grid_info*, built once per set of levels."""
+    sides = grid_info.get('sides')
+    if sides is None:
+        levels = grid_info['levels']
+        sides = (_GridSide(levels, 'buy', 1.001), _GridSide(levels, 'sell', 0.999))
+        grid_info['sides'] = sides
+    return sides
+
+
 class GridTradingStrategy(BaseStrategy):
     """Grid trading strategy for ranging markets.
 
@@ -17,7 +53,7 @@ class GridTradingStrategy(BaseStrategy):
     Automatically recalculates grid levels when the market moves.
     """
 
-    def __init__(self, market_data_manager, order_manager, config):
+    def __init__(self, market_data_manager, order_manager, config: Dict) -> None:
         super().__init__(market_data_manager, order_manager, config)
         self.grid_levels = config.get('grid_levels', 10)
         self.grid_spacing_pct = config.get('grid_spacing_pct', 0.5)
@@ -35,14 +71,18 @@ class GridTradingStrategy(BaseStrategy):
         self.active_grids = {}
 
     def calculate_price_range(self, df: pd.DataFrame) -> Dict:
-        high = df['high'].max()
-        low = df['low'].min()
-        current_price = df['close'].iloc[-1]
+        # NumPy reductions over the columns; for NaN-free candles they equal
+        # the pandas max/min/pct_change().std() they replace.
+        closes = df['close'].to_numpy(dtype=float)
+        high = df['high'].to_numpy(dtype=float).max()
+        low = df['low'].to_numpy(dtype=float).min()
+        current_price = closes[-1]
 
         range_size = high - low
         range_pct = (range_size / current_price) * 100
 
-        volatility = df['close'].pct_change().std() * np.sqrt(len(df))
+        returns = closes[1:] / closes[:-1] - 1
+        volatility = (returns.std(ddof=1) if len(returns) > 1 else np.nan) * np.sqrt(len(df))
 
         return {
             'high': high,
@@ -58,18 +98,16 @@ class GridTradingStrategy(BaseStrategy):
         current_price = price_range['current']
         grid_interval = current_price * (self.grid_spacing_pct / 100)
 
-        grid_prices = []
-
-        for i in range(self.grid_levels // 2):
-            buy_price = current_price - (grid_interval * (i + 1))
-            sell_price = current_price + (grid_interval * (i + 1))
+        offsets = np.arange(1, self.grid_levels // 2 + 1) * grid_interval
+        buys = current_price - offsets
+        sells = current_price + offsets
+        buys = buys[buys > price_range['low'] * self.grid_boundary_margin_low]
+        sells = sells[sells < price_range['high'] * self.grid_boundary_margin_high]
 
-            if buy_price > price_range['low'] * self.grid_boundary_margin_low:
-                grid_prices.append(('buy', buy_price))
-            if sell_price < price_range['high'] * self.grid_boundary_margin_high:
-                grid_prices.append(('sell', sell_price))
-
-        return sorted(grid_prices, key=lambda x: x[1])
+        # With a positive spacing every buy sits below every sell, so the
+        # descending buys reversed and then the sells are already sorted.
+        return ([('buy', price) for price in buys[::-1].tolist()]
+                + [('sell', price) for price in sells.tolist()])
 
     def generate_signals(self, coin: str) -> Optional[Dict]:
         try:
@@ -106,38 +144,47 @@ class GridTradingStrategy(BaseStrategy):
 
             grid_info = self.active_grids[coin]
 
-            for order_type, grid_price in grid_info['levels']:
-                price_key = f"{order_type}_{grid_price:.2f}"
-
-                if price_key in grid_info['filled_orders']:
-                    continue
-
-                if order_type == 'buy' and current_price <= grid_price * 1.001:
-                    if len(self.positions) < self.max_positions:
-                        logger.info(f"Grid buy signal for {coin} at {grid_price:.2f}")
-                        grid_info['filled_orders'][price_key] = True
-                        return {
-                            'side': 'buy',
-                            'order_type': 'limit',
-                            'post_only': True,
-                            'confidence': 0.6,
-                            'grid_price': grid_price
-                        }
-
-                elif order_type == 'sell' and current_price >= grid_price * 0.999:
-                    if coin in self.positions and self.positions[coin]['size'] > 0:
-                        logger.info(f"Grid sell signal for {coin} at {grid_price:.2f}")
-                        grid_info['filled_orders'][price_key] = True
-                        return {
-                            'side': 'sell',
-                            'order_type': 'limit',
-                            'post_only': True,
-                            'reduce_only': True,
-                            'confidence': 0.6,
-                            'grid_price': grid_price
-                        }
-
-            # Check if grid needs recalculation
+            # Same choice as scanning the price-sorted levels for the first
+            # unfilled one that triggers: the lowest buy at or above the
+            # price and the lowest sell at or below it, whichever comes first.
+            buys, sells = _grid_sides(grid_info)
+            filled = grid_info['filled_orders']
+            buy = sell = None
+            if len(self.positions) < self.max_positions:
+                buy = buys.first_unfilled(
+                    bisect.bisect_left(buys.thresholds, current_price), len(buys.prices), filled)
+            if self._position_size(coin) > 0:
+                sell = sells.first_unfilled(
+                    0, bisect.bisect_right(sells.thresholds, current_price), filled)
+
+            if buy is not None and (sell is None or buys.positions[buy] < sells.positions[sell]):
+                grid_price = buys.prices[buy]
+                logger.info(f"Grid buy signal for {coin} at {grid_price:.2f}")
+                filled[buys.keys[buy]] = True
+                return {
+                    'side': 'buy',
+                    'order_type': 'limit',
+                    'post_only': True,
+                    'confidence': 0.6,
+                    'grid_price': grid_price
+                }
+
+            if sell is not None:
+                grid_price = sells.prices[sell]
+                logger.info(f"Grid sell signal for {coin} at {grid_price:.2f}")
+                filled[sells.keys[sell]] = True
+                return {
+                    'side': 'sell',
+                    'order_type': 'limit',
+                    'post_only': True,
+                    'reduce_only': True,
+                    'confidence': 0.6,
+                    'grid_price': grid_price
+                }
+
+            # Check if grid needs recalculation.  The candle window has a
+            # fixed length and slides, so the bar count comes from where the
+            # stored timestamp now sits; get_loc on the sorted index is cheap.
             try:
                 bars_since_update = (
                     len(candles) - candles.index.get_loc(grid_info['last_update'])
@@ -185,14 +232,14 @@ class GridTradingStrategy(BaseStrategy):
             return round_price(self._current_signal['grid_price'], sz_dec, perp)
         return super()._calculate_limit_price(market_data, side, coin)
 
-    def execute_signal(self, coin: str, signal: Dict):
+    def execute_signal(self, coin: str, signal: Dict) -> None:
         self._current_signal = signal
         super().execute_signal(coin, signal)
         self._current_signal = None
 
     def calculate_position_size(self, coin: str, signal: Dict) -> float:
         try:
-            market_data = self.market_data.get_market_data(coin)
+            market_data = self._signal_market_data(coin)
             if not market_data:
                 return 0
 
@@ -0,0 +1,127 @@
+"""NumPy indicator kernels shared by the signal strategies.
+
+Each function takes and returns plain ``float64`` arrays so strategies can
+compute indicators without building intermediate pandas Series.  Results
+follow the pandas expressions they replace (``rolling(window).mean()``
+etc.): the first ``window - 1`` entries are NaN and a NaN inside a window
+makes that window NaN.
+
+The kernels are plain NumPy rather than JIT-compiled: there is no
+compile step, so the first tick after start-up costs about the same as
+later ones (a few hundred microseconds of one-off NumPy dispatch setup)
+and nothing needs warming or caching across restarts.
+
+There are deliberately no optional accelerated backends (Numba, SciPy
+``lfilter``): their float rounding differs slightly from these kernels, and
+signals must not depend on which extra packages happen to be installed.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _windows(values: np.ndarray, window: int) -> np.ndarray:
+    return sliding_window_view(np.asarray(values, dtype=float), window)
+
+
+def _pad(result: np.ndarray, n: int) -> np.ndarray:
+    """Left-pad *result* with NaN to length *n*."""
+    out = np.full(n, np.nan)
+    if len(result):
+        out[n - len(result):] = result
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average over complete windows."""
+    n = len(values)
+    if n < window:
+        return np.full(n, np.nan)
+    return _pad(_windows(values, window).mean(axis=-1), n)
+
+
+def rolling_mean_matrix(closes: np.ndarray, window: int) -> np.ndarray:
+    """Row-wise simple moving average of a ``(n_coins, n_bars)`` array.
+
+    Returns shape ``(n_coins, n_bars - window + 1)``; column ``j`` is the
+    mean of bars ``j .. j + window - 1``, i.e. only complete windows.
+    """
+    return sliding_window_view(closes, window, axis=1).mean(axis=-1)
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Sample (``ddof=1``) rolling standard deviation.
+
+    Constant windows give exactly 0, as pandas does, rather than rounding
+    noise from the mean.
+    """
+    n = len(values)
+    if n < window:
+        return np.full(n, np.nan)
+    win = _windows(values, window)
+    std = win.std(axis=-1, ddof=1)
+    std[np.ptp(win, axis=-1) == 0] = 0.0
+    return _pad(std, n)
+
+
+def rsi(closes: np.ndarray, period: int) -> np.ndarray:
+    """Simple-average RSI; NaN where the average loss is 0.
+
+    The first bar's change counts as 0, matching
+    ``delta.where(delta > 0, 0)`` on a ``diff()`` with a leading NaN.
+    """
+    closes = np.asarray(closes, dtype=float)
+    delta = np.diff(closes, prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = rolling_mean(gain, period)
+    avg_loss = rolling_mean(loss, period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)
+    return 100 - (100 / (1 + rs))
+
+
+def rsi_matrix(closes: np.ndarray, period: int) -> np.ndarray:
+    """Row-wise RSI of a ``(n_coins, n_bars)`` array over complete windows.
+
+    Returns shape ``(n_coins, n_bars - period)``; column ``j`` is the RSI of
+    the *period* changes ending at bar ``j + period``, the same value
+    :func:`rsi` gives for that bar.
+    """
+    delta = np.diff(closes, axis=1)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = rolling_mean_matrix(gain, period)
+    avg_loss = rolling_mean_matrix(loss, period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)
+    return 100 - (100 / (1 + rs))
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Per-bar true range; the first bar, with no previous close, uses high - low."""
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    prev_close = np.concatenate(([np.nan], np.asarray(close, dtype=float)[:-1]))
+    # Pairwise fmax into one buffer rather than stacking a 3 x n temporary.
+    tr = high - low
+    np.fmax(tr, np.abs(high - prev_close), out=tr)
+    np.fmax(tr, np.abs(low - prev_close), out=tr)
+    return tr
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Recursive EMA, ``ewm(span=span, adjust=False).mean()`` for NaN-free input.
+
+    The recurrence is sequential, so it runs over Python floats; for the
+    window a strategy looks at that is well under the cost of building a
+    pandas EWM object.  ``alpha`` is derived once per call, outside the
+    loop, so there is nothing further to hoist per instance.
+    """
+    alpha = 2.0 / (span + 1)
+    out = np.empty(len(values))
+    level = None
+    for i, x in enumerate(np.asarray(values, dtype=float).tolist()):
+        level = x if level is None else level + alpha * (x - level)
+        out[i] = level
+    return out
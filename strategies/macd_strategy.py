@@ -1,12 +1,30 @@
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import ema
 from rate_limiter import API_ERRORS
 
 logger = logging.getLogger(__name__)
 
 
+def _two_extremes(values: np.ndarray, largest: bool) -> Optional[Tuple[int, int]]:
+    """Positions of the two largest/smallest values in bar order, or None.
+
+    Matches ``nlargest(2)``/``nsmallest(2)``: NaN is skipped and ties go to
+    the earlier bar (a stable sort), which matters when the runner-up value
+    repeats.  ``argpartition`` would be cheaper but does not keep that tie
+    order.
+    """
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) < 2:
+        return None
+    keys = -values[valid] if largest else values[valid]
+    first, second = valid[np.argsort(keys, kind='stable')[:2]]
+    return (first, second) if first < second else (second, first)
+
+
 class MACDStrategy(BaseStrategy):
     """MACD crossover strategy with divergence detection.
 
@@ -15,7 +33,7 @@ class MACDStrategy(BaseStrategy):
     divergence is detected against the histogram.
     """
 
-    def __init__(self, market_data_manager, order_manager, config):
+    def __init__(self, market_data_manager, order_manager, config: Dict) -> None:
         super().__init__(market_data_manager, order_manager, config)
         self.fast_ema = config.get('fast_ema', 12)
         self.slow_ema = config.get('slow_ema', 26)
@@ -30,39 +48,73 @@ class MACDStrategy(BaseStrategy):
         self.histogram_multiplier_high = config.get('histogram_multiplier_high', 1.3)
         self.histogram_multiplier_low = config.get('histogram_multiplier_low', 0.7)
 
-    def calculate_macd(self, df: pd.DataFrame) -> pd.DataFrame:
-        df['ema_fast'] = df['close'].ewm(span=self.fast_ema, adjust=False).mean()
-        df['ema_slow'] = df['close'].ewm(span=self.slow_ema, adjust=False).mean()
-        df['macd_line'] = df['ema_fast'] - df['ema_slow']
-        df['signal_line'] = df['macd_line'].ewm(span=self.signal_ema, adjust=False).mean()
-        df['macd_histogram'] = df['macd_line'] - df['signal_line']
-
-        df['macd_pct'] = (df['macd_line'] / df['close']) * 100
-        df['histogram_pct'] = (df['macd_histogram'] / df['close']) * 100
+    def _macd_columns(self, closes: np.ndarray) -> Dict[str, np.ndarray]:
+        """MACD arrays for *closes*, keyed by their DataFrame column names.
+
+        :meth:`generate_signals` reads these directly; only
+        :meth:`calculate_macd` wraps them in a frame.
+        """
+        ema_fast = ema(closes, self.fast_ema)
+        ema_slow = ema(closes, self.slow_ema)
+        macd_line = ema_fast - ema_slow
+        signal_line = ema(macd_line, self.signal_ema)
+        histogram = macd_line - signal_line
+        with np.errstate(divide='ignore', invalid='ignore'):
+            macd_pct = (macd_line / closes) * 100
+            histogram_pct = (histogram / closes) * 100
+        return {
+            'ema_fast': ema_fast,
+            'ema_slow': ema_slow,
+            'macd_line': macd_line,
+            'signal_line': signal_line,
+            'macd_histogram': histogram,
+            'macd_pct': macd_pct,
+            'histogram_pct': histogram_pct,
+        }
 
-        return df
+    def calculate_macd(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return *df* with the MACD columns appended.
+
+        All seven columns are computed on arrays and attached with one
+        concat instead of seven column inserts, so the result is a new
+        frame; MACD columns already on *df* are replaced.
+        """
+        columns = pd.DataFrame(self._macd_columns(df['close'].to_numpy(dtype=float)), index=df.index)
+        stale = df.columns.intersection(columns.columns)
+        if len(stale):
+            df = df.drop(columns=stale)
+        return pd.concat([df, columns], axis=1)
 
     def detect_divergence(self, df: pd.DataFrame, lookback: int = None) -> Dict:
         if lookback is None:
             lookback = self.divergence_lookback
-        recent_df = df.iloc[-lookback:]
-
-        price_highs_idx = recent_df['high'].nlargest(2).index
-        price_lows_idx = recent_df['low'].nsmallest(2).index
+        return self._divergence(
+            df['high'].to_numpy(dtype=float),
+            df['low'].to_numpy(dtype=float),
+            df['macd_histogram'].to_numpy(dtype=float),
+            lookback,
+        )
+
+    @staticmethod
+    def _divergence(highs: np.ndarray, lows: np.ndarray, histogram: np.ndarray,
+                    lookback: int) -> Dict:
+        highs = highs[-lookback:]
+        lows = lows[-lookback:]
+        histogram = histogram[-lookback:]
 
         bullish_divergence = False
         bearish_divergence = False
 
-        if len(price_lows_idx) >= 2:
-            idx1, idx2 = sorted(price_lows_idx)
-            if (recent_df.loc[idx2, 'low'] < recent_df.loc[idx1, 'low'] and
-                    recent_df.loc[idx2, 'macd_histogram'] > recent_df.loc[idx1, 'macd_histogram']):
+        pair = _two_extremes(lows, largest=False)
+        if pair is not None:
+            i1, i2 = pair
+            if lows[i2] < lows[i1] and histogram[i2] > histogram[i1]:
                 bullish_divergence = True
 
-        if len(price_highs_idx) >= 2:
-            idx1, idx2 = sorted(price_highs_idx)
-            if (recent_df.loc[idx2, 'high'] > recent_df.loc[idx1, 'high'] and
-                    recent_df.loc[idx2, 'macd_histogram'] < recent_df.loc[idx1, 'macd_histogram']):
+        pair = _two_extremes(highs, largest=True)
+        if pair is not None:
+            i1, i2 = pair
+            if highs[i2] > highs[i1] and histogram[i2] < histogram[i1]:
                 bearish_divergence = True
 
         return {
@@ -76,23 +128,29 @@ class MACDStrategy(BaseStrategy):
             if candles is None:
                 return None
 
-            df = self.calculate_macd(candles)
-
-            current_macd = df['macd_line'].iloc[-1]
-            current_signal = df['signal_line'].iloc[-1]
-            current_histogram = df['macd_histogram'].iloc[-1]
-
-            prev_macd = df['macd_line'].iloc[-2]
-            prev_signal = df['signal_line'].iloc[-2]
-            prev_histogram = df['macd_histogram'].iloc[-2]
+            # Read the latest two bars once, as floats, from the indicator
+            # arrays rather than via per-value Series.iloc lookups on a frame.
+            # The branching below then compares plain Python floats; the
+            # EMA recurrences above dominate the cost of this method.
+            closes = candles['close'].to_numpy(dtype=float)
+            macd = self._macd_columns(closes)
+            prev_macd, current_macd = macd['macd_line'][-2:].tolist()
+            prev_signal, current_signal = macd['signal_line'][-2:].tolist()
+            prev_histogram, current_histogram = macd['macd_histogram'][-2:].tolist()
 
             histogram_increasing = current_histogram > prev_histogram
             histogram_positive = current_histogram > 0
 
-            histogram_strength = abs(df['histogram_pct'].iloc[-1])
-            divergence = self.detect_divergence(df)
+            histogram_strength = abs(float(macd['histogram_pct'][-1]))
+            divergence = self._divergence(
+                candles['high'].to_numpy(dtype=float),
+                candles['low'].to_numpy(dtype=float),
+                macd['macd_histogram'],
+                self.divergence_lookback,
+            )
 
-            has_position = self._has_position(coin)
+            position_size = self._position_size(coin)
+            has_position = position_size != 0
 
             if prev_macd <= prev_signal and current_macd > current_signal:
                 if not has_position and current_macd < 0:
@@ -109,7 +167,7 @@ class MACDStrategy(BaseStrategy):
                         'histogram_strength': histogram_strength,
                     }
 
-            elif not self._has_position(coin) and divergence['bullish_divergence'] and histogram_increasing:
+            elif not has_position and divergence['bullish_divergence'] and histogram_increasing:
                 logger.info(f"MACD bullish divergence signal for {coin}")
                 return {
                     'side': 'buy',
@@ -120,7 +178,7 @@ class MACDStrategy(BaseStrategy):
                 }
 
             elif prev_macd >= prev_signal and current_macd < current_signal:
-                if self._has_position(coin) and self.positions[coin]['size'] > 0:
+                if position_size > 0:
                     logger.info(f"MACD bearish crossover for {coin}: MACD={current_macd:.4f}")
                     confidence = 0.75
                     if divergence['bearish_divergence']:
@@ -134,7 +192,7 @@ class MACDStrategy(BaseStrategy):
                         'histogram_strength': histogram_strength,
                     }
 
-            elif self._has_position(coin) and self.positions[coin]['size'] > 0:
+            elif position_size > 0:
                 if not histogram_positive and not histogram_increasing:
                     return {
                         'side': 'sell',
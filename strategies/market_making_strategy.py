@@ -530,8 +530,9 @@ class MarketMakingStrategy(BaseStrategy):
                 cooldown_deadline = self._coin_cooldown_until.get(coin)
                 now = time.monotonic()
                 if cooldown_deadline and now < cooldown_deadline:
-                    remaining = cooldown_deadline - now
-                    logger.debug(f"[mm] {coin} in cooldown ({remaining:.0f}s left)")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        remaining = cooldown_deadline - now
+                        logger.debug(f"[mm] {coin} in cooldown ({remaining:.0f}s left)")
                     continue
                 elif cooldown_deadline:
                     # Cooldown expired — reset
@@ -833,12 +834,13 @@ class MarketMakingStrategy(BaseStrategy):
             prices = ideal_prices
 
         buy_price, sell_price, skew = prices
-        if skew != 0.0:
+        if skew != 0.0 and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"[mm] Inventory skew {coin}: {skew:.1f}bps")
 
         size = self.calculate_position_size(coin, {})
         if size <= 0:
-            logger.debug(f"[mm] Position size is 0 for {coin}, skipping")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[mm] Position size is 0 for {coin}, skipping")
             return
 
         size = self.market_data.round_size(coin, size)
@@ -866,10 +868,12 @@ class MarketMakingStrategy(BaseStrategy):
                 imb = market_data.book_imbalance
                 if imb < -self.imbalance_threshold:
                     skip_buy = True
-                    logger.debug(f"[mm] {coin} skipping BUY (book imbalance {imb:.2f})")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"[mm] {coin} skipping BUY (book imbalance {imb:.2f})")
                 elif imb > self.imbalance_threshold:
                     skip_sell = True
-                    logger.debug(f"[mm] {coin} skipping SELL (book imbalance {imb:.2f})")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"[mm] {coin} skipping SELL (book imbalance {imb:.2f})")
 
         # Per-coin position cap: suppress same-direction entries once
         # accumulated |position| × mid_price reaches the cap. Opposite-side
@@ -1,8 +1,8 @@
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
-import numpy as np
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import rsi, rsi_matrix
 from rate_limiter import API_ERRORS
 
 logger = logging.getLogger(__name__)
@@ -16,7 +16,7 @@ class RSIStrategy(BaseStrategy):
     increases size at extreme RSI readings.
     """
 
-    def __init__(self, market_data_manager, order_manager, config):
+    def __init__(self, market_data_manager, order_manager, config: Dict) -> None:
         super().__init__(market_data_manager, order_manager, config)
         self.rsi_period = config.get('rsi_period', 14)
         self.oversold_threshold = config.get('oversold_threshold', 30)
@@ -30,6 +30,9 @@ class RSIStrategy(BaseStrategy):
         self.size_multiplier_extreme = config.get('size_multiplier_extreme', 1.5)
         self.size_multiplier_moderate = config.get('size_multiplier_moderate', 1.2)
         self._last_rsi: Dict[str, float] = {}  # coin -> last RSI value
+        # (prev_rsi, current_rsi) per coin, rebuilt each cycle by
+        # prepare_signals() from one matrix pass over all coins.
+        self._rsi_snapshot: Dict[str, Tuple[float, float]] = {}
 
     def _coin_status(self, coin: str) -> str:
         """RSI-specific status: current RSI value."""
@@ -40,24 +43,44 @@ class RSIStrategy(BaseStrategy):
 
     def calculate_rsi(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate RSI and add it as a column to the DataFrame."""
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=self.rsi_period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=self.rsi_period).mean()
-
-        rs = gain / loss.replace(0, np.nan)
-        df['rsi'] = 100 - (100 / (1 + rs))
+        df['rsi'] = rsi(df['close'].to_numpy(dtype=float), self.rsi_period)
         return df
 
+    def prepare_signals(self, coins: List[str]) -> None:
+        """Compute the last two RSI values for every coin in one matrix pass.
+
+        Coins missing from the batch (too little history) fall back to the
+        per-coin path in :meth:`generate_signals`.  With ``signal_workers > 1``
+        the per-coin path is kept so candle fetches stay parallel.
+        """
+        self._rsi_snapshot = {}
+        if len(coins) < 2 or self._signal_workers > 1:
+            return
+        names, closes = self.market_data.get_close_matrix(
+            coins, self.candle_interval, self.lookback, min_periods=self.rsi_period + 2,
+        )
+        if not names:
+            return
+        values = rsi_matrix(closes[:, -(self.rsi_period + 2):], self.rsi_period)
+        for i, coin in enumerate(names):
+            self._rsi_snapshot[coin] = (values[i, 0], values[i, 1])
+
     def generate_signals(self, coin: str) -> Optional[Dict]:
         try:
-            candles = self._get_candles_or_none(coin, self.rsi_period + 2)
-            if candles is None:
-                return None
-
-            df = self.calculate_rsi(candles)
-
-            current_rsi = df['rsi'].iloc[-1]
-            prev_rsi = df['rsi'].iloc[-2]
+            snapshot = self._rsi_snapshot.get(coin)
+            if snapshot is not None:
+                prev_rsi, current_rsi = snapshot
+            else:
+                candles = self._get_candles_or_none(coin, self.rsi_period + 2)
+                if candles is None:
+                    return None
+
+                # Only the last two RSI values are read: their windows need
+                # the last rsi_period + 2 closes (one extra for the first
+                # change), and each window's mean is the same as on the full
+                # history.
+                closes = candles['close'].to_numpy(dtype=float)
+                prev_rsi, current_rsi = rsi(closes[-(self.rsi_period + 2):], self.rsi_period)[-2:]
 
             if pd.isna(current_rsi) or pd.isna(prev_rsi):
                 logger.debug(
@@ -72,7 +95,8 @@ class RSIStrategy(BaseStrategy):
                 f"oversold={self.oversold_threshold}, overbought={self.overbought_threshold})"
             )
 
-            has_position = self._has_position(coin)
+            position_size = self._position_size(coin)
+            has_position = position_size != 0
 
             if prev_rsi >= self.oversold_threshold and current_rsi < self.oversold_threshold:
                 if not has_position:
@@ -88,7 +112,7 @@ class RSIStrategy(BaseStrategy):
             elif prev_rsi <= self.overbought_threshold and current_rsi > self.overbought_threshold:
                 # NOTE: Only closes long positions. Short positions are not
                 # managed by this strategy (no short-close signal).
-                if self._has_position(coin) and self.positions[coin]['size'] > 0:
+                if position_size > 0:
                     logger.info(f"RSI overbought signal for {coin}: RSI={current_rsi:.2f}")
                     return {
                         'side': 'sell',
@@ -98,7 +122,7 @@ class RSIStrategy(BaseStrategy):
                         'rsi': current_rsi,
                     }
 
-            elif self._has_position(coin) and self.positions[coin]['size'] > 0:
+            elif position_size > 0:
                 if current_rsi > self.overbought_threshold - 5:
                     return {
                         'side': 'sell',
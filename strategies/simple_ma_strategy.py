@@ -1,7 +1,8 @@
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import rolling_mean, rolling_mean_matrix
 from rate_limiter import API_ERRORS
 
 logger = logging.getLogger(__name__)
@@ -14,7 +15,7 @@ class SimpleMAStrategy(BaseStrategy):
     (golden cross) and a sell signal on the reverse (death cross).
     """
 
-    def __init__(self, market_data_manager, order_manager, config):
+    def __init__(self, market_data_manager, order_manager, config: Dict) -> None:
         super().__init__(market_data_manager, order_manager, config)
         self.fast_period = config.get('fast_ma_period', 10)
         self.slow_period = config.get('slow_ma_period', 30)
@@ -22,26 +23,56 @@ class SimpleMAStrategy(BaseStrategy):
         self.position_size_usd = config.get('position_size_usd', 100)
         self.max_positions = config.get('max_positions', 3)
         self.candle_interval = config.get('candle_interval', '5m')
+        # (prev_fast, prev_slow, cur_fast, cur_slow) per coin, rebuilt each
+        # cycle by prepare_signals() from one matrix pass over all coins.
+        self._ma_snapshot: Dict[str, Tuple[float, float, float, float]] = {}
 
     def calculate_moving_averages(self, df: pd.DataFrame) -> pd.DataFrame:
-        df['ma_fast'] = df['close'].rolling(window=self.fast_period).mean()
-        df['ma_slow'] = df['close'].rolling(window=self.slow_period).mean()
+        closes = df['close'].to_numpy(dtype=float)
+        df['ma_fast'] = rolling_mean(closes, self.fast_period)
+        df['ma_slow'] = rolling_mean(closes, self.slow_period)
         return df
 
+    def prepare_signals(self, coins: List[str]) -> None:
+        """Compute the last two fast/slow MAs for every coin in one matrix pass.
+
+        Coins missing from the batch (too little history) fall back to the
+        per-coin path in :meth:`generate_signals`.  With ``signal_workers > 1``
+        the per-coin path is kept so candle fetches stay parallel.
+        """
+        self._ma_snapshot = {}
+        if len(coins) < 2 or self._signal_workers > 1:
+            return
+        names, closes = self.market_data.get_close_matrix(
+            coins, self.candle_interval, self.lookback, min_periods=self.slow_period + 1,
+        )
+        if not names:
+            return
+        fast = rolling_mean_matrix(closes[:, -(self.fast_period + 1):], self.fast_period)
+        slow = rolling_mean_matrix(closes[:, -(self.slow_period + 1):], self.slow_period)
+        for i, coin in enumerate(names):
+            self._ma_snapshot[coin] = (fast[i, 0], slow[i, 0], fast[i, 1], slow[i, 1])
+
     def generate_signals(self, coin: str) -> Optional[Dict]:
         try:
-            candles = self._get_candles_or_none(coin, self.slow_period)
-            if candles is None:
-                return None
-
-            df = self.calculate_moving_averages(candles)
+            snapshot = self._ma_snapshot.get(coin)
+            if snapshot is not None:
+                prev_fast_ma, prev_slow_ma, current_fast_ma, current_slow_ma = snapshot
+            else:
+                candles = self._get_candles_or_none(coin, self.slow_period)
+                if candles is None:
+                    return None
 
-            current_fast_ma = df['ma_fast'].iloc[-1]
-            current_slow_ma = df['ma_slow'].iloc[-1]
-            prev_fast_ma = df['ma_fast'].iloc[-2]
-            prev_slow_ma = df['ma_slow'].iloc[-2]
+                # Only the last two windows of each average are read, so
+                # average just those bars instead of adding full columns.
+                closes = candles['close'].to_numpy(dtype=float)
+                prev_fast_ma, current_fast_ma = rolling_mean(
+                    closes[-(self.fast_period + 1):], self.fast_period)[-2:]
+                prev_slow_ma, current_slow_ma = rolling_mean(
+                    closes[-(self.slow_period + 1):], self.slow_period)[-2:]
 
-            has_position = self._has_position(coin)
+            position_size = self._position_size(coin)
+            has_position = position_size != 0
 
             if prev_fast_ma <= prev_slow_ma and current_fast_ma > current_slow_ma:
                 if not has_position:
@@ -54,7 +85,7 @@ class SimpleMAStrategy(BaseStrategy):
                     }
 
             elif prev_fast_ma >= prev_slow_ma and current_fast_ma < current_slow_ma:
-                if self._has_position(coin) and self.positions[coin]['size'] > 0:
+                if position_size > 0:
                     logger.info(f"Bearish crossover detected for {coin}")
                     return {
                         'side': 'sell',
@@ -4,6 +4,8 @@ Test script to verify Hyperliquid API connection and fetch market data
 No authentication required for public endpoints
 """
 
+from itertools import islice
+
 from hyperliquid.info import Info
 from hyperliquid.utils import constants
 
@@ -21,7 +23,7 @@ def test_market_data():
         all_mids = info.all_mids()
         print(f"Found {len(all_mids)} coins")
         # Show first 5 coins
-        for i, (coin, price) in enumerate(list(all_mids.items())[:5]):
+        for coin, price in islice(all_mids.items(), 5):
             print(f"  {coin}: ${price}")
         print("  ...")
     except Exception as e:
@@ -138,6 +138,14 @@ class TestGetAccountSnapshot:
         with pytest.raises(ValueError, match="marginSummary"):
             get_account_snapshot(info, '0xabc')
 
+    def test_missing_summary_fields_default_to_zero(self):
+        """A marginSummary without totalMarginUsed counts as no margin used."""
+        info = _make_info(user_state_override={'marginSummary': {'accountValue': '750'}})
+        snap = get_account_snapshot(info, '0xabc')
+
+        assert snap.account_value == 750.0
+        assert snap.margin_used == 0.0
+
     def test_zero_account_value_with_spot(self):
         """Perp account at 0 but spot has collateral (Portfolio Margin)."""
         info = _make_info(
@@ -169,6 +177,7 @@ class TestSnapshotCache:
         snap2 = get_account_snapshot(info, '0xabc')
 
         assert snap1 == snap2
+        assert snap2 is snap1  # cache hits do no re-parsing
         # user_state should only be called once (cached on second call)
         assert info.user_state.call_count == 1
         assert info.spot_user_state.call_count == 1
@@ -205,6 +214,46 @@ class TestSnapshotCache:
 
         assert info.user_state.call_count == 2
 
+    def test_concurrent_misses_share_one_fetch(self):
+        """Threads missing the cache together wait for a single round trip."""
+        import threading
+        import time
+        info = _make_info(account_value=500.0, margin_used=100.0)
+        release = threading.Event()
+        user_state = info.user_state.return_value
+
+        def slow_user_state(address):
+            release.wait(5)
+            return user_state
+        info.user_state.side_effect = slow_user_state
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_account_snapshot(info, '0xabc')))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        while info.user_state.call_count == 0:
+            time.sleep(0.001)
+        time.sleep(0.05)  # let the other threads reach the cache miss
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(results) == 4
+        assert all(r.account_value == 500.0 for r in results)
+        assert info.user_state.call_count == 1
+
+    def test_back_to_back_validations_share_one_fetch(self):
+        from validation.margin_validator import MarginValidator
+        info = _make_info(account_value=500.0, margin_used=100.0)
+        validator = MarginValidator(info, '0xabc')
+
+        assert validator.get_account_info() == (500.0, 400.0)
+        assert validator.get_account_info() == (500.0, 400.0)
+        assert info.user_state.call_count == 1
+
 
 class TestCollateralCoins:
     """Verify the collateral coin set."""
@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 
 from order_manager import OrderManager, OrderStatus, Order, OrderSide
 from hip3.multi_dex_order_manager import MultiDexOrderManager
-from ttl_cache import TTLCacheEntry
+from ttl_cache import SingleFlight, TTLCacheEntry
 
 
 def _make_order(oid: int, coin: str = "BTC") -> Order:
@@ -27,6 +27,7 @@ def _make_order_manager(active_orders=None) -> OrderManager:
     om.default_slippage = 0.01
     om.active_orders = dict(active_orders) if active_orders else {}
     om._open_orders_cache = TTLCacheEntry(ttl=5.0)
+    om._flights = SingleFlight()
     return om
 
 
@@ -38,7 +39,10 @@ def _make_multi_dex_manager(active_orders=None) -> MultiDexOrderManager:
     mdm.default_slippage = 0.01
     mdm.active_orders = dict(active_orders) if active_orders else {}
     mdm._open_orders_cache = TTLCacheEntry(ttl=5.0)
+    mdm._flights = SingleFlight()
     mdm.market_data_ext = MagicMock()
+    mdm._fetch_workers = 1
+    mdm._fetch_pool = None
     return mdm
 
 
@@ -45,6 +45,12 @@ class TestHasPosition:
         strategy = _make_strategy({'BTC': {'size': 0}})
         assert strategy._has_position('BTC') is False
 
+    def test_position_size_signed_or_zero(self):
+        strategy = _make_strategy({'BTC': {'size': 0.5}, 'ETH': {'size': -2.0}})
+        assert strategy._position_size('BTC') == 0.5
+        assert strategy._position_size('ETH') == -2.0
+        assert strategy._position_size('SOL') == 0.0
+
 
 # ---------------------------------------------------------------------------
 # _get_candles_or_none
@@ -103,3 +109,33 @@ class TestGetCandlesOrNone:
         strategy.market_data.get_candles.assert_called_once_with(
             coin='ETH', interval='1h', lookback=100,
         )
+
+
+# ---------------------------------------------------------------------------
+# _apply_account_cap
+# ---------------------------------------------------------------------------
+
+class TestApplyAccountCap:
+
+    def test_coins_in_one_cycle_share_one_account_fetch(self):
+        from unittest.mock import patch
+        from account_utils import invalidate_snapshot_cache
+
+        strategy = _make_strategy()
+        strategy.order_manager = MagicMock()
+        strategy.order_manager.account_address = '0xcap'
+        info = strategy.order_manager.info
+        info.user_state.return_value = {'marginSummary': {'accountValue': '1000', 'totalMarginUsed': '0'}}
+        info.spot_user_state.return_value = {'balances': []}
+
+        invalidate_snapshot_cache('0xcap')
+        try:
+            with patch('account_utils.api_wrapper') as wrapper:
+                wrapper.call.side_effect = lambda fn, *a, **kw: fn(*a, **kw)
+                sizes = [strategy._apply_account_cap(500.0, 10.0) for _ in ('BTC', 'ETH', 'SOL')]
+        finally:
+            invalidate_snapshot_cache('0xcap')
+
+        assert sizes == [10.0, 10.0, 10.0]  # capped at 10% of 1000 USD
+        info.user_state.assert_called_once()
+        info.spot_user_state.assert_called_once()
@@ -1,6 +1,7 @@
 """Tests for BaseStrategy: run loop, execute_signal, should_close_position."""
 
 from unittest.mock import MagicMock
+import pytest
 from strategies.base_strategy import BaseStrategy
 from order_manager import OrderSide
 
@@ -33,6 +34,31 @@ def _make_strategy(config=None, test_signal=None, test_position_size=100.0):
     return strategy
 
 
+# ------------------------------------------------------------------ #
+#  _check_max_positions
+# ------------------------------------------------------------------ #
+
+class TestCheckMaxPositions:
+
+    def _strategy(self, max_positions, held):
+        strategy = _make_strategy()
+        strategy.max_positions = max_positions
+        strategy.positions = {coin: {'size': 1.0} for coin in held}
+        return strategy
+
+    def test_new_coin_below_limit_allowed(self):
+        assert not self._strategy(2, ['BTC'])._check_max_positions('ETH')
+
+    def test_new_coin_at_limit_blocked(self):
+        assert self._strategy(2, ['BTC', 'ETH'])._check_max_positions('SOL')
+
+    def test_held_coin_at_limit_allowed(self):
+        assert not self._strategy(2, ['BTC', 'ETH'])._check_max_positions('ETH')
+
+    def test_no_limit_configured(self):
+        assert not self._strategy(None, ['BTC', 'ETH'])._check_max_positions('SOL')
+
+
 # ------------------------------------------------------------------ #
 #  should_close_position
 # ------------------------------------------------------------------ #
@@ -72,6 +98,15 @@ class TestShouldClosePosition:
         strategy.market_data.get_market_data.return_value = MagicMock()
         assert strategy.should_close_position('SOL') is False
 
+    def test_position_in_range_skips_market_data(self):
+        strategy = _make_strategy()
+        strategy.positions = {
+            'SOL': {'size': 100, 'entry_price': 100,
+                    'unrealized_pnl': 50, 'margin_used': 5000}
+        }
+        assert strategy.should_close_position('SOL') is False
+        strategy.market_data.get_market_data.assert_not_called()
+
     def test_no_position(self):
         strategy = _make_strategy()
         assert strategy.should_close_position('BTC') is False
@@ -144,6 +179,21 @@ class TestExecuteSignal:
         strategy.execute_signal('BTC', signal)
         strategy.order_manager.create_limit_order.assert_not_called()
 
+    def test_sizing_and_pricing_share_one_book_snapshot(self):
+        strategy = _make_strategy()
+        strategy.market_data.get_market_data.side_effect = [
+            MagicMock(bid=50000, ask=50100, mid_price=50050),
+            MagicMock(bid=1, ask=2, mid_price=1.5),
+        ]
+        strategy.calculate_position_size = lambda coin, signal: (
+            1000 / strategy._signal_market_data(coin).mid_price)
+
+        strategy.execute_signal('BTC', {'side': 'buy', 'order_type': 'limit'})
+
+        strategy.market_data.get_market_data.assert_called_once_with('BTC')
+        assert strategy.order_manager.create_limit_order.call_args.kwargs['price'] == 50000
+        assert strategy._md_snapshot == {}
+
 
 # ------------------------------------------------------------------ #
 #  run
@@ -194,3 +244,167 @@ class TestRun:
 
         strategy.order_manager.create_market_order.assert_not_called()
         strategy.order_manager.create_limit_order.assert_not_called()
+
+
+# ------------------------------------------------------------------ #
+#  Concurrent per-coin evaluation (signal_workers)
+# ------------------------------------------------------------------ #
+
+class TestConcurrentEvaluation:
+
+    def _strategy(self, workers):
+        strategy = _make_strategy(config={
+            'take_profit_percent': 5, 'stop_loss_percent': 2,
+            'signal_workers': workers,
+        })
+        strategy.order_manager.get_all_positions.return_value = []
+        return strategy
+
+    def test_default_is_sequential(self):
+        strategy = _make_strategy()
+        strategy.order_manager.get_all_positions.return_value = []
+        strategy._evaluate_coins_concurrently = MagicMock()
+        strategy.run(['BTC', 'ETH'])
+        strategy._evaluate_coins_concurrently.assert_not_called()
+
+    def test_workers_evaluate_all_coins_in_order(self):
+        strategy = self._strategy(workers=4)
+        seen = []
+        strategy.generate_signals = lambda coin: seen.append(coin) or None
+        result = strategy._evaluate_coins_concurrently(['BTC', 'ETH', 'SOL'])
+        assert result == [(False, None)] * 3
+        assert sorted(seen) == ['BTC', 'ETH', 'SOL']
+
+    def test_orders_placed_on_caller_in_coin_order(self):
+        strategy = self._strategy(workers=4)
+        strategy.generate_signals = lambda coin: {'side': 'buy', 'order_type': 'market'}
+        strategy.execute_signal = MagicMock()
+        strategy.run(['BTC', 'ETH', 'SOL'])
+        assert [c.args[0] for c in strategy.execute_signal.call_args_list] == ['BTC', 'ETH', 'SOL']
+
+    def test_close_skips_signal_generation(self):
+        strategy = self._strategy(workers=2)
+        strategy.should_close_position = lambda coin: coin == 'BTC'
+        strategy.generate_signals = MagicMock(return_value=None)
+        strategy.close_position = MagicMock()
+        strategy.run(['BTC', 'ETH'])
+        strategy.close_position.assert_called_once_with('BTC')
+        strategy.generate_signals.assert_called_once_with('ETH')
+
+    def test_blocking_fetches_overlap(self):
+        import threading
+        strategy = self._strategy(workers=4)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def generate_signals(coin):
+            # Every coin must be in flight at once to pass the barrier.
+            barrier.wait()
+            return None
+
+        strategy.generate_signals = generate_signals
+        result = strategy._evaluate_coins_concurrently(['BTC', 'ETH', 'SOL', 'ARB'])
+        assert result == [(False, None)] * 4
+        strategy.shutdown()
+
+    def test_pool_reused_across_cycles(self):
+        strategy = self._strategy(workers=2)
+        strategy.generate_signals = MagicMock(return_value=None)
+        strategy.run(['BTC', 'ETH'])
+        pool = strategy._signal_pool
+        strategy.run(['BTC', 'ETH'])
+        assert pool is not None
+        assert strategy._signal_pool is pool
+        strategy.shutdown()
+        assert strategy._signal_pool is None
+
+    def test_shutdown_without_pool_is_noop(self):
+        strategy = self._strategy(workers=1)
+        strategy.shutdown()
+        assert strategy._signal_pool is None
+
+
+# ------------------------------------------------------------------ #
+#  Bulk signal orders (bulk_signal_orders)
+# ------------------------------------------------------------------ #
+
+class TestBulkSignalOrders:
+
+    def _strategy(self, signal):
+        strategy = _make_strategy(config={
+            'take_profit_percent': 5, 'stop_loss_percent': 2,
+            'bulk_signal_orders': True,
+        }, test_signal=signal)
+        strategy.order_manager.get_all_positions.return_value = []
+        strategy.market_data.get_market_data.return_value = MagicMock(bid=50000, ask=50100)
+        return strategy
+
+    def test_orders_sent_in_one_bulk_call(self):
+        strategy = self._strategy({'side': 'buy', 'order_type': 'limit'})
+        built = [MagicMock(coin=c) for c in ('BTC', 'ETH')]
+        strategy.order_manager.build_limit_order.side_effect = built
+        strategy.order_manager.bulk_place_orders.return_value = built
+
+        strategy.run(['BTC', 'ETH'])
+
+        strategy.order_manager.create_limit_order.assert_not_called()
+        strategy.order_manager.bulk_place_orders.assert_called_once_with(built)
+        assert strategy._pending_orders == []
+
+    def test_failed_cycle_discards_queued_orders(self):
+        strategy = self._strategy({'side': 'buy', 'order_type': 'limit'})
+        strategy.order_manager.build_limit_order.return_value = MagicMock(coin='BTC')
+        # BTC's order is queued, then closing ETH raises out of run().
+        strategy.should_close_position = MagicMock(side_effect=[False, True])
+        strategy.close_position = MagicMock(side_effect=RuntimeError('boom'))
+
+        with pytest.raises(RuntimeError):
+            strategy.run(['BTC', 'ETH'])
+
+        assert strategy._pending_orders == []
+        strategy.should_close_position = MagicMock(return_value=False)
+        strategy._test_signal = None
+        strategy.run(['BTC'])
+        strategy.order_manager.bulk_place_orders.assert_not_called()
+
+    def test_grid_signals_are_batched(self):
+        from strategies.grid_trading_strategy import GridTradingStrategy
+        market_data = MagicMock()
+        market_data.round_size.side_effect = lambda coin, size: size
+        market_data.price_rounding_params.return_value = (0, True)
+        market_data.get_market_data.return_value = MagicMock(bid=50000, ask=50100, mid_price=50050)
+        order_manager = MagicMock()
+        order_manager.get_all_positions.return_value = []
+        strategy = GridTradingStrategy(market_data, order_manager, {'bulk_signal_orders': True})
+        strategy.generate_signals = MagicMock(return_value={'side': 'buy', 'order_type': 'limit'})
+        strategy._apply_account_cap = lambda size, price, **kw: size / price
+        built = [MagicMock(coin=c) for c in ('BTC', 'ETH')]
+        order_manager.build_limit_order.side_effect = built
+        order_manager.bulk_place_orders.return_value = built
+
+        strategy.run(['BTC', 'ETH'])
+
+        order_manager.create_limit_order.assert_not_called()
+        order_manager.bulk_place_orders.assert_called_once_with(built)
+        assert strategy._current_signal is None
+
+    def test_market_signal_uses_build_market_order(self):
+        strategy = self._strategy({'side': 'sell', 'order_type': 'market'})
+        strategy.order_manager.bulk_place_orders.return_value = [None]
+
+        strategy.run(['BTC'])
+
+        strategy.order_manager.build_market_order.assert_called_once()
+        strategy.order_manager.create_market_order.assert_not_called()
+
+    def test_no_signals_no_bulk_call(self):
+        strategy = self._strategy(None)
+        strategy.run(['BTC'])
+        strategy.order_manager.bulk_place_orders.assert_not_called()
+
+    def test_default_places_immediately(self):
+        strategy = _make_strategy(test_signal={'side': 'buy', 'order_type': 'limit'})
+        strategy.order_manager.get_all_positions.return_value = []
+        strategy.market_data.get_market_data.return_value = MagicMock(bid=50000, ask=50100)
+        strategy.run(['BTC'])
+        strategy.order_manager.create_limit_order.assert_called_once()
+        strategy.order_manager.bulk_place_orders.assert_not_called()
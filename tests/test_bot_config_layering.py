@@ -281,3 +281,71 @@ class TestJsonRiskOverrides:
         _apply_json_risk_overrides(json_overrides, self._args())
         # No risk keys present — both pass through untouched.
         assert json_overrides == {"spread_bps": 10, "made_up_risk_param": 0.5}
+
+
+class TestDefaultStrategyConfigs:
+
+    def test_defaults_cover_every_strategy(self):
+        from bot import _DEFAULT_STRATEGY_CONFIGS
+        from strategies import STRATEGY_CLASS_NAMES
+        assert set(_DEFAULT_STRATEGY_CONFIGS) == set(STRATEGY_CLASS_NAMES)
+
+    def test_defaults_are_read_only(self):
+        import pytest
+        from bot import _DEFAULT_STRATEGY_CONFIGS
+        with pytest.raises(TypeError):
+            _DEFAULT_STRATEGY_CONFIGS['simple_ma']['fast_ma_period'] = 1
+        with pytest.raises(TypeError):
+            _DEFAULT_STRATEGY_CONFIGS['new'] = {}
+
+
+class TestCollectParams:
+
+    def test_copies_only_set_args(self):
+        from types import SimpleNamespace
+        from bot import _collect_params
+        args = SimpleNamespace(fast_ma_period=5, slow_ma_period=None)
+        dest = {}
+        _collect_params(['fast_ma_period', 'slow_ma_period', 'absent'], args, dest)
+        assert dest == {'fast_ma_period': 5}
+
+    def test_tuple_entry_renames_key(self):
+        from types import SimpleNamespace
+        from bot import _collect_params
+        dest = {}
+        _collect_params([('cli_name', 'config_key')], SimpleNamespace(cli_name=3), dest)
+        assert dest == {'config_key': 3}
+
+    def test_every_strategy_has_a_param_table(self):
+        from bot import _STRATEGY_PARAMS
+        from strategies import STRATEGY_CLASS_NAMES
+        assert set(STRATEGY_CLASS_NAMES) <= set(_STRATEGY_PARAMS)
+
+
+class TestSingleBotDefinition:
+    """Guard against a second HyperliquidBot definition shadowing the first."""
+
+    def test_bot_class_defined_once(self):
+        import ast
+        from pathlib import Path
+        tree = ast.parse(Path(__file__).resolve().parent.parent.joinpath('bot.py').read_text())
+        names = [n.name for n in tree.body if isinstance(n, ast.ClassDef)]
+        assert names.count('HyperliquidBot') == 1
+
+    def test_load_wallet_uses_private_key(self):
+        from unittest.mock import patch
+        from bot import HyperliquidBot
+        key = '0x' + '11' * 32
+        with patch('bot.Config.PRIVATE_KEY', key):
+            wallet = HyperliquidBot.__new__(HyperliquidBot)._load_wallet()
+        assert wallet.key.hex().removeprefix('0x') == '11' * 32
+
+    def test_load_wallet_reuses_account_for_same_key(self):
+        from unittest.mock import patch
+        from bot import HyperliquidBot
+        bot = HyperliquidBot.__new__(HyperliquidBot)
+        with patch('bot.Config.PRIVATE_KEY', '0x' + '22' * 32):
+            first = bot._load_wallet()
+            assert bot._load_wallet() is first
+        with patch('bot.Config.PRIVATE_KEY', '0x' + '33' * 32):
+            assert bot._load_wallet() is not first
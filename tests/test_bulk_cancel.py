@@ -19,6 +19,43 @@ def _make_order_manager():
     return OrderManager(exchange, info, '0xabc')
 
 
+def _order(oid):
+    return Order(
+        id=oid, coin='BTC', side=OrderSide.BUY,
+        size=0.1, price=50000.0,
+        order_type={'limit': {'tif': 'Gtc'}},
+    )
+
+
+class _RacingOrders(dict):
+    """active_orders whose membership test lets the WS feed remove the oid first."""
+
+    def __contains__(self, oid):
+        found = super().__contains__(oid)
+        self.pop(oid, None)
+        return found
+
+
+class TestCancelOrder:
+
+    def test_cancel_removes_active_order(self):
+        mgr = _make_order_manager()
+        order = _order(100)
+        mgr.active_orders[100] = order
+        mgr.exchange.cancel.return_value = {'status': 'ok'}
+
+        assert mgr.cancel_order(100, 'BTC') is True
+        assert 100 not in mgr.active_orders
+        assert order.status.value == 'cancelled'
+
+    def test_cancel_tolerates_concurrent_removal(self):
+        mgr = _make_order_manager()
+        mgr.active_orders = _RacingOrders({100: _order(100)})
+        mgr.exchange.cancel.return_value = {'status': 'ok'}
+
+        assert mgr.cancel_order(100, 'BTC') is True
+
+
 class TestBulkCancelOrders:
 
     def test_bulk_cancel_success(self):
@@ -81,6 +118,18 @@ class TestBulkCancelOrders:
 
         assert 100 not in mgr.active_orders
 
+    def test_bulk_cancel_tolerates_concurrent_removal(self):
+        """The order-update feed may drop the oid while the cancel is processed."""
+        mgr = _make_order_manager()
+        mgr.active_orders = _RacingOrders({100: _order(100)})
+        mgr.exchange.bulk_cancel.return_value = {
+            'status': 'ok',
+            'response': {'data': {'statuses': ['success']}},
+        }
+
+        assert mgr.bulk_cancel_orders([{'coin': 'BTC', 'oid': 100}]) == 1
+        assert 100 not in mgr.active_orders
+
     def test_bulk_cancel_api_error(self):
         """API exception returns 0."""
         mgr = _make_order_manager()
@@ -150,3 +199,49 @@ class TestCancelAllOrdersBatch:
 
         assert result == 0
         mgr.exchange.bulk_cancel.assert_not_called()
+
+    def test_cancel_all_updates_active_orders_from_statuses(self):
+        """One bulk request; only orders reported 'success' leave active_orders."""
+        mgr = _make_order_manager()
+        for oid in (100, 200):
+            mgr.active_orders[oid] = Order(
+                id=oid, coin='BTC', side=OrderSide.BUY, size=0.1, price=50000.0,
+                order_type={'limit': {'tif': 'Gtc'}},
+            )
+        mgr.info.open_orders.return_value = [
+            {'coin': 'BTC', 'oid': '100'},
+            {'coin': 'BTC', 'oid': '200'},
+        ]
+        mgr.exchange.bulk_cancel.return_value = {
+            'status': 'ok',
+            'response': {'data': {'statuses': ['success', {'error': 'already filled'}]}},
+        }
+
+        assert mgr.cancel_all_orders() == 1
+        mgr.exchange.bulk_cancel.assert_called_once_with(
+            [{'coin': 'BTC', 'oid': 100}, {'coin': 'BTC', 'oid': 200}]
+        )
+        assert list(mgr.active_orders) == [200]
+
+    def test_cancel_all_seeds_open_orders_cache(self):
+        """A cancel_all that finds nothing leaves its fetch for get_open_orders."""
+        mgr = _make_order_manager()
+        mgr.info.open_orders.return_value = [{'coin': 'ETH', 'oid': '200'}]
+
+        assert mgr.cancel_all_orders(coin='BTC') == 0
+        assert mgr.get_open_orders() == [{'coin': 'ETH', 'oid': '200'}]
+        mgr.info.open_orders.assert_called_once()
+
+    def test_cancel_all_always_fetches_fresh(self):
+        """cancel_all_orders does not trust a cached open-orders list."""
+        mgr = _make_order_manager()
+        mgr.info.open_orders.return_value = []
+        mgr.get_open_orders()
+        mgr.info.open_orders.return_value = [{'coin': 'BTC', 'oid': '100'}]
+        mgr.exchange.bulk_cancel.return_value = {
+            'status': 'ok',
+            'response': {'data': {'statuses': ['success']}},
+        }
+
+        assert mgr.cancel_all_orders() == 1
+        assert mgr.info.open_orders.call_count == 2
@@ -157,3 +157,30 @@ class TestExtractOid:
 
     def test_empty_returns_none(self):
         assert OrderManager._extract_oid({}) is None
+
+
+class TestBuildOrders:
+    """build_* helpers return orders without calling the exchange."""
+
+    def test_build_limit_order_does_not_place(self):
+        from order_manager import OrderManager, OrderSide
+        om = OrderManager(MagicMock(), MagicMock(), "0xtest")
+        order = om.build_limit_order("BTC", OrderSide.BUY, 0.1, 50000.0)
+        assert order.order_type == {"limit": {"tif": "Alo"}}
+        om.exchange.order.assert_not_called()
+
+    def test_build_market_order_uses_ioc_with_slippage(self):
+        from order_manager import OrderManager, OrderSide
+        om = OrderManager(MagicMock(), MagicMock(), "0xtest", default_slippage=0.01)
+        om._get_mid_price = MagicMock(return_value=100.0)
+        om._get_sz_decimals = MagicMock(return_value=2)
+        order = om.build_market_order("BTC", OrderSide.SELL, 1.0)
+        assert order.order_type == {"limit": {"tif": "Ioc"}}
+        assert order.price == 99.0
+        om.exchange.order.assert_not_called()
+
+    def test_build_market_order_none_without_mid(self):
+        from order_manager import OrderManager, OrderSide
+        om = OrderManager(MagicMock(), MagicMock(), "0xtest")
+        om._get_mid_price = MagicMock(return_value=0.0)
+        assert om.build_market_order("BTC", OrderSide.BUY, 1.0) is None
@@ -0,0 +1,272 @@
+"""Tests for CandleRingBuffer and buffered MarketDataManager.get_candles."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from candle_buffer import CandleRingBuffer, frame_from_api
+from market_data import MarketDataManager
+
+_MIN = 60_000
+
+
+def _candle(t, close):
+    return {'t': t, 'T': t + _MIN - 1, 's': 'BTC', 'i': '1m',
+            'o': str(close), 'h': str(close + 1), 'l': str(close - 1), 'c': str(close), 'v': '10', 'n': 5}
+
+
+class TestCandleRingBuffer:
+
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            CandleRingBuffer(0)
+
+    def test_chronological_after_wrap(self):
+        buf = CandleRingBuffer(3)
+        buf.extend_from_api([_candle(i * _MIN, 100 + i) for i in range(5)])
+        assert len(buf) == 3
+        np.testing.assert_array_equal(buf.field('close'), [102.0, 103.0, 104.0])
+        assert buf.first_ts == 2 * _MIN
+        assert buf.last_ts == 4 * _MIN
+
+    def test_same_timestamp_overwrites_last_bar(self):
+        buf = CandleRingBuffer(4)
+        buf.extend_from_api([_candle(0, 100), _candle(_MIN, 101)])
+        buf.extend_from_api([_candle(_MIN, 105)])
+        assert len(buf) == 2
+        assert buf.field('close')[-1] == 105.0
+
+    def test_older_candles_ignored(self):
+        buf = CandleRingBuffer(4)
+        buf.extend_from_api([_candle(2 * _MIN, 100)])
+        buf.extend_from_api([_candle(_MIN, 99)])
+        assert len(buf) == 1
+
+    def test_eviction_advances_coverage(self):
+        buf = CandleRingBuffer(2)
+        buf.covered_from = 0
+        buf.extend_from_api([_candle(i * _MIN, 100) for i in range(3)])
+        assert buf.covered_from == _MIN
+
+    def test_to_frame_columns_and_window(self):
+        buf = CandleRingBuffer(5)
+        buf.extend_from_api([_candle(i * _MIN, 100 + i) for i in range(4)])
+        df = buf.to_frame(start=2 * _MIN)
+        assert list(df['close']) == [102.0, 103.0]
+        assert {'open', 'high', 'low', 'close', 'volume', 't'} <= set(df.columns)
+
+
+class TestFrameFromApi:
+
+    def test_parses_ohlcv_as_float_with_time_index(self):
+        df = frame_from_api([_candle(0, 100), _candle(_MIN, 101.5)])
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume', 't']
+        assert df['close'].dtype == np.float64
+        assert list(df['close']) == [100.0, 101.5]
+        assert list(df['high']) == [101.0, 102.5]
+        assert df.index.name == 'timestamp'
+        assert df.index[1].value == _MIN * 1_000_000
+
+    def test_empty_gives_empty_frame(self):
+        assert frame_from_api([]).empty
+
+    def test_matches_ring_buffer_frame(self):
+        candles = [_candle(i * _MIN, 100 + i) for i in range(5)]
+        buf = CandleRingBuffer(10)
+        buf.extend_from_api(candles)
+        direct = frame_from_api(candles)
+        buffered = buf.to_frame()
+        assert list(direct.columns) == list(buffered.columns)
+        np.testing.assert_array_equal(direct.to_numpy(), buffered.to_numpy())
+        assert (direct.index == buffered.index).all()
+
+    def test_index_matches_to_datetime(self):
+        import pandas as pd
+        ts = [1_700_000_000_000 + i * _MIN for i in range(3)]
+        df = frame_from_api([_candle(t, 100) for t in ts])
+        expected = pd.to_datetime(np.array(ts, dtype=np.int64), unit='ms')
+        pd.testing.assert_index_equal(df.index, expected.rename('timestamp'), exact=True)
+
+
+@pytest.fixture(autouse=True)
+def _bypass_api_wrapper():
+    with patch('market_data.api_wrapper') as mock_wrapper:
+        mock_wrapper.call.side_effect = lambda fn, *a, **kw: fn(*a, **kw)
+        yield mock_wrapper
+
+
+class TestBufferedGetCandles:
+
+    @patch('market_data.time.time', return_value=100 * 60.0)
+    def test_second_call_fetches_only_new_bars(self, _):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(i * _MIN, 100 + i) for i in range(90, 100)]
+        mgr = MarketDataManager(info, candle_buffer_size=50)
+
+        first = mgr.get_candles('BTC', '1m', lookback=10)
+        info.candles_snapshot.return_value = [_candle(99 * _MIN, 250)]
+        second = mgr.get_candles('BTC', '1m', lookback=10)
+
+        assert len(first) == 10
+        assert second['close'].iloc[-1] == 250.0
+        since = info.candles_snapshot.call_args_list[1].args[2]
+        assert since == 99 * _MIN
+
+    @patch('market_data.time.time', return_value=100 * 60.0)
+    def test_longer_lookback_reloads(self, _):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(i * _MIN, 100) for i in range(90, 100)]
+        mgr = MarketDataManager(info, candle_buffer_size=50)
+        mgr.get_candles('BTC', '1m', lookback=10)
+        mgr.get_candles('BTC', '1m', lookback=20)
+        assert info.candles_snapshot.call_args_list[1].args[2] == 80 * _MIN
+
+    @patch('market_data.time.time', return_value=100 * 60.0)
+    def test_field_reads_buffer_without_a_frame(self, _):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(i * _MIN, 100 + i) for i in range(90, 100)]
+        mgr = MarketDataManager(info, candle_buffer_size=50)
+        expected = mgr.get_candles('BTC', '1m', lookback=10)['close'].to_numpy()
+
+        with patch('market_data.CandleRingBuffer.to_frame') as to_frame:
+            coins, closes = mgr.get_close_matrix(['BTC'], '1m', lookback=10)
+        to_frame.assert_not_called()
+        assert coins == ['BTC']
+        np.testing.assert_array_equal(closes[0], expected)
+
+    def test_field_falls_back_to_frame_when_unbuffered(self):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(0, 100), _candle(_MIN, 101)]
+        mgr = MarketDataManager(info)
+        assert mgr.get_candle_field('BTC', '1m', lookback=10).tolist() == [100.0, 101.0]
+        info.candles_snapshot.return_value = []
+        assert mgr.get_candle_field('BTC', '1m', lookback=10).size == 0
+
+    def test_disabled_by_default(self):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(0, 100)]
+        mgr = MarketDataManager(info)
+        mgr.get_candles('BTC', '1m', lookback=10)
+        mgr.get_candles('BTC', '1m', lookback=10)
+        assert mgr._candle_buffers == {}
+        assert info.candles_snapshot.call_count == 2
+
+    def test_unbuffered_path_returns_float_frame(self):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(0, 100), _candle(_MIN, 101)]
+        df = MarketDataManager(info).get_candles('BTC', '1m', lookback=10)
+        assert list(df['close']) == [100.0, 101.0]
+        assert df['volume'].dtype == np.float64
+
+
+class TestCandleFrameCache:
+
+    def _mgr(self, ttl):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(0, 100), _candle(_MIN, 101)]
+        return MarketDataManager(info, candle_cache_ttl=ttl), info
+
+    def test_disabled_by_default(self):
+        mgr, info = self._mgr(0)
+        mgr.get_candles('BTC', '1m', lookback=10)
+        mgr.get_candles('BTC', '1m', lookback=10)
+        assert info.candles_snapshot.call_count == 2
+
+    def test_identical_request_shares_fetch(self):
+        mgr, info = self._mgr(60)
+        first = mgr.get_candles('BTC', '1m', lookback=10)
+        first['sma'] = 0.0
+        second = mgr.get_candles('BTC', '1m', lookback=10)
+        assert info.candles_snapshot.call_count == 1
+        assert 'sma' not in second.columns
+        assert list(second['close']) == [100.0, 101.0]
+
+    def test_different_window_fetches_again(self):
+        mgr, info = self._mgr(60)
+        mgr.get_candles('BTC', '1m', lookback=10)
+        mgr.get_candles('BTC', '1m', lookback=20)
+        mgr.get_candles('BTC', '5m', lookback=10)
+        assert info.candles_snapshot.call_count == 3
+
+    def test_empty_result_not_cached(self):
+        mgr, info = self._mgr(60)
+        info.candles_snapshot.return_value = []
+        mgr.get_candles('BTC', '1m', lookback=10)
+        mgr.get_candles('BTC', '1m', lookback=10)
+        assert info.candles_snapshot.call_count == 2
+
+
+class TestCandleBufferPersistence:
+
+    def test_save_load_roundtrip(self, tmp_path):
+        buf = CandleRingBuffer(3)
+        buf.covered_from = 0
+        buf.extend_from_api([_candle(i * _MIN, 100 + i) for i in range(5)])
+        path = str(tmp_path / 'BTC_1m.npz')
+        buf.save(path)
+
+        loaded = CandleRingBuffer.load(path, 3)
+        assert len(loaded) == 3
+        assert loaded.covered_from == buf.covered_from
+        np.testing.assert_array_equal(loaded.field('close'), [102.0, 103.0, 104.0])
+        loaded.extend_from_api([_candle(5 * _MIN, 105)])
+        np.testing.assert_array_equal(loaded.field('close'), [103.0, 104.0, 105.0])
+
+    def test_load_into_smaller_capacity_keeps_newest(self, tmp_path):
+        buf = CandleRingBuffer(5)
+        buf.covered_from = 0
+        buf.extend_from_api([_candle(i * _MIN, 100 + i) for i in range(5)])
+        path = str(tmp_path / 'BTC_1m.npz')
+        buf.save(path)
+
+        loaded = CandleRingBuffer.load(path, 2)
+        np.testing.assert_array_equal(loaded.field('close'), [103.0, 104.0])
+        assert loaded.covered_from == 3 * _MIN
+
+    def test_unreadable_file_returns_none(self, tmp_path):
+        path = tmp_path / 'bad.npz'
+        path.write_bytes(b'not an npz')
+        assert CandleRingBuffer.load(str(path), 4) is None
+        assert CandleRingBuffer.load(str(tmp_path / 'missing.npz'), 4) is None
+
+
+class TestCandleDiskCache:
+
+    @patch('market_data.time.time', return_value=100 * 60.0)
+    def test_restart_fetches_only_new_bars(self, _, tmp_path):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(i * _MIN, 100 + i) for i in range(90, 100)]
+        MarketDataManager(info, candle_buffer_size=50, candle_cache_dir=str(tmp_path)).get_candles(
+            'BTC', '1m', lookback=10)
+        assert (tmp_path / 'BTC_1m.npz').exists()
+
+        info.candles_snapshot.reset_mock()
+        info.candles_snapshot.return_value = [_candle(99 * _MIN, 250)]
+        restarted = MarketDataManager(info, candle_buffer_size=50, candle_cache_dir=str(tmp_path))
+        df = restarted.get_candles('BTC', '1m', lookback=10)
+
+        assert info.candles_snapshot.call_args.args[2] == 99 * _MIN
+        assert len(df) == 10
+        assert df['close'].iloc[-1] == 250.0
+
+    def test_stale_cache_ignored(self, tmp_path):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(i * _MIN, 100) for i in range(0, 10)]
+        with patch('market_data.time.time', return_value=10 * 60.0):
+            MarketDataManager(info, candle_buffer_size=50, candle_cache_dir=str(tmp_path)).get_candles(
+                'BTC', '1m', lookback=10)
+
+        info.candles_snapshot.return_value = [_candle(i * _MIN, 100) for i in range(990, 1000)]
+        with patch('market_data.time.time', return_value=1000 * 60.0):
+            MarketDataManager(info, candle_buffer_size=50, candle_cache_dir=str(tmp_path)).get_candles(
+                'BTC', '1m', lookback=10)
+        assert info.candles_snapshot.call_args.args[2] == 990 * _MIN
+
+    @patch('market_data.time.time', return_value=100 * 60.0)
+    def test_hip3_coin_file_name(self, _, tmp_path):
+        info = MagicMock()
+        info.candles_snapshot.return_value = [_candle(99 * _MIN, 100)]
+        MarketDataManager(info, candle_buffer_size=50, candle_cache_dir=str(tmp_path)).get_candles(
+            'xyz:XYZ100', '1m', lookback=10)
+        assert (tmp_path / 'xyz_XYZ100_1m.npz').exists()
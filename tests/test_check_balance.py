@@ -0,0 +1,64 @@
+"""Tests for the check_balance.py account summary script."""
+
+from unittest.mock import MagicMock, patch
+
+import check_balance
+
+
+class TestCheckBalance:
+
+    @patch("check_balance.Config")
+    @patch("check_balance.build_http_session")
+    def test_all_queries_share_one_session(self, mock_build, mock_config, capsys):
+        mock_config.API_URL = "https://api.example"
+        mock_config.ACCOUNT_ADDRESS = "0xabc"
+        session = mock_build.return_value
+        session.post.return_value.json.return_value = {}
+
+        check_balance.main()
+
+        mock_build.assert_called_once_with(pool_size=1)
+        # spot + standard perps + one call per known HIP-3 DEX
+        assert session.post.call_count == 2 + len(check_balance.KNOWN_HIP3_DEXES)
+        assert "No open positions" in capsys.readouterr().out
+
+    def test_api_post_payload(self):
+        session = MagicMock()
+        session.post.return_value.json.return_value = {"ok": True}
+        with patch("check_balance.Config") as mock_config:
+            mock_config.API_URL = "https://api.example"
+            result = check_balance._api_post(session, "clearinghouseState", "0xabc", dex="xyz")
+        assert result == {"ok": True}
+        assert session.post.call_args.kwargs["json"] == {
+            "type": "clearinghouseState", "user": "0xabc", "dex": "xyz",
+        }
+
+    @patch("check_balance.Config")
+    @patch("check_balance.build_http_session")
+    def test_positions_listed_with_total_pnl(self, mock_build, mock_config, capsys):
+        mock_config.API_URL = "https://api.example"
+        state = {'assetPositions': [
+            {'position': {'coin': 'BTC', 'szi': '0.5', 'entryPx': '50000', 'unrealizedPnl': '120.5'}},
+            {'position': {'coin': 'ETH', 'szi': '-2', 'entryPx': '3000', 'unrealizedPnl': '-20.5'}},
+        ]}
+        mock_build.return_value.post.return_value.json.side_effect = (
+            lambda: state if mock_build.return_value.post.call_count == 2 else {}
+        )
+
+        check_balance.main()
+
+        out = capsys.readouterr().out
+        assert "BTC          | LONG " in out
+        assert "ETH          | SHORT" in out
+        assert "PnL: 🟢$  100.00" in out
+
+    def test_import_stays_light(self):
+        """The balance check must not pay for the bot's heavy imports."""
+        import subprocess
+        import sys
+        code = (
+            "import sys, check_balance; "
+            "heavy = [m for m in ('bot', 'strategies', 'pandas', 'eth_account') if m in sys.modules]; "
+            "assert not heavy, heavy"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
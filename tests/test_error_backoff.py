@@ -0,0 +1,41 @@
+"""Tests for the main-loop error backoff (ERROR_BACKOFF_JITTER)."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def bot():
+    """Create a minimal HyperliquidBot with only the backoff state set."""
+    from bot import HyperliquidBot
+    b = HyperliquidBot.__new__(HyperliquidBot)
+    b._error_backoff_jitter = False
+    b._error_backoff = 1.0
+    return b
+
+
+class TestErrorBackoffDelay:
+
+    def test_legacy_fixed_delay(self, bot):
+        assert bot._error_backoff_delay() == 10.0
+        assert bot._error_backoff_delay() == 10.0
+
+    def test_jitter_draws_from_previous_delay(self, bot):
+        bot._error_backoff_jitter = True
+        with patch('bot.random.uniform', side_effect=lambda lo, hi: hi) as uniform:
+            assert bot._error_backoff_delay() == 3.0
+            assert bot._error_backoff_delay() == 9.0
+        assert uniform.call_args_list[1].args == (1.0, 9.0)
+
+    def test_jitter_capped_at_sixty_seconds(self, bot):
+        bot._error_backoff_jitter = True
+        bot._error_backoff = 50.0
+        with patch('bot.random.uniform', return_value=150.0):
+            assert bot._error_backoff_delay() == 60.0
+        assert bot._error_backoff == 60.0
+
+    def test_jitter_stays_within_bounds(self, bot):
+        bot._error_backoff_jitter = True
+        for _ in range(50):
+            assert 1.0 <= bot._error_backoff_delay() <= 60.0
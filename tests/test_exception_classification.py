@@ -38,6 +38,23 @@ class TestClassifyRateLimit:
         result = APICallWrapper._classify(HyperliquidAPIError("429 too many requests"))
         assert isinstance(result, RateLimitError)
 
+    def test_sdk_client_error_status_429(self):
+        from hyperliquid.utils.error import ClientError
+        result = APICallWrapper._classify(ClientError(429, None, "null", {}))
+        assert isinstance(result, RateLimitError)
+
+    def test_requests_http_error_status_429(self):
+        import requests
+        response = requests.Response()
+        response.status_code = 429
+        result = APICallWrapper._classify(requests.HTTPError("Too Many Requests", response=response))
+        assert isinstance(result, RateLimitError)
+
+    def test_status_other_than_429_ignores_digits_in_message(self):
+        from hyperliquid.utils.error import ClientError
+        result = APICallWrapper._classify(ClientError(400, None, "Unknown oid 4290017", {}))
+        assert not isinstance(result, RateLimitError)
+
 
 class TestClassifyNetwork:
 
@@ -4,11 +4,13 @@ Covers DEXRegistry, MultiDexMarketData, and MultiDexOrderManager
 using mocks (no real API calls).
 """
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 import pytest
 
 from order_manager import Order, OrderSide
-from ttl_cache import TTLCacheEntry, TTLCacheMap
+from ttl_cache import SingleFlight, TTLCacheEntry, TTLCacheMap
 
 
 # ---------------------------------------------------------------------------
@@ -71,7 +73,11 @@ def _make_multi_dex_om(active_orders=None, hip3_dexes=None):
     om._mids_cache = TTLCacheMap(ttl=5.0)
     om._user_state_cache = TTLCacheEntry(ttl=2.0)
     om._user_state_cache_ttl = 2.0
+    om._position_index = (None, {})
     om._open_orders_cache = TTLCacheEntry(ttl=2.0)
+    om._flights = SingleFlight()
+    om._fetch_workers = 1
+    om._fetch_pool = None
     return om
 
 
@@ -311,9 +317,13 @@ class TestMultiDexMarketData:
         mdm._cache_ttl = 2.0
         mdm._meta_cache = TTLCacheEntry(ttl=3600)
         mdm._meta_cache_ttl = 3600
+        mdm._meta_cache_max_ttl = 0
+        mdm._last_meta = None
+        mdm._sz_decimals_index = (None, {})
         mdm._dex_user_state_cache = TTLCacheMap(ttl=2.0)
         mdm._user_state_cache_ttl = 2.0
         mdm._dex_open_orders_cache = TTLCacheMap(ttl=2.0)
+        mdm._flights = SingleFlight()
         return mdm
 
     def test_get_sz_decimals_hip3_coin_via_sdk(self):
@@ -585,6 +595,47 @@ class TestMultiDexGetAllPositions:
         assert not any("xyz:" in c for c in coins)
 
 
+class TestMultiDexConcurrentFetch:
+
+    def _om(self, workers):
+        om = _make_multi_dex_om(hip3_dexes=["xyz", "flx", "km"])
+        om._fetch_workers = workers
+        return om
+
+    def test_concurrent_results_keep_dex_order(self):
+        om = self._om(workers=3)
+        threads = set()
+
+        def fetch(dex):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.01)
+            return [{"coin": dex.upper()}]
+
+        items = om._collect_hip3_items(om.hip3_dexes, fetch, "positions")
+
+        assert [i["coin"] for i in items] == ["xyz:XYZ", "flx:FLX", "km:KM"]
+        assert all(name.startswith("hip3-fetch") for name in threads)
+        assert om._fetch_pool is not None
+
+    def test_concurrent_error_isolated_to_one_dex(self):
+        import requests
+        om = self._om(workers=3)
+
+        def fetch(dex):
+            if dex == "flx":
+                raise requests.exceptions.ConnectionError("flx down")
+            return [{"coin": "A"}]
+
+        items = om._collect_hip3_items(om.hip3_dexes, fetch, "positions")
+        assert [i["coin"] for i in items] == ["xyz:A", "km:A"]
+
+    def test_default_is_sequential_without_pool(self):
+        om = self._om(workers=1)
+        items = om._collect_hip3_items(om.hip3_dexes, lambda dex: [{"coin": "A"}], "positions")
+        assert len(items) == 3
+        assert om._fetch_pool is None
+
+
 class TestMultiDexGetOpenOrders:
 
     @patch("hip3.multi_dex_order_manager.api_wrapper")
@@ -702,6 +753,25 @@ class TestMultiDexCancelAllOrders:
         assert cancel_requests[0]["coin"] == "xyz:GOLD"
         assert cancel_requests[0]["oid"] == 100
 
+    @patch("order_manager.api_wrapper")
+    def test_orders_on_several_dexes_cancelled_in_one_request(self, mock_wrapper):
+        """HIP-3 orders from every DEX go out in a single signed bulk_cancel."""
+        om = _make_multi_dex_om(hip3_dexes=["xyz", "flx"])
+        om.market_data_ext.get_open_orders_dex.side_effect = lambda address, dex="": (
+            [{"oid": 100, "coin": "GOLD"}, {"oid": 101, "coin": "SILVER"}] if dex == "xyz"
+            else [{"oid": 200, "coin": "NVDA"}]
+        )
+        mock_wrapper.call.side_effect = [
+            [],   # open_orders for super().cancel_all_orders — no HL orders
+            {"status": "ok", "response": {"data": {"statuses": ["success"] * 3}}},
+        ]
+
+        assert om.cancel_all_orders() == 3
+
+        assert mock_wrapper.call.call_count == 2
+        cancel_requests = mock_wrapper.call.call_args[0][1]
+        assert [r["oid"] for r in cancel_requests] == [100, 101, 200]
+
     @patch("order_manager.api_wrapper")
     def test_error_in_one_dex_doesnt_prevent_others(self, mock_wrapper):
         """Error in one DEX still processes other DEXes."""
@@ -0,0 +1,100 @@
+"""Tests for the shared keep-alive HTTP session."""
+
+import socket
+from unittest.mock import MagicMock, patch
+
+from http_session import _SO_BUSY_POLL, _busy_poll_option, build_http_session, share_http_session
+
+
+class TestBuildHttpSession:
+
+    def test_adapter_pool_size(self):
+        session = build_http_session(pool_size=24)
+        adapter = session.get_adapter("https://api.hyperliquid.xyz/info")
+        assert adapter._pool_connections == 24
+        assert adapter._pool_maxsize == 24
+
+    def test_keepalive_socket_options(self):
+        session = build_http_session()
+        adapter = session.get_adapter("https://api.hyperliquid.xyz/info")
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+    def test_busy_poll_disabled_by_default(self):
+        session = build_http_session()
+        adapter = session.get_adapter("https://api.hyperliquid.xyz/info")
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert all(opt[1] != _SO_BUSY_POLL for opt in options)
+
+    @patch("http_session.sys.platform", "linux")
+    @patch("http_session.socket.socket")
+    def test_busy_poll_option_added_when_permitted(self, mock_socket):
+        session = build_http_session(busy_poll_us=50)
+        adapter = session.get_adapter("https://api.hyperliquid.xyz/info")
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, _SO_BUSY_POLL, 50) in options
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+
+    @patch("http_session.sys.platform", "linux")
+    @patch("http_session.socket.socket")
+    def test_busy_poll_skipped_when_not_permitted(self, mock_socket):
+        probe = mock_socket.return_value.__enter__.return_value
+        probe.setsockopt.side_effect = PermissionError(1, "Operation not permitted")
+        assert _busy_poll_option(50) == []
+
+    @patch("http_session.sys.platform", "darwin")
+    def test_busy_poll_skipped_off_linux(self):
+        assert _busy_poll_option(50) == []
+
+    def test_headers(self):
+        session = build_http_session()
+        assert session.headers["Content-Type"] == "application/json"
+        assert session.headers["Connection"] == "keep-alive"
+
+
+class TestShareHttpSession:
+
+    def test_replaces_and_closes_old_sessions(self):
+        shared = build_http_session()
+        exchange, info = MagicMock(), MagicMock()
+        old_ex, old_info = exchange.session, info.session
+        share_http_session(shared, exchange, info)
+        assert exchange.session is shared
+        assert info.session is shared
+        old_ex.close.assert_called_once()
+        old_info.close.assert_called_once()
+
+    def test_clients_share_one_connection_pool(self):
+        shared = build_http_session(pool_size=32)
+        exchange, info = MagicMock(), MagicMock()
+        share_http_session(shared, exchange, info)
+        url = "https://api.hyperliquid.xyz/exchange"
+        ex_adapter = exchange.session.get_adapter(url)
+        assert ex_adapter is info.session.get_adapter(url)
+        assert ex_adapter._pool_maxsize == 32
+
+    def test_same_session_not_closed(self):
+        shared = MagicMock()
+        client = MagicMock()
+        client.session = shared
+        share_http_session(shared, client)
+        shared.close.assert_not_called()
+
+
+class TestHip3SessionRouting:
+
+    def test_registry_posts_through_session(self):
+        from hip3.dex_registry import DEXRegistry
+        session = MagicMock()
+        session.post.return_value.json.return_value = [None]
+        registry = DEXRegistry("https://api.example", session=session)
+        registry._post({"type": "perpDexs"})
+        session.post.assert_called_once()
+
+    @patch("hip3.dex_registry.requests.post")
+    def test_registry_defaults_to_requests_post(self, mock_post):
+        from hip3.dex_registry import DEXRegistry
+        mock_post.return_value.json.return_value = [None]
+        DEXRegistry("https://api.example")._post({"type": "perpDexs"})
+        mock_post.assert_called_once()
@@ -1,10 +1,13 @@
 """Tests for log_config: setup_logging and JSONFormatter."""
 
+import io
 import json
 import logging
+import logging.handlers
 import os
 from unittest.mock import patch
 
+import log_config
 from log_config import setup_logging, JSONFormatter
 
 
@@ -12,6 +15,7 @@ class TestSetupLogging:
 
     def teardown_method(self):
         """Reset root logger after each test."""
+        log_config._stop_queue_listener()
         root = logging.getLogger()
         for h in root.handlers[:]:
             root.removeHandler(h)
@@ -43,6 +47,42 @@ class TestSetupLogging:
         root = logging.getLogger()
         assert root.level == logging.INFO
 
+    def test_queue_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("LOG_QUEUE", None)
+            setup_logging()
+        assert not isinstance(logging.getLogger().handlers[0], logging.handlers.QueueHandler)
+        assert log_config._queue_listener is None
+
+    def test_queue_handler_writes_from_listener(self):
+        with patch.dict(os.environ, {"LOG_QUEUE": "true", "LOG_FORMAT": "json"}):
+            setup_logging()
+        root = logging.getLogger()
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+
+        stream = io.StringIO()
+        log_config._queue_listener.handlers[0].setStream(stream)
+        args = {"px": 1}
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("t").error("order %s", args, exc_info=True)
+        args["px"] = 2  # mutated after the call: message must keep the old value
+        log_config._stop_queue_listener()
+
+        entry = json.loads(stream.getvalue())
+        assert entry["message"] == "order {'px': 1}"
+        assert entry["exception"]["type"] == "ValueError"
+
+    def test_setup_again_stops_previous_listener(self):
+        with patch.dict(os.environ, {"LOG_QUEUE": "true"}):
+            setup_logging()
+            first = log_config._queue_listener
+            setup_logging()
+        assert log_config._queue_listener is not first
+        assert first._thread is None
+
 
 class TestJSONFormatter:
 
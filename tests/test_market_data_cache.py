@@ -3,7 +3,7 @@
 from unittest.mock import MagicMock, patch
 import pytest
 
-from market_data import MarketDataManager
+from market_data import MarketData, MarketDataManager
 
 
 def _make_l2(bid: float = 50000.0, ask: float = 50100.0) -> dict:
@@ -92,3 +92,134 @@ class TestMarketDataCache:
         info = MagicMock()
         mgr = MarketDataManager(info)
         assert mgr._cache_ttl == 2.0
+
+
+class TestCloseMatrix:
+
+    def test_rows_right_aligned_and_short_coins_dropped(self):
+        import numpy as np
+        import pandas as pd
+        mgr = MarketDataManager(MagicMock())
+        frames = {
+            'BTC': pd.DataFrame({'close': [1.0, 2.0, 3.0, 4.0]}),
+            'ETH': pd.DataFrame({'close': [10.0, 20.0, 30.0]}),
+            'SOL': pd.DataFrame({'close': [5.0]}),
+        }
+        mgr.get_candles = MagicMock(side_effect=lambda coin, interval, lookback: frames[coin])
+
+        coins, closes = mgr.get_close_matrix(['BTC', 'ETH', 'SOL'], '5m', 10, min_periods=2)
+
+        assert coins == ['BTC', 'ETH']
+        np.testing.assert_array_equal(closes, [[2.0, 3.0, 4.0], [10.0, 20.0, 30.0]])
+
+    def test_empty_when_no_data(self):
+        import pandas as pd
+        mgr = MarketDataManager(MagicMock())
+        mgr.get_candles = MagicMock(return_value=pd.DataFrame())
+        coins, closes = mgr.get_close_matrix(['BTC'], '5m')
+        assert coins == []
+        assert closes.shape == (0, 0)
+
+
+class TestSzDecimalsIndex:
+
+    _META = {'universe': [{'name': 'BTC', 'szDecimals': 5}, {'name': 'ETH', 'szDecimals': 4}]}
+
+    def test_lookup_by_name(self):
+        mgr = MarketDataManager(MagicMock())
+        mgr.seed_meta(self._META)
+        assert mgr.get_sz_decimals('BTC') == 5
+        assert mgr.get_sz_decimals('ETH') == 4
+        assert mgr.get_sz_decimals('DOGE') == 3
+
+    def test_index_built_once_per_meta(self):
+        mgr = MarketDataManager(MagicMock())
+        mgr.seed_meta(self._META)
+        mgr.get_sz_decimals('BTC')
+        index = mgr._sz_decimals_index
+        mgr.get_sz_decimals('ETH')
+        assert mgr._sz_decimals_index is index
+
+    def test_refetched_meta_rebuilds_index(self):
+        mgr = MarketDataManager(MagicMock())
+        mgr.seed_meta(self._META)
+        assert mgr.get_sz_decimals('BTC') == 5
+        mgr.seed_meta({'universe': [{'name': 'BTC', 'szDecimals': 2}]})
+        assert mgr.get_sz_decimals('BTC') == 2
+
+    def test_meta_error_keeps_last_known_decimals(self):
+        mgr = MarketDataManager(MagicMock())
+        mgr.seed_meta(self._META)
+        mgr.get_sz_decimals('BTC')
+        mgr._meta_cache.invalidate()
+        mgr.info.meta.side_effect = ConnectionError("down")
+        assert mgr.get_sz_decimals('BTC') == 5
+        assert mgr.get_sz_decimals('DOGE') == 3
+
+    def test_meta_error_before_first_fetch_uses_default(self):
+        mgr = MarketDataManager(MagicMock())
+        mgr.info.meta.side_effect = ConnectionError("down")
+        assert mgr.get_sz_decimals('BTC') == 3
+
+
+class TestMarketDataRecord:
+
+    def test_slotted_and_frozen(self):
+        import dataclasses
+        from datetime import datetime
+        md = MarketData(symbol='BTC', bid=1.0, ask=2.0, mid_price=1.5, spread=1.0,
+                        timestamp=datetime.now())
+        assert not hasattr(md, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            md.bid = 3.0
+
+
+class TestAdaptiveMetaTtl:
+
+    _META = {'universe': [{'name': 'BTC', 'szDecimals': 5}]}
+
+    def _refetch(self, mgr, meta):
+        mgr.info.meta.return_value = meta
+        mgr._meta_cache.invalidate()
+        return mgr.get_meta()
+
+    def test_fixed_ttl_by_default(self):
+        mgr = MarketDataManager(MagicMock(), meta_cache_ttl=300)
+        for _ in range(3):
+            self._refetch(mgr, dict(self._META))
+        assert mgr._meta_cache.ttl == 300
+
+    def test_unchanged_meta_doubles_ttl_up_to_cap(self):
+        mgr = MarketDataManager(MagicMock(), meta_cache_ttl=300, meta_cache_max_ttl=1000)
+        ttls = []
+        for _ in range(4):
+            self._refetch(mgr, dict(self._META))
+            ttls.append(mgr._meta_cache.ttl)
+        assert ttls == [300, 600, 1000, 1000]
+
+    def test_changed_meta_resets_ttl(self):
+        mgr = MarketDataManager(MagicMock(), meta_cache_ttl=300, meta_cache_max_ttl=1000)
+        mgr.seed_meta(dict(self._META))
+        self._refetch(mgr, dict(self._META))
+        assert mgr._meta_cache.ttl == 600
+        self._refetch(mgr, {'universe': self._META['universe'] + [{'name': 'NEW', 'szDecimals': 1}]})
+        assert mgr._meta_cache.ttl == 300
+
+
+class TestParseLevels:
+
+    _LEVELS = [
+        [{'px': '99.9', 'sz': '1.5'}, {'px': '99.8', 'sz': '2.25'}, {'px': '99.7', 'sz': '7'}],
+        [{'px': '100.1', 'sz': '0.5'}, {'px': '100.2', 'sz': '3'}],
+    ]
+
+    def test_imbalance_sums_top_levels(self):
+        mgr = MarketDataManager(MagicMock(), imbalance_depth=5)
+        md = mgr._parse_levels('BTC', self._LEVELS)
+        bid, ask = 1.5 + 2.25, 0.5 + 3.0
+        assert md.book_imbalance == (bid - ask) / (bid + ask)
+        assert (md.bid_size_top, md.ask_size_top) == (1.5, 0.5)
+
+    def test_zero_depth_disables_imbalance(self):
+        mgr = MarketDataManager(MagicMock(), imbalance_depth=0)
+        assert mgr._parse_levels('BTC', self._LEVELS).book_imbalance == 0.0
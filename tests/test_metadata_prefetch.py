@@ -0,0 +1,53 @@
+"""Tests for one-shot meta/spotMeta prefetch shared by every SDK Info."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from market_data import MarketDataManager
+
+
+@pytest.fixture
+def bot():
+    from bot import HyperliquidBot
+    b = HyperliquidBot.__new__(HyperliquidBot)
+    b.api_timeout = 10
+    b.http_session = MagicMock()
+    return b
+
+
+class TestFetchBaseMetadata:
+
+    @patch('bot.api_wrapper')
+    def test_returns_meta_and_spot_meta(self, mock_wrapper, bot):
+        meta = {'universe': [{'name': 'BTC', 'szDecimals': 5}]}
+        spot_meta = {'tokens': [], 'universe': []}
+        mock_wrapper.call.side_effect = [meta, spot_meta]
+
+        assert bot._fetch_base_metadata() == (meta, spot_meta)
+        payloads = [c.args[2] for c in mock_wrapper.call.call_args_list]
+        assert payloads == [{'type': 'meta', 'dex': ''}, {'type': 'spotMeta'}]
+
+    @patch('bot.api_wrapper')
+    def test_uses_shared_session(self, mock_wrapper, bot):
+        mock_wrapper.call.return_value = {}
+        bot._fetch_base_metadata()
+        api = mock_wrapper.call.call_args.args[0].__self__
+        assert api.session is bot.http_session
+
+    @patch('bot.api_wrapper')
+    def test_failure_falls_back_to_sdk_fetch(self, mock_wrapper, bot):
+        mock_wrapper.call.side_effect = ConnectionError("down")
+        assert bot._fetch_base_metadata() == (None, None)
+
+
+class TestSeedMeta:
+
+    def test_seeded_meta_served_without_api_call(self):
+        info = MagicMock()
+        mgr = MarketDataManager(info)
+        meta = {'universe': [{'name': 'ETH', 'szDecimals': 4}]}
+        mgr.seed_meta(meta)
+
+        assert mgr.get_meta() is meta
+        info.meta.assert_not_called()
@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from strategies.market_making_strategy import MarketMakingStrategy
-from ttl_cache import TTLCacheMap
+from ttl_cache import SingleFlight, TTLCacheMap
 
 
 def _make_strategy(imbalance_threshold=0.0, loss_streak_limit=0, loss_streak_cooldown=300):
@@ -282,6 +282,7 @@ class TestBookImbalanceInMarketData:
         real_mdm._cache = TTLCacheMap(ttl=2.0)
         real_mdm._cache_ttl = 2.0
         real_mdm._imbalance_depth = 5
+        real_mdm._flights = SingleFlight()
 
         with patch.object(type(real_mdm), 'get_l2_snapshot', return_value=l2):
             md = real_mdm.get_market_data('BTC')
@@ -295,6 +296,7 @@ class TestBookImbalanceInMarketData:
         real_mdm._cache = TTLCacheMap(ttl=2.0)
         real_mdm._cache_ttl = 2.0
         real_mdm._imbalance_depth = 5
+        real_mdm._flights = SingleFlight()
 
         l2 = {'levels': [
             [{'px': '99.99', 'sz': '100'}, {'px': '99.98', 'sz': '100'}],
@@ -312,6 +314,7 @@ class TestBookImbalanceInMarketData:
         real_mdm._cache = TTLCacheMap(ttl=2.0)
         real_mdm._cache_ttl = 2.0
         real_mdm._imbalance_depth = 5
+        real_mdm._flights = SingleFlight()
 
         l2 = {'levels': [
             [{'px': '99.99', 'sz': '10'}],
@@ -0,0 +1,53 @@
+"""Tests for cached EIP-712 L1 action signing."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from eth_account import Account
+from hyperliquid.utils.signing import sign_l1_action
+
+import hyperliquid.exchange as sdk_exchange
+from order_signing import install_cached_l1_signer, sign_l1_action_cached
+
+# Throwaway test key; never funded.
+_KEY = "0x" + "11" * 32
+
+_ORDER_ACTION = {
+    "type": "order",
+    "orders": [{"a": 0, "b": True, "p": "50000", "s": "0.01", "r": False,
+                "t": {"limit": {"tif": "Gtc"}}}],
+    "grouping": "na",
+}
+
+
+class TestSignL1ActionCached:
+
+    @pytest.mark.parametrize("is_mainnet", [True, False])
+    @pytest.mark.parametrize("active_pool,expires_after", [
+        (None, None),
+        ("0x" + "ab" * 20, 1_700_000_060_000),
+    ])
+    def test_matches_sdk_signature(self, is_mainnet, active_pool, expires_after):
+        wallet = Account.from_key(_KEY)
+        nonce = 1_700_000_000_000
+        expected = sign_l1_action(wallet, _ORDER_ACTION, active_pool, nonce, expires_after, is_mainnet)
+        actual = sign_l1_action_cached(wallet, _ORDER_ACTION, active_pool, nonce, expires_after, is_mainnet)
+        assert actual == expected
+
+    def test_wallet_without_key_falls_back_to_sdk(self):
+        wallet = MagicMock(spec=["sign_message"])
+        with patch("order_signing.sign_l1_action", return_value={"r": "0x1"}) as sdk_sign:
+            result = sign_l1_action_cached(wallet, _ORDER_ACTION, None, 1, None, True)
+        sdk_sign.assert_called_once_with(wallet, _ORDER_ACTION, None, 1, None, True)
+        assert result == {"r": "0x1"}
+
+
+class TestInstallCachedL1Signer:
+
+    def test_install_replaces_exchange_signer(self):
+        with patch.object(sdk_exchange, "sign_l1_action", sign_l1_action):
+            install_cached_l1_signer()
+            assert sdk_exchange.sign_l1_action is sign_l1_action_cached
+            install_cached_l1_signer()
+            assert sdk_exchange.sign_l1_action is sign_l1_action_cached
+        assert sdk_exchange.sign_l1_action is sign_l1_action
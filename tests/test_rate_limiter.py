@@ -0,0 +1,63 @@
+"""Unit tests for RateLimiter slot scheduling."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from rate_limiter import RateLimiter
+
+
+def _waits(rl, n, now=100.0):
+    """Call wait_if_needed *n* times at a frozen clock; return the sleeps."""
+    sleeps = []
+    with patch('rate_limiter.time.monotonic', return_value=now), \
+            patch('rate_limiter.time.sleep', side_effect=sleeps.append):
+        for _ in range(n):
+            rl.wait_if_needed()
+    return sleeps
+
+
+class TestWaitIfNeeded:
+
+    def test_first_call_does_not_wait(self):
+        assert _waits(RateLimiter(requests_per_second=2, burst_limit=10), 1) == []
+
+    def test_calls_spaced_by_min_interval(self):
+        sleeps = _waits(RateLimiter(requests_per_second=2, burst_limit=10), 3)
+        assert sleeps == [pytest.approx(0.5), pytest.approx(1.0)]
+
+    def test_burst_limit_pushes_slot_past_window(self):
+        sleeps = _waits(RateLimiter(requests_per_second=100, burst_limit=3), 3)
+        # Slots 100.00, 100.01, then the third would be the 3rd in 1s.
+        assert sleeps == [pytest.approx(0.01), pytest.approx(1.1)]
+
+    def test_backoff_added_to_interval(self):
+        rl = RateLimiter(requests_per_second=2, burst_limit=10, backoff_factor=2.0)
+        rl.on_429_error()
+        assert _waits(rl, 2) == [pytest.approx(2.5)]
+
+    def test_lock_released_while_sleeping(self):
+        rl = RateLimiter(requests_per_second=2, burst_limit=10)
+        held = []
+
+        def fake_sleep(_):
+            held.append(rl._lock.locked())
+
+        with patch('rate_limiter.time.monotonic', return_value=100.0), \
+                patch('rate_limiter.time.sleep', side_effect=fake_sleep):
+            rl.wait_if_needed()
+            rl.wait_if_needed()
+        assert held == [False]
+
+    def test_concurrent_callers_get_distinct_slots(self):
+        rl = RateLimiter(requests_per_second=20, burst_limit=20)
+        with patch('rate_limiter.time.sleep'):
+            threads = [threading.Thread(target=rl.wait_if_needed) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        slots = sorted(rl._request_times)
+        gaps = [b - a for a, b in zip(slots, slots[1:])]
+        assert all(g >= 0.05 - 1e-9 for g in gaps)
@@ -1,6 +1,6 @@
 """Unit tests for APICallWrapper automatic retry on 429 errors."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import pytest
 
 from rate_limiter import APICallWrapper, RateLimiter
@@ -105,6 +105,23 @@ class TestRetryOn429:
         assert wrapper.rate_limiter._consecutive_429s == 0
         assert wrapper.rate_limiter._current_backoff == 0.0
 
+    def test_429_retry_waits_backoff_once(self):
+        """The backoff is absorbed by the limiter's next slot, not slept twice."""
+        wrapper = _make_wrapper(max_backoff=60.0)
+        func = MagicMock(side_effect=[Exception("429"), "ok"])
+        clock = [1000.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("rate_limiter.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("rate_limiter.time.sleep", side_effect=fake_sleep):
+            assert wrapper.call(func) == "ok"
+
+        assert sleeps == [pytest.approx(2.0 + wrapper.rate_limiter.min_interval)]
+
     def test_retry_with_args_and_kwargs(self):
         """Arguments should be passed through on every retry attempt."""
         wrapper = _make_wrapper()
@@ -0,0 +1,67 @@
+"""Tests for HyperliquidBot._reset_connections."""
+
+from unittest.mock import MagicMock, patch
+
+from strategies.base_strategy import BaseStrategy
+
+
+class _Strategy(BaseStrategy):
+
+    def generate_signals(self, coin):
+        return None
+
+
+def _make_bot(strategy):
+    from bot import HyperliquidBot
+    b = HyperliquidBot.__new__(HyperliquidBot)
+    b.info = MagicMock()
+    b.market_data = MagicMock()
+    b.order_manager = MagicMock()
+    b.risk_manager = MagicMock()
+    b.hip3_dexes = []
+    b.strategy = strategy
+    b.connection_retry_count = 0
+    b._init_connections = MagicMock()
+    return b
+
+
+class TestResetConnections:
+
+    @patch('bot.time.sleep')
+    def test_old_signal_pool_released_before_reinit(self, _sleep):
+        strategy = _Strategy(MagicMock(), MagicMock(), {'signal_workers': 2})
+        strategy._evaluate_coins_concurrently(['BTC', 'ETH'])
+        old_pool = strategy._signal_pool
+        assert old_pool is not None
+
+        bot = _make_bot(strategy)
+        bot._reset_connections()
+
+        assert old_pool._shutdown
+        assert strategy._signal_pool is None
+        assert strategy.market_data is bot.market_data
+        assert bot.connection_retry_count == 0
+
+    @patch('bot.time.sleep')
+    def test_old_hip3_fetch_pool_released(self, _sleep):
+        from hip3.multi_dex_order_manager import MultiDexOrderManager
+        om = MultiDexOrderManager.__new__(MultiDexOrderManager)
+        om._fetch_workers = 2
+        om._fetch_pool = None
+        om._collect_hip3_items(['xyz', 'flx'], lambda dex: [], 'positions')
+        old_pool = om._fetch_pool
+        assert old_pool is not None
+
+        bot = _make_bot(MagicMock())
+        bot.order_manager = om
+        new_manager = MagicMock()
+
+        def rebuild():
+            bot.order_manager = new_manager
+        bot._init_connections.side_effect = rebuild
+
+        bot._reset_connections()
+
+        assert old_pool._shutdown
+        assert om._fetch_pool is None
+        assert bot.order_manager is new_manager
@@ -31,9 +31,12 @@ def bot():
         b.coins = ['BTC']
         b.main_loop_interval = 3
         b._risk_check_interval = 10.0
-        b._last_risk_check = 0.0
+        b._next_risk_check = 0.0
         b._last_risk_result = {'all_checks_passed': False, 'action': 'none'}
+        b._risk_summary_interval = 60.0
+        b._next_risk_summary = float('inf')
         b.adverse_tracker = None
+        b.order_update_feed = None
         b.imbalance_guard = None
 
         b.risk_manager.check_risk_limits.return_value = {
@@ -46,35 +49,77 @@ def bot():
 
 class TestRiskCheckThrottle:
 
-    @patch('time.time', return_value=1000.0)
+    @patch('bot.time.monotonic', return_value=1000.0)
     def test_first_cycle_always_checks(self, mock_time, bot):
-        """First cycle runs risk check because _last_risk_check=0."""
+        """First cycle runs risk check because _next_risk_check=0."""
         bot._trading_loop()
         bot.risk_manager.check_risk_limits.assert_called_once()
-        assert bot._last_risk_check == 1000.0
+        assert bot._next_risk_check == 1010.0
 
-    @patch('time.time', return_value=1000.0)
+    @patch('bot.time.monotonic', return_value=1000.0)
     def test_cached_result_within_interval(self, mock_time, bot):
         """Within interval, cached result is used without API call."""
-        bot._last_risk_check = 995.0  # 5s ago, within 10s interval
+        bot._next_risk_check = 1005.0  # checked 5s ago, 10s interval
         bot._last_risk_result = {'all_checks_passed': True, 'action': 'none'}
         bot._trading_loop()
         bot.risk_manager.check_risk_limits.assert_not_called()
 
-    @patch('time.time', return_value=1000.0)
+    @patch('bot.time.monotonic', return_value=1000.0)
     def test_check_runs_after_interval(self, mock_time, bot):
         """After interval elapses, risk check runs again."""
-        bot._last_risk_check = 989.0  # 11s ago, past 10s interval
+        bot._next_risk_check = 999.0  # checked 11s ago, 10s interval
         bot._last_risk_result = {'all_checks_passed': True, 'action': 'none'}
         bot._trading_loop()
         bot.risk_manager.check_risk_limits.assert_called_once()
-        assert bot._last_risk_check == 1000.0
+        assert bot._next_risk_check == 1010.0
 
-    @patch('time.time', return_value=1000.0)
+    @patch('bot.time.monotonic', return_value=1000.0)
     def test_fail_safe_default_blocks_until_first_check(self, mock_time, bot):
         """Default _last_risk_result has all_checks_passed=False."""
-        bot._last_risk_check = 999.0  # within interval, use cached
+        bot._next_risk_check = 1009.0  # within interval, use cached
         # Default is False — should cancel orders
         bot._last_risk_result = {'all_checks_passed': False, 'action': 'none', 'reason': 'initial'}
         bot._trading_loop()
         bot.order_manager.cancel_all_orders.assert_called()
+
+    @patch('bot.time.monotonic', return_value=1000.0)
+    @patch('bot.time.time', return_value=0.0)
+    def test_wall_clock_jump_does_not_stall_checks(self, mock_time, mock_mono, bot):
+        """A wall-clock step backwards must not postpone the next risk check."""
+        bot._next_risk_check = 1000.0
+        bot._last_risk_result = {'all_checks_passed': True, 'action': 'none'}
+        bot._trading_loop()
+        bot.risk_manager.check_risk_limits.assert_called_once()
+
+
+class TestRiskSummaryDeadline:
+
+    @patch('bot.time.monotonic', return_value=500.0)
+    def test_summary_logged_when_deadline_passed(self, mock_mono, bot):
+        """Summary fires once the monotonic deadline is reached, then re-arms."""
+        bot._next_risk_summary = 499.0
+        bot._next_risk_check = float('inf')
+        bot._last_risk_result = {'all_checks_passed': True, 'action': 'none'}
+        bot._trading_loop()
+        bot.risk_manager.get_risk_summary.assert_called_once()
+        assert bot._next_risk_summary == 560.0
+
+    @patch('bot.time.monotonic', return_value=500.0)
+    def test_summary_skipped_before_deadline(self, mock_mono, bot):
+        bot._next_risk_summary = 501.0
+        bot._next_risk_check = float('inf')
+        bot._last_risk_result = {'all_checks_passed': True, 'action': 'none'}
+        bot._trading_loop()
+        bot.risk_manager.get_risk_summary.assert_not_called()
+        assert bot._next_risk_summary == 501.0
+
+    @patch('bot.time.monotonic', return_value=500.0)
+    def test_summary_not_built_when_info_disabled(self, mock_mono, bot):
+        """With INFO filtered out the summary (and its API work) is skipped."""
+        bot._next_risk_summary = 0.0
+        bot._next_risk_check = float('inf')
+        bot._last_risk_result = {'all_checks_passed': True, 'action': 'none'}
+        with patch('bot.logger.isEnabledFor', return_value=False):
+            bot._trading_loop()
+        bot.risk_manager.get_risk_summary.assert_not_called()
+        assert bot._next_risk_summary == 560.0
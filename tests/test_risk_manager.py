@@ -94,6 +94,17 @@ class TestCheckRiskLimits:
         assert result['all_checks_passed'] is False
         assert result['max_positions_ok'] is False
 
+    def test_multiple_failures_keep_reason_order(self):
+        rm = _make_rm(
+            config_overrides={'max_open_positions': 3},
+            metrics=_make_metrics(leverage=5.0, num_positions=5),
+        )
+        rm.starting_balance = 10000.0
+        rm.daily_starting_balance = 10000.0
+        result = rm.check_risk_limits()
+        assert result['action'] == 'block_new_orders'
+        assert result['reason'] == "Leverage too high: 5.00; Max open positions exceeded: 5/3"
+
     def test_force_close_margin_triggers(self):
         rm = _make_rm(
             config_overrides={'force_close_margin': 0.85},
@@ -467,6 +478,22 @@ class TestActionPriority:
         assert result['force_close_all'] is True
         assert result['stop_bot'] is True
 
+    def test_more_severe_never_downgrades(self):
+        from risk_manager import _more_severe
+        assert _more_severe('none', 'pause') == 'pause'
+        assert _more_severe('stop_bot', 'block_new_orders') == 'stop_bot'
+        assert _more_severe('cooldown', 'unknown') == 'cooldown'
+
+    def test_result_carries_legacy_check_keys(self):
+        rm = _make_rm(metrics=_make_metrics())
+        rm.starting_balance = 10000.0
+        rm.daily_starting_balance = 10000.0
+        first = rm.check_risk_limits()
+        second = rm.check_risk_limits()
+        assert first is not second
+        assert {'leverage_ok', 'margin_ratio_ok', 'drawdown_ok', 'daily_loss_ok', 'max_positions_ok',
+                'all_checks_passed', 'action', 'force_close_all', 'stop_bot', 'reason'} <= set(first)
+
 
 # ------------------------------------------------------------------ #
 #  HIP-3 market_data integration
@@ -547,3 +574,166 @@ class TestHIP3MarketDataIntegration:
         # Two api_wrapper.call: one for standard HL, one for xyz
         assert mock_wrapper.call.call_count == 2
         assert metrics.num_positions == 1  # 1 GOLD
+
+
+# ------------------------------------------------------------------ #
+#  Shared user_state source (OrderManager cache)
+# ------------------------------------------------------------------ #
+
+class TestUserStateSource:
+
+    @patch("risk_manager.api_wrapper")
+    @patch("risk_manager.get_account_snapshot")
+    def test_uses_injected_source_instead_of_api(self, mock_snapshot, mock_wrapper):
+        """With user_state_source, standard user_state comes from the shared cache."""
+        from account_utils import AccountSnapshot
+
+        mock_snapshot.return_value = AccountSnapshot(
+            account_value=10000.0, margin_used=2000.0,
+        )
+        source = MagicMock(return_value={
+            'marginSummary': {'totalNtlPos': '5000'},
+            'assetPositions': [
+                {'position': {'coin': 'BTC', 'unrealizedPnl': '100'}},
+            ],
+        })
+
+        rm = RiskManager(
+            info=MagicMock(), account_address="0xtest", config=_make_config(),
+            user_state_source=source,
+        )
+        metrics = rm.get_current_metrics()
+
+        assert metrics is not None
+        assert metrics.num_positions == 1
+        source.assert_called_once_with()
+        mock_wrapper.call.assert_not_called()
+
+    def test_source_error_returns_none(self):
+        """API errors raised by the shared source are handled like direct calls."""
+        source = MagicMock(side_effect=ConnectionError("down"))
+        rm = RiskManager(
+            info=MagicMock(), account_address="0xtest", config=_make_config(),
+            user_state_source=source,
+        )
+        assert rm.get_current_metrics() is None
+
+
+class TestMetricsHistory:
+
+    @patch("risk_manager.get_account_snapshot")
+    def test_history_is_bounded_ring_buffer(self, mock_snapshot):
+        """History evicts the oldest entries in place instead of re-slicing a list."""
+        from account_utils import AccountSnapshot
+
+        mock_snapshot.return_value = AccountSnapshot(account_value=10000.0, margin_used=0.0)
+        source = MagicMock(return_value={'marginSummary': {'totalNtlPos': '0'}, 'assetPositions': []})
+        rm = RiskManager(
+            info=MagicMock(), account_address="0xtest", config=_make_config(),
+            user_state_source=source,
+        )
+        history = rm.risk_metrics_history
+        maxlen = history.maxlen
+
+        for _ in range(maxlen + 10):
+            latest = rm.get_current_metrics()
+
+        assert rm.risk_metrics_history is history
+        assert len(history) == maxlen
+        assert history[-1] is latest
+
+    @patch("risk_manager.get_account_snapshot")
+    def test_daily_reset_uses_metrics_timestamp(self, mock_snapshot):
+        """The day rollover and the metrics timestamp come from one clock read."""
+        from account_utils import AccountSnapshot
+
+        mock_snapshot.return_value = AccountSnapshot(account_value=9000.0, margin_used=0.0)
+        source = MagicMock(return_value={'marginSummary': {'totalNtlPos': '0'}, 'assetPositions': []})
+        rm = RiskManager(
+            info=MagicMock(), account_address="0xtest", config=_make_config(),
+            user_state_source=source,
+        )
+        rm.starting_balance = rm.daily_starting_balance = 10000.0
+        rm.last_reset_date = (datetime.now() - timedelta(days=1)).date()
+
+        metrics = rm.get_current_metrics()
+
+        assert rm.last_reset_date == metrics.timestamp.date()
+        assert rm.daily_starting_balance == 9000.0
+
+
+class TestRebind:
+
+    def test_rebind_keeps_tracking_state(self):
+        rm = _make_rm()
+        rm.starting_balance = 10000.0
+        rm.daily_starting_balance = 9500.0
+        rm._emergency_stop_time = datetime.now()
+        new_info, new_source = MagicMock(), MagicMock()
+
+        rm.rebind(new_info, user_state_source=new_source)
+
+        assert rm.info is new_info
+        assert rm._user_state_source is new_source
+        assert rm.starting_balance == 10000.0
+        assert rm.daily_starting_balance == 9500.0
+        assert rm._emergency_stop_time is not None
+
+    def test_rebind_invalidates_cached_metrics(self):
+        rm = _make_rm()
+        rm.risk_metrics_history.append(_make_metrics())
+        rm._last_metrics_time = 1e12
+        rm.get_current_metrics = MagicMock(return_value=None)
+
+        rm.rebind(MagicMock())
+        rm._get_cached_metrics()
+
+        rm.get_current_metrics.assert_called_once()
+
+
+class TestSingleMetricsFetch:
+    """Compound checks evaluate one metrics snapshot (cache TTL is 0 here)."""
+
+    def _rm(self):
+        rm = _make_rm()
+        rm.starting_balance = 10000.0
+        rm.daily_starting_balance = 10000.0
+        rm.get_current_metrics = MagicMock(return_value=_make_metrics())
+        return rm
+
+    def test_should_allow_new_position_fetches_once(self):
+        rm = self._rm()
+        assert rm.should_allow_new_position('BTC', 0.01, 50000.0) is True
+        rm.get_current_metrics.assert_called_once()
+
+    def test_should_allow_new_position_rejects_oversize(self):
+        rm = self._rm()
+        # limit = min(10000 * 0.2, 8000 * 3) / 50000 = 0.04
+        assert rm.should_allow_new_position('BTC', 0.05, 50000.0) is False
+        rm.get_current_metrics.assert_called_once()
+
+    def test_risk_summary_fetches_once(self):
+        rm = self._rm()
+        summary = rm.get_risk_summary()
+        assert summary['risk_status'] == 'OK'
+        rm.get_current_metrics.assert_called_once()
+
+    def test_position_size_limit_uses_given_metrics(self):
+        rm = self._rm()
+        assert rm.calculate_position_size_limit('BTC', 50000.0, _make_metrics()) == 0.04
+        rm.get_current_metrics.assert_not_called()
+
+
+class TestOrderManagerUserStateShared:
+
+    @patch("order_manager.api_wrapper")
+    def test_get_user_state_uses_ttl_cache(self, mock_wrapper):
+        """Repeated get_user_state() calls within the TTL hit the API once."""
+        from order_manager import OrderManager
+
+        mock_wrapper.call.return_value = {'assetPositions': []}
+        om = OrderManager(MagicMock(), MagicMock(), "0xtest")
+        om.get_user_state()
+        om.get_all_positions()
+        om.get_user_state()
+        assert mock_wrapper.call.call_count == 1
@@ -139,3 +139,29 @@ class TestGetSzDecimals:
         om._get_sz_decimals('BTC')
         # Second call should use cache, so info.meta called only once
         assert mock_wrapper.call.call_count == 1
+
+    @patch('order_manager.api_wrapper')
+    def test_one_meta_call_fills_whole_universe(self, mock_wrapper):
+        meta = {'universe': [{'name': 'BTC', 'szDecimals': 5}, {'name': 'ETH', 'szDecimals': 4}]}
+        mock_wrapper.call.side_effect = lambda fn, *a, **kw: fn(*a, **kw)
+        om = self._make_om(meta)
+        assert om._get_sz_decimals('BTC') == 5
+        assert om._get_sz_decimals('ETH') == 4
+        assert mock_wrapper.call.call_count == 1
+
+    @patch('order_manager.api_wrapper')
+    def test_unlisted_coin_default_is_cached(self, mock_wrapper):
+        meta = {'universe': [{'name': 'BTC', 'szDecimals': 5}]}
+        mock_wrapper.call.side_effect = lambda fn, *a, **kw: fn(*a, **kw)
+        om = self._make_om(meta)
+        assert om._get_sz_decimals('xyz:GOLD') == 3
+        assert om._get_sz_decimals('xyz:GOLD') == 3
+        assert mock_wrapper.call.call_count == 1
+
+    @patch('order_manager.api_wrapper')
+    def test_error_is_not_cached(self, mock_wrapper):
+        mock_wrapper.call.side_effect = ConnectionError("API error")
+        om = self._make_om()
+        om._get_sz_decimals('BTC')
+        om._get_sz_decimals('BTC')
+        assert mock_wrapper.call.call_count == 2
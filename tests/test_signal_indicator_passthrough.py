@@ -8,7 +8,7 @@ Each test class covers one strategy and verifies:
 """
 
 import logging
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import pandas as pd
 import numpy as np
 
@@ -46,10 +46,12 @@ class TestRSISignalPassthrough:
         strategy.size_multiplier_extreme = 1.5
         strategy.size_multiplier_moderate = 1.2
         strategy.positions = {}
+        strategy._md_snapshot = {}
         strategy.market_data = MagicMock()
         strategy.order_manager = MagicMock()
         strategy.config = {}
         strategy._last_rsi = {}
+        strategy._rsi_snapshot = {}
         return strategy
 
     def _make_oversold_candles(self):
@@ -146,6 +148,7 @@ class TestBBSignalPassthrough:
         strategy.low_band_width_threshold = 0.02
         strategy.low_band_width_multiplier = 1.2
         strategy.positions = {}
+        strategy._md_snapshot = {}
         strategy.market_data = MagicMock()
         strategy.order_manager = MagicMock()
         strategy.config = {}
@@ -162,6 +165,18 @@ class TestBBSignalPassthrough:
         assert size > 0
         strategy.market_data.get_candles.assert_not_called()
 
+    def test_signal_and_sizing_share_one_candle_fetch(self):
+        strategy = self._make_strategy()
+        closes = np.append(100 + 2 * np.sin(np.arange(39)), 90.0)
+        strategy.market_data.get_candles.return_value = pd.DataFrame({'close': closes})
+        strategy.market_data.get_market_data.return_value = _make_market_data_mock()
+        strategy._apply_account_cap = lambda size, price, **kw: size / price
+
+        signal = strategy.generate_signals('ETH')
+        assert signal['side'] == 'buy'
+        assert strategy.calculate_position_size('ETH', signal) > 0
+        strategy.market_data.get_candles.assert_called_once()
+
     def test_high_band_width_reduces_size(self):
         """High band width should apply reduction multiplier."""
         strategy = self._make_strategy()
@@ -229,6 +244,7 @@ class TestMACDSignalPassthrough:
         strategy.histogram_multiplier_high = 1.3
         strategy.histogram_multiplier_low = 0.7
         strategy.positions = {}
+        strategy._md_snapshot = {}
         strategy.market_data = MagicMock()
         strategy.order_manager = MagicMock()
         strategy.config = {}
@@ -248,6 +264,34 @@ class TestMACDSignalPassthrough:
         assert size > 0
         strategy.market_data.get_candles.assert_not_called()
 
+    def test_signal_and_sizing_share_one_candle_fetch(self):
+        strategy = self._make_strategy()
+        # Steady decline then an uptick: bullish crossover below zero.
+        closes = np.append(np.linspace(120, 100, 54), 103.0)
+        candles = pd.DataFrame({'close': closes, 'high': closes + 1, 'low': closes - 1})
+        strategy.market_data.get_candles.return_value = candles
+        strategy.market_data.get_market_data.return_value = _make_market_data_mock()
+        strategy._apply_account_cap = lambda size, price, **kw: size / price
+
+        signal = strategy.generate_signals('BTC')
+        assert signal['side'] == 'buy'
+        expected = abs(strategy.calculate_macd(candles)['histogram_pct'].iloc[-1])
+        assert signal['histogram_strength'] == expected
+        assert type(signal['histogram_strength']) is float
+        assert strategy.calculate_position_size('BTC', signal) > 0
+        strategy.market_data.get_candles.assert_called_once()
+
+    def test_signal_path_builds_no_indicator_frame(self):
+        strategy = self._make_strategy()
+        closes = np.append(np.linspace(120, 100, 54), 103.0)
+        strategy.market_data.get_candles.return_value = pd.DataFrame(
+            {'close': closes, 'high': closes + 1, 'low': closes - 1})
+        expected = strategy.generate_signals('BTC')
+
+        with patch.object(strategy, 'calculate_macd', side_effect=AssertionError), \
+                patch.object(strategy, 'detect_divergence', side_effect=AssertionError):
+            assert strategy.generate_signals('BTC') == expected
+
     def test_high_histogram_increases_size(self):
         strategy = self._make_strategy()
         strategy.market_data.get_market_data.return_value = _make_market_data_mock()
@@ -311,6 +355,7 @@ class TestBreakoutSignalPassthrough:
         strategy.low_atr_multiplier = 1.3
         strategy.support_resistance_levels = {}
         strategy.positions = {}
+        strategy._md_snapshot = {}
         strategy.market_data = MagicMock()
         strategy.order_manager = MagicMock()
         strategy.config = {}
@@ -20,6 +20,7 @@ def _make_rsi():
     s.market_data = MagicMock()
     s.order_manager = MagicMock()
     s._last_rsi = {}
+    s._rsi_snapshot = {}
     return s
 
 
@@ -141,3 +142,82 @@ class TestGridKeyError:
         s.generate_signals('BTC')
         # Should NOT recalculate (only 5 bars since update, threshold is 20)
         assert s.active_grids['BTC']['levels'] == original_levels
+
+    def test_sliding_window_counts_bars_since_update(self):
+        """get_candles returns a fixed-length window, so bars since the update
+        must come from the stored timestamp's position, not from len(candles)."""
+        s = _make_grid()
+
+        n = 90
+        prices = [100 + 0.5 * np.sin(i / 5) for i in range(n)]
+        full = pd.DataFrame({
+            'close': prices,
+            'high': [p + 0.2 for p in prices],
+            'low': [p - 0.2 for p in prices],
+        }, index=pd.date_range('2026-01-01', periods=n, freq='15min'))
+        original_levels = [('buy', 99.5), ('sell', 100.5)]
+
+        for shift, recalculated in ((19, False), (20, True)):
+            window = full.iloc[shift:shift + 60]
+            s._get_candles_or_none = MagicMock(return_value=window)
+            s.active_grids['BTC'] = {
+                'levels': original_levels,
+                'filled_orders': {'buy_99.50': True},
+                'last_update': full.index[59],
+            }
+            s.generate_signals('BTC')
+            assert (s.active_grids['BTC']['levels'] != original_levels) is recalculated
+
+
+class TestGridLevelLookup:
+    """The bisect level lookup picks the level the original linear scan did."""
+
+    @staticmethod
+    def _reference(s, coin, grid_info, current_price):
+        """The original per-tick scan over the price-sorted levels."""
+        for order_type, grid_price in grid_info['levels']:
+            price_key = f"{order_type}_{grid_price:.2f}"
+            if price_key in grid_info['filled_orders']:
+                continue
+            if order_type == 'buy' and current_price <= grid_price * 1.001:
+                if len(s.positions) < s.max_positions:
+                    grid_info['filled_orders'][price_key] = True
+                    return ('buy', grid_price)
+            elif order_type == 'sell' and current_price >= grid_price * 0.999:
+                if coin in s.positions and s.positions[coin]['size'] > 0:
+                    grid_info['filled_orders'][price_key] = True
+                    return ('sell', grid_price)
+        return None
+
+    def _run(self, s, levels, filled, price):
+        n = 60
+        df = pd.DataFrame({
+            'close': [price] * n,
+            'high': [price * 1.01] * n,
+            'low': [price * 0.99] * n,
+        }, index=pd.date_range('2026-01-01', periods=n, freq='15min'))
+        s._get_candles_or_none = MagicMock(return_value=df)
+        s.active_grids['BTC'] = {'levels': levels, 'filled_orders': dict(filled), 'last_update': df.index[-1]}
+        signal = s.generate_signals('BTC')
+        return (signal['side'], signal['grid_price']) if signal else None
+
+    def test_matches_reference_scan(self):
+        rng = np.random.default_rng(4)
+        seen = set()
+        for _ in range(300):
+            s = _make_grid()
+            s.positions = {'BTC': {'size': 1.0}} if rng.random() < 0.6 else {}
+            s.max_positions = int(rng.integers(0, 3))
+            price = float(100 + rng.normal(0, 0.8))
+            levels = s.calculate_grid_levels({'current': 100.0, 'low': 97.0, 'high': 103.0})
+            filled = {f"{t}_{p:.2f}": True for t, p in levels if rng.random() < 0.3}
+            expected = self._reference(s, 'BTC', {'levels': levels, 'filled_orders': dict(filled)}, price)
+            seen.add(expected[0] if expected else None)
+            assert self._run(s, levels, filled, price) == expected
+        assert seen == {'buy', 'sell', None}
+
+    def test_colliding_keys_share_fill_marker(self):
+        s = _make_grid()
+        levels = [('buy', 0.0495), ('buy', 0.0497)]  # both format as buy_0.05
+        assert self._run(s, levels, {'buy_0.05': True}, 0.049) is None
+        assert self._run(s, levels, {}, 0.049) == ('buy', 0.0495)
@@ -1,5 +1,8 @@
 """Unit tests for strategy calculations (no network required)."""
 
+from typing import Callable, Dict, NamedTuple, Tuple
+
+import pytest
 import pandas as pd
 import numpy as np
 
@@ -75,6 +78,61 @@ class TestBollingerBandsCalculation:
         within_range = ((valid['price_position'] >= 0) & (valid['price_position'] <= 1)).mean()
         assert within_range > 0.7  # At least 70% within bands
 
+    def test_matches_pandas_series_expressions(self):
+        strategy = self._make_strategy()
+        np.random.seed(3)
+        closes = np.concatenate((np.full(25, 100.0), 100 + np.cumsum(np.random.randn(30))))
+        result = strategy.calculate_bollinger_bands(pd.DataFrame({'close': closes}))
+
+        close = pd.Series(closes)
+        sma = close.rolling(20).mean()
+        std = close.rolling(20).std()
+        upper = sma + std * 2
+        lower = sma - std * 2
+        pd.testing.assert_series_equal(result['upper_band'], upper, check_names=False, atol=1e-12)
+        pd.testing.assert_series_equal(result['band_width'], (upper - lower) / sma,
+                                       check_names=False, atol=1e-12)
+        pd.testing.assert_series_equal(result['price_position'], (close - lower) / (upper - lower),
+                                       check_names=False, atol=1e-12)
+
+    def test_repeat_call_replaces_band_columns(self):
+        strategy = self._make_strategy()
+        np.random.seed(5)
+        df = pd.DataFrame({'close': 100 + np.cumsum(np.random.randn(30))})
+        first = strategy.calculate_bollinger_bands(df)
+        second = strategy.calculate_bollinger_bands(first)
+        assert list(second.columns) == list(first.columns)
+        pd.testing.assert_frame_equal(second, first)
+        assert list(df.columns) == ['close']
+
+    def test_tail_bands_match_full_history(self):
+        strategy = self._make_strategy()
+        np.random.seed(11)
+        closes = 100 + np.cumsum(np.random.randn(40))
+        full = strategy.calculate_bollinger_bands(pd.DataFrame({'close': closes}))
+        tail = strategy._bands(closes[-21:])
+        for column, values in tail.items():
+            assert values[-2:].tolist() == full[column].iloc[-2:].tolist()
+
+    def test_breakout_tail_matches_full_history_mean(self):
+        strategy = self._make_strategy()
+        strategy.volatility_expansion_threshold = 1.0
+        closes = np.concatenate([np.full(30, 100.0), 100 + np.cumsum(np.abs(np.random.RandomState(3).randn(4)))])
+        full = strategy.calculate_bollinger_bands(pd.DataFrame({'close': closes}))
+        tail = closes[-(strategy.bb_period + 4):]
+        widths = strategy._bands(tail)['band_width']
+        assert widths[-5:].tolist() == full['band_width'].iloc[-5:].tolist()
+        expected = full['band_width'].iloc[-1] > full['band_width'].iloc[-5:].mean()
+        signal = strategy._detect_volatility_breakout(widths, tail)
+        assert expected and signal is not None and signal['side'] == 'buy'
+
+    def test_breakout_skips_nan_widths_in_mean(self):
+        strategy = self._make_strategy()
+        strategy.volatility_expansion_threshold = 1.0
+        widths = np.array([np.nan, np.nan, 0.01, 0.01, 0.05])
+        signal = strategy._detect_volatility_breakout(widths, np.array([100.0, 101.0]))
+        assert signal is not None
+
 
 class TestMACDCalculation:
     """Test MACD calculation."""
@@ -104,6 +162,62 @@ class TestMACDCalculation:
         hist = valid['macd_histogram'].values
         np.testing.assert_allclose(diff, hist, atol=1e-10)
 
+    def test_macd_matches_pandas_ewm(self):
+        strategy = self._make_strategy()
+        np.random.seed(7)
+        closes = pd.Series(100 + np.cumsum(np.random.randn(80)))
+        result = strategy.calculate_macd(pd.DataFrame({'close': closes}))
+        macd = closes.ewm(span=12, adjust=False).mean() - closes.ewm(span=26, adjust=False).mean()
+        signal = macd.ewm(span=9, adjust=False).mean()
+        np.testing.assert_allclose(result['macd_line'], macd, atol=1e-10)
+        np.testing.assert_allclose(result['signal_line'], signal, atol=1e-10)
+
+    def test_divergence_matches_pandas_reference(self):
+        strategy = self._make_strategy()
+
+        def reference(df, lookback):
+            recent = df.iloc[-lookback:]
+            result = {'bullish_divergence': False, 'bearish_divergence': False}
+            lows_idx = recent['low'].nsmallest(2).index
+            if len(lows_idx) >= 2:
+                i1, i2 = sorted(lows_idx)
+                result['bullish_divergence'] = bool(
+                    recent.loc[i2, 'low'] < recent.loc[i1, 'low']
+                    and recent.loc[i2, 'macd_histogram'] > recent.loc[i1, 'macd_histogram'])
+            highs_idx = recent['high'].nlargest(2).index
+            if len(highs_idx) >= 2:
+                i1, i2 = sorted(highs_idx)
+                result['bearish_divergence'] = bool(
+                    recent.loc[i2, 'high'] > recent.loc[i1, 'high']
+                    and recent.loc[i2, 'macd_histogram'] < recent.loc[i1, 'macd_histogram'])
+            return result
+
+        rng = np.random.RandomState(12)
+        for _ in range(200):
+            # Coarse integer prices force ties on the extremes.
+            n = 30
+            df = pd.DataFrame({
+                'high': rng.randint(0, 6, n).astype(float),
+                'low': rng.randint(0, 6, n).astype(float),
+                'macd_histogram': rng.randn(n),
+            }, index=pd.date_range('2026-01-01', periods=n, freq='15min'))
+            if rng.rand() < 0.3:
+                df.iloc[rng.randint(n - 20, n), 0] = np.nan
+                df.iloc[rng.randint(n - 20, n), 1] = np.nan
+            assert strategy.detect_divergence(df) == reference(df, 20)
+        short = pd.DataFrame({'high': [1.0], 'low': [1.0], 'macd_histogram': [0.0]})
+        assert strategy.detect_divergence(short) == reference(short, 20)
+
+    def test_pct_columns_and_repeat_call(self):
+        strategy = self._make_strategy()
+        np.random.seed(8)
+        df = pd.DataFrame({'close': 100 + np.cumsum(np.random.randn(40))})
+        result = strategy.calculate_macd(df)
+        pd.testing.assert_series_equal(
+            result['histogram_pct'], (result['macd_histogram'] / result['close']) * 100, check_names=False)
+        pd.testing.assert_frame_equal(strategy.calculate_macd(result), result)
+        assert list(df.columns) == ['close']
+
 
 class TestMovingAverageCalculation:
     """Test Simple MA calculation."""
@@ -123,3 +237,443 @@ class TestMovingAverageCalculation:
         result = strategy.calculate_moving_averages(df)
         last = result.iloc[-1]
         assert last['ma_fast'] > last['ma_slow']
+
+
+class TestIndicatorKernels:
+    """NumPy kernels in strategies.indicators vs the pandas expressions they replace."""
+
+    def _closes(self, n=120, seed=3):
+        rng = np.random.default_rng(seed)
+        return 1000 + np.cumsum(rng.normal(0, 5, n))
+
+    def test_rolling_mean_and_std_match_pandas(self):
+        from strategies.indicators import rolling_mean, rolling_std
+        closes = self._closes()
+        s = pd.Series(closes)
+        np.testing.assert_allclose(rolling_mean(closes, 20), s.rolling(20).mean(), rtol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(rolling_std(closes, 20), s.rolling(20).std(), rtol=1e-9, equal_nan=True)
+
+    def test_rolling_mean_matrix_matches_pandas(self):
+        from strategies.indicators import rolling_mean_matrix
+        np.random.seed(1)
+        closes = 100 + np.cumsum(np.random.randn(3, 40), axis=1)
+        result = rolling_mean_matrix(closes, 7)
+        for row, series in zip(result, closes):
+            expected = pd.Series(series).rolling(7).mean().dropna().to_numpy()
+            np.testing.assert_allclose(row, expected, rtol=1e-12)
+
+    def test_rsi_matrix_matches_rsi(self):
+        from strategies.indicators import rsi, rsi_matrix
+        rng = np.random.RandomState(2)
+        closes = 100 + np.cumsum(rng.randn(3, 40), axis=1)
+        for row, series in zip(rsi_matrix(closes, 14), closes):
+            assert row.tolist() == rsi(series, 14)[14:].tolist()
+
+    def test_rolling_std_flat_window_is_zero(self):
+        from strategies.indicators import rolling_std
+        assert rolling_std(np.full(25, 100.1), 20)[-1] == 0.0
+
+    def test_short_input_is_all_nan(self):
+        from strategies.indicators import rolling_mean, rolling_std
+        assert np.isnan(rolling_mean(np.arange(5.0), 10)).all()
+        assert np.isnan(rolling_std(np.arange(5.0), 10)).all()
+
+    def test_rsi_matches_pandas(self):
+        from strategies.indicators import rsi
+        closes = self._closes()
+        delta = pd.Series(closes).diff()
+        gain = delta.where(delta > 0, 0).rolling(14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+        expected = 100 - (100 / (1 + gain / loss.replace(0, np.nan)))
+        np.testing.assert_allclose(rsi(closes, 14), expected, rtol=1e-9, equal_nan=True)
+
+    def test_kernels_need_no_warm_up(self):
+        """Plain NumPy kernels: nothing to compile, any length works on first call."""
+        from strategies import indicators
+        for n in (0, 1, 64):
+            z = np.zeros(n)
+            for values in (
+                indicators.rolling_mean(z, 14), indicators.rolling_std(z, 14),
+                indicators.rsi(z, 14), indicators.true_range(z, z, z), indicators.ema(z, 12),
+            ):
+                assert values.shape == (n,)
+
+    def test_rsi_tail_matches_full_history(self):
+        from strategies.indicators import rsi
+        for seed in range(5):
+            closes = self._closes(seed=seed)
+            assert rsi(closes[-16:], 14)[-2:].tolist() == rsi(closes, 14)[-2:].tolist()
+
+    def test_rsi_nan_without_losses(self):
+        from strategies.indicators import rsi
+        assert np.isnan(rsi(np.arange(1.0, 30.0), 14)[-1])
+
+    def test_ema_matches_pandas(self):
+        from strategies.indicators import ema
+        closes = self._closes()
+        expected = pd.Series(closes).ewm(span=12, adjust=False).mean()
+        np.testing.assert_allclose(ema(closes, 12), expected, rtol=1e-12)
+        assert len(ema(np.array([]), 12)) == 0
+
+    def test_atr_matches_pandas(self):
+        from strategies.indicators import rolling_mean, true_range
+        closes = self._closes()
+        df = pd.DataFrame({'close': closes, 'high': closes + 3, 'low': closes - 4})
+        ranges = pd.concat([
+            df['high'] - df['low'],
+            np.abs(df['high'] - df['close'].shift()),
+            np.abs(df['low'] - df['close'].shift()),
+        ], axis=1)
+        expected = np.max(ranges, axis=1).rolling(14).mean()
+        tr = true_range(df['high'].to_numpy(), df['low'].to_numpy(), df['close'].to_numpy())
+        np.testing.assert_allclose(rolling_mean(tr, 14), expected, rtol=1e-12, equal_nan=True)
+
+    def test_true_range_matches_row_max(self):
+        from strategies.indicators import true_range
+        rng = np.random.RandomState(6)
+        close = 100 + np.cumsum(rng.randn(40) * 2)
+        high = close + rng.rand(40)
+        low = close - rng.rand(40)
+        high[7] = np.nan
+        df = pd.DataFrame({'high': high, 'low': low, 'close': close})
+        expected = pd.concat([
+            df['high'] - df['low'],
+            np.abs(df['high'] - df['close'].shift()),
+            np.abs(df['low'] - df['close'].shift()),
+        ], axis=1).max(axis=1)
+        np.testing.assert_array_equal(true_range(high, low, close), expected.to_numpy())
+
+    def test_latest_atr_matches_full_column(self):
+        from strategies.breakout_strategy import BreakoutStrategy
+        strategy = BreakoutStrategy.__new__(BreakoutStrategy)
+        strategy.atr_period = 14
+        for seed in range(5):
+            np.random.seed(seed)
+            closes = 100 + np.cumsum(np.random.randn(50))
+            df = pd.DataFrame({
+                'close': closes,
+                'high': closes + np.random.rand(50),
+                'low': closes - np.random.rand(50),
+            })
+            assert strategy._latest_atr(df) == strategy.calculate_atr(df.copy())['atr'].iloc[-1]
+
+
+class TestBreakoutPivots:
+    """Test vectorised pivot detection in BreakoutStrategy."""
+
+    def _make_strategy(self, pivot_window=5):
+        from strategies.breakout_strategy import BreakoutStrategy
+        strategy = BreakoutStrategy.__new__(BreakoutStrategy)
+        strategy.lookback_period = 20
+        strategy.pivot_window = pivot_window
+        return strategy
+
+    @staticmethod
+    def _reference_pivots(df, pw):
+        """The original per-bar loop, kept as the behavioural reference."""
+        highs, lows = [], []
+        for i in range(pw, len(df) - pw):
+            if df['high'].iloc[i] == max(df['high'].iloc[i-pw:i+pw]):
+                highs.append(df['high'].iloc[i])
+            if df['low'].iloc[i] == min(df['low'].iloc[i-pw:i+pw]):
+                lows.append(df['low'].iloc[i])
+        return highs, lows
+
+    def _df(self, n=200, seed=7):
+        np.random.seed(seed)
+        closes = np.round(100 + np.cumsum(np.random.randn(n)), 1)
+        return pd.DataFrame({'close': closes, 'high': closes + 0.5, 'low': closes - 0.5})
+
+    def test_matches_reference_loop(self):
+        from strategies.breakout_strategy import _pivot_values
+        df = self._df()
+        highs, lows = self._reference_pivots(df, 5)
+        assert _pivot_values(df['high'].to_numpy(), 5, np.fmax) == highs
+        assert _pivot_values(df['low'].to_numpy(), 5, np.fmin) == lows
+
+    def test_short_history_has_no_pivots(self):
+        strategy = self._make_strategy(pivot_window=5)
+        levels = strategy.identify_support_resistance(self._df(n=10))
+        assert levels['strong_resistance'] is None
+        assert levels['strong_support'] is None
+
+    def test_levels_use_most_frequent_pivot(self):
+        strategy = self._make_strategy(pivot_window=2)
+        highs = [1, 2, 5, 2, 1, 2, 5, 2, 1, 2, 3, 2, 1]
+        df = pd.DataFrame({
+            'high': np.array(highs, dtype=float),
+            'low': np.array(highs, dtype=float) - 1,
+            'close': np.array(highs, dtype=float) - 0.5,
+        })
+        levels = strategy.identify_support_resistance(df)
+        assert levels['strong_resistance'] == 5.0
+
+    def test_levels_match_pandas_reference(self):
+        strategy = self._make_strategy(pivot_window=5)
+        for seed in range(5):
+            df = self._df(n=60, seed=seed)
+            levels = strategy.identify_support_resistance(df)
+            assert levels['resistance'] == df['high'].rolling(20).max().iloc[-1]
+            assert levels['support'] == df['low'].rolling(20).min().iloc[-1]
+        assert np.isnan(strategy.identify_support_resistance(self._df(n=10))['resistance'])
+
+    def test_tied_levels_keep_first_seen(self):
+        from strategies.breakout_strategy import _most_frequent_level
+        assert _most_frequent_level([3.0, 1.0, 1.0, 3.0]) == 3.0
+        assert _most_frequent_level([]) is None
+
+    def test_most_frequent_level_matches_counter(self):
+        from collections import Counter
+        from strategies.breakout_strategy import _most_frequent_level
+        rng = np.random.RandomState(4)
+        for _ in range(50):
+            pivots = (100 + rng.randint(0, 6, size=12) * 0.25).tolist()
+            expected = Counter(round(p, 2) for p in pivots).most_common(1)[0][0]
+            assert _most_frequent_level(pivots) == expected
+
+
+class TestDetectBreakout:
+    """detect_breakout on arrays keeps the original Series-based decisions."""
+
+    def _make_strategy(self):
+        from strategies.breakout_strategy import BreakoutStrategy
+        strategy = BreakoutStrategy.__new__(BreakoutStrategy)
+        strategy.breakout_confirmation_bars = 2
+        strategy.avg_volume_lookback = 20
+        strategy.volume_multiplier = 1.5
+        return strategy
+
+    @staticmethod
+    def _reference(strategy, df, levels):
+        """The original pandas implementation."""
+        recent_bars = df.iloc[-strategy.breakout_confirmation_bars:]
+        current_close = df['close'].iloc[-1]
+        avg_volume = df['volume'].iloc[-strategy.avg_volume_lookback:].mean()
+        if df['volume'].iloc[-1] < avg_volume * strategy.volume_multiplier:
+            return None
+        if levels['resistance'] and all(recent_bars['close'] > levels['resistance']):
+            if levels['strong_resistance'] and current_close > levels['strong_resistance']:
+                return 'strong_bullish'
+            return 'bullish'
+        if levels['support'] and all(recent_bars['close'] < levels['support']):
+            if levels['strong_support'] and current_close < levels['strong_support']:
+                return 'strong_bearish'
+            return 'bearish'
+        return None
+
+    def test_matches_reference(self):
+        strategy = self._make_strategy()
+        np.random.seed(5)
+        seen = set()
+        for _ in range(200):
+            closes = 100 + np.cumsum(np.random.randn(30))
+            volumes = np.random.rand(30) * 10
+            volumes[-1] *= np.random.choice([1, 3])
+            df = pd.DataFrame({'close': closes, 'volume': volumes})
+            levels = {
+                'resistance': closes[-5] + np.random.randn(), 'support': closes[-5] + np.random.randn(),
+                'strong_resistance': np.random.choice([None, closes[-3]]),
+                'strong_support': np.random.choice([None, closes[-3]]),
+            }
+            expected = self._reference(strategy, df, levels)
+            seen.add(expected)
+            assert strategy.detect_breakout(closes, volumes, levels) == expected
+        assert {'bullish', 'bearish', None} <= seen
+
+    def test_nan_close_in_window_is_not_a_breakout(self):
+        strategy = self._make_strategy()
+        closes = np.array([100.0] * 18 + [np.nan, 120.0])
+        volumes = np.array([1.0] * 19 + [10.0])
+        levels = {'resistance': 110.0, 'support': None, 'strong_resistance': None, 'strong_support': None}
+        assert strategy.detect_breakout(closes, volumes, levels) is None
+
+
+class TestGridPriceRange:
+    """calculate_price_range on arrays matches the pandas reductions."""
+
+    def _make_strategy(self):
+        from strategies.grid_trading_strategy import GridTradingStrategy
+        strategy = GridTradingStrategy.__new__(GridTradingStrategy)
+        strategy.range_pct_threshold = 5
+        strategy.volatility_threshold = 0.1
+        return strategy
+
+    def test_matches_pandas(self):
+        strategy = self._make_strategy()
+        np.random.seed(9)
+        closes = 100 + np.cumsum(np.random.randn(50))
+        df = pd.DataFrame({'close': closes, 'high': closes + 0.5, 'low': closes - 0.5})
+        result = strategy.calculate_price_range(df)
+        assert result['high'] == df['high'].max()
+        assert result['low'] == df['low'].min()
+        assert result['current'] == closes[-1]
+        expected_vol = df['close'].pct_change().std() * np.sqrt(len(df))
+        assert result['volatility'] == pytest.approx(expected_vol, rel=1e-12)
+
+    def test_single_bar_volatility_is_nan(self):
+        strategy = self._make_strategy()
+        df = pd.DataFrame({'close': [100.0], 'high': [101.0], 'low': [99.0]})
+        result = strategy.calculate_price_range(df)
+        assert np.isnan(result['volatility'])
+        assert not result['is_ranging']
+
+    def test_grid_levels_match_loop_reference(self):
+        strategy = self._make_strategy()
+        strategy.grid_spacing_pct = 0.7
+        strategy.grid_boundary_margin_low = 0.98
+        strategy.grid_boundary_margin_high = 1.02
+        price_range = {'current': 101.3, 'low': 97.0, 'high': 104.0}
+        for levels in (0, 1, 10, 40):
+            strategy.grid_levels = levels
+            interval = price_range['current'] * (strategy.grid_spacing_pct / 100)
+            expected = []
+            for i in range(levels // 2):
+                buy = price_range['current'] - interval * (i + 1)
+                sell = price_range['current'] + interval * (i + 1)
+                if buy > price_range['low'] * 0.98:
+                    expected.append(('buy', buy))
+                if sell < price_range['high'] * 1.02:
+                    expected.append(('sell', sell))
+            assert strategy.calculate_grid_levels(price_range) == sorted(expected, key=lambda x: x[1])
+
+
+def _ma_expected(strategy, closes):
+    df = strategy.calculate_moving_averages(pd.DataFrame({'close': closes}))
+    return (df['ma_fast'].iloc[-2], df['ma_slow'].iloc[-2],
+            df['ma_fast'].iloc[-1], df['ma_slow'].iloc[-1])
+
+
+def _rsi_expected(strategy, closes):
+    from strategies.indicators import rsi
+    return tuple(rsi(closes, strategy.rsi_period)[-2:])
+
+
+class _BatchCase(NamedTuple):
+    """One strategy whose prepare_signals builds a cross-coin snapshot."""
+    module: str
+    cls: str
+    config: Dict
+    snapshot_attr: str
+    min_bars: int               # shortest history the matrix path accepts
+    expected: Callable          # (strategy, closes) -> per-coin path values
+    rtol: float
+    buy_snapshot: Tuple         # snapshot entry that must produce a buy
+
+
+_BATCH_CASES = {
+    'simple_ma': _BatchCase(
+        'strategies.simple_ma_strategy', 'SimpleMAStrategy',
+        {'fast_ma_period': 3, 'slow_ma_period': 5}, '_ma_snapshot', 6,
+        _ma_expected, 1e-12, (99.0, 100.0, 101.0, 100.0),
+    ),
+    'rsi': _BatchCase(
+        'strategies.rsi_strategy', 'RSIStrategy',
+        {'rsi_period': 14}, '_rsi_snapshot', 16,
+        _rsi_expected, 0.0, (35.0, 25.0),
+    ),
+}
+
+
+def _batch_strategy(case, closes_by_coin, workers=1):
+    import importlib
+    from unittest.mock import MagicMock
+    from market_data import MarketDataManager
+
+    market_data = MarketDataManager(MagicMock())
+    market_data.get_candles = MagicMock(
+        side_effect=lambda coin, interval, lookback: pd.DataFrame({'close': closes_by_coin[coin]})
+    )
+    strategy_cls = getattr(importlib.import_module(case.module), case.cls)
+    strategy = strategy_cls(market_data, MagicMock(), {**case.config, 'signal_workers': workers})
+    strategy.positions = {}
+    return strategy
+
+
+@pytest.mark.parametrize('case', list(_BATCH_CASES.values()), ids=list(_BATCH_CASES))
+class TestSignalBatch:
+    """The cross-coin matrix path shared by the SMA and RSI strategies."""
+
+    def test_snapshot_matches_per_coin_path(self, case):
+        rng = np.random.RandomState(5)
+        data = {
+            'BTC': 100 + np.cumsum(rng.randn(34)),
+            'ETH': 50 + np.cumsum(rng.randn(25)),
+        }
+        strategy = _batch_strategy(case, data)
+        strategy.prepare_signals(['BTC', 'ETH'])
+
+        snapshot = getattr(strategy, case.snapshot_attr)
+        for coin, closes in data.items():
+            np.testing.assert_allclose(snapshot[coin], case.expected(strategy, closes), rtol=case.rtol, atol=0)
+
+    def test_short_history_falls_back(self, case):
+        rng = np.random.RandomState(7)
+        data = {
+            'BTC': 100 + np.cumsum(rng.randn(case.min_bars + 10)),
+            'ETH': 50 + np.cumsum(rng.randn(case.min_bars - 1)),
+        }
+        strategy = _batch_strategy(case, data)
+        strategy.prepare_signals(['BTC', 'ETH'])
+        assert set(getattr(strategy, case.snapshot_attr)) == {'BTC'}
+
+    def test_generate_signals_uses_snapshot(self, case):
+        strategy = _batch_strategy(case, {'BTC': np.zeros(1), 'ETH': np.zeros(1)})
+        setattr(strategy, case.snapshot_attr, {'BTC': case.buy_snapshot})
+        signal = strategy.generate_signals('BTC')
+        assert signal['side'] == 'buy'
+        strategy.market_data.get_candles.assert_not_called()
+
+    def test_parallel_workers_skip_batch(self, case):
+        data = {'BTC': np.zeros(case.min_bars + 4), 'ETH': np.zeros(case.min_bars + 4)}
+        strategy = _batch_strategy(case, data, workers=4)
+        strategy.prepare_signals(['BTC', 'ETH'])
+        assert getattr(strategy, case.snapshot_attr) == {}
+        strategy.market_data.get_candles.assert_not_called()
+
+
+class TestSignalBatchPerStrategy:
+    """Batch-path checks that only apply to one strategy."""
+
+    def test_ma_per_coin_path_matches_full_columns(self):
+        for k in range(1, 8):
+            closes = np.append(np.linspace(110, 100, 14), 100 + k)
+            strategy = _batch_strategy(_BATCH_CASES['simple_ma'], {'BTC': closes})
+            strategy.prepare_signals(['BTC'])
+            df = strategy.calculate_moving_averages(pd.DataFrame({'close': closes}))
+            crossed = (df['ma_fast'].iloc[-2] <= df['ma_slow'].iloc[-2]
+                       and df['ma_fast'].iloc[-1] > df['ma_slow'].iloc[-1])
+            signal = strategy.generate_signals('BTC')
+            assert (signal is not None and signal['side'] == 'buy') == crossed
+
+    def test_rsi_snapshot_records_last_rsi(self):
+        strategy = _batch_strategy(_BATCH_CASES['rsi'], {'BTC': np.zeros(1)})
+        strategy._rsi_snapshot = {'BTC': (35.0, 25.0)}
+        signal = strategy.generate_signals('BTC')
+        assert signal['rsi'] == 25.0
+        assert strategy._last_rsi['BTC'] == 25.0
+
+
+class TestLazyStrategyLoading:
+    """Strategy classes are imported on demand."""
+
+    def test_load_strategy_class_returns_class(self):
+        from strategies import load_strategy_class
+        from strategies.rsi_strategy import RSIStrategy
+        assert load_strategy_class('rsi') is RSIStrategy
+
+    def test_unknown_strategy_raises_key_error(self):
+        import pytest
+        from strategies import load_strategy_class
+        with pytest.raises(KeyError):
+            load_strategy_class('nope')
+
+    def test_package_import_does_not_load_strategies(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys, strategies; "
+            "assert 'strategies.market_making_strategy' not in sys.modules; "
+            "strategies.load_strategy_class('simple_ma'); "
+            "assert 'strategies.market_making_strategy' not in sys.modules"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
@@ -163,6 +163,13 @@ class TestGridTradingValidation:
         assert err is not None
         assert 'volatility_threshold' in err
 
+    def test_string_values_from_yaml_rejected(self):
+        err = validate_strategy_config('grid_trading', {
+            'grid_levels': '10', 'position_size_per_grid': '50',
+        })
+        assert 'grid_levels: expected int, got str' in err
+        assert 'position_size_per_grid: expected number, got str' in err
+
 
 class TestBreakoutValidation:
 
@@ -0,0 +1,206 @@
+"""Tests for start-up trading-configuration validation: price lookup, round-trips, report."""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def bot():
+    """Create a minimal HyperliquidBot with only validation state set."""
+    from bot import HyperliquidBot
+    b = HyperliquidBot.__new__(HyperliquidBot)
+    b.info = MagicMock()
+    b.account_address = "0xtest"
+    b.strategy_name = "simple_ma"
+    b.strategy_config = {}
+    b.market_data = MagicMock()
+    return b
+
+
+@pytest.fixture
+def validator():
+    with patch('bot.MarginValidator') as cls:
+        v = cls.return_value
+        v.validate_minimum_requirements.return_value = MagicMock(is_valid=True)
+        v.validate_strategy_config.return_value = MagicMock(is_valid=True)
+        yield v
+
+
+class TestValidationPrices:
+
+    def test_prices_from_one_all_mids_call(self, bot, validator):
+        bot.trading_coins = ["BTC", "ETH"]
+        bot.market_data.get_all_mids.return_value = {"BTC": "50000.5", "ETH": "3000", "SOL": "150"}
+
+        assert bot._validate_trading_configuration() is True
+
+        bot.market_data.get_all_mids.assert_called_once()
+        bot.market_data.get_market_data.assert_not_called()
+        prices = validator.validate_strategy_config.call_args.kwargs['current_prices']
+        assert prices == {"BTC": 50000.5, "ETH": 3000.0}
+
+    def test_unlisted_coin_falls_back_to_l2(self, bot, validator):
+        bot.trading_coins = ["BTC", "xyz:XYZ100"]
+        bot.market_data.get_all_mids.return_value = {"BTC": "50000"}
+        bot.market_data.get_market_data.return_value = MagicMock(mid_price=25.0)
+
+        assert bot._validate_trading_configuration() is True
+
+        bot.market_data.get_market_data.assert_called_once_with("xyz:XYZ100")
+        prices = validator.validate_strategy_config.call_args.kwargs['current_prices']
+        assert prices == {"BTC": 50000.0, "xyz:XYZ100": 25.0}
+
+    def test_missing_price_fails_validation(self, bot, validator):
+        bot.trading_coins = ["DOGE"]
+        bot.market_data.get_all_mids.return_value = {}
+        bot.market_data.get_market_data.return_value = None
+
+        assert bot._validate_trading_configuration() is False
+        validator.validate_strategy_config.assert_not_called()
+
+
+class TestValidationRoundTrips:
+
+    def test_one_user_state_and_one_all_mids(self, bot):
+        from account_utils import invalidate_snapshot_cache
+        bot.trading_coins = ["BTC", "ETH"]
+        bot.strategy_config = {'position_size_usd': 200, 'max_positions': 2}
+        bot.info.user_state.return_value = {
+            'marginSummary': {'accountValue': '10000', 'totalMarginUsed': '0'},
+        }
+        bot.info.spot_user_state.return_value = {'balances': []}
+        bot.market_data.get_all_mids.return_value = {"BTC": "50000", "ETH": "3000"}
+
+        invalidate_snapshot_cache()
+        try:
+            with patch('account_utils.api_wrapper') as wrapper:
+                wrapper.call.side_effect = lambda fn, *a, **kw: fn(*a, **kw)
+                assert bot._validate_trading_configuration() is True
+        finally:
+            invalidate_snapshot_cache()
+
+        bot.info.user_state.assert_called_once()
+        bot.market_data.get_all_mids.assert_called_once()
+        bot.market_data.get_market_data.assert_not_called()
+
+    def test_several_strategy_validations_share_one_fetch(self):
+        from account_utils import invalidate_snapshot_cache
+        from validation.margin_validator import MarginValidator
+        info = MagicMock()
+        info.user_state.return_value = {
+            'marginSummary': {'accountValue': '10000', 'totalMarginUsed': '0'},
+        }
+        info.spot_user_state.return_value = {'balances': []}
+        validator = MarginValidator(info, "0xtest")
+
+        invalidate_snapshot_cache()
+        try:
+            with patch('account_utils.api_wrapper') as wrapper:
+                wrapper.call.side_effect = lambda fn, *a, **kw: fn(*a, **kw)
+                results = [
+                    validator.validate_strategy_config(
+                        name, {'position_size_usd': 200}, ['BTC'], {'BTC': 50000.0}, log_report=False)
+                    for name in ('simple_ma', 'rsi', 'macd', 'bollinger_bands', 'breakout')
+                ]
+        finally:
+            invalidate_snapshot_cache()
+
+        assert all(r.is_valid for r in results)
+        info.user_state.assert_called_once()
+
+
+class TestValidationReport:
+
+    def _validator(self):
+        from validation.margin_validator import MarginValidator
+        v = MarginValidator(MagicMock(), "0xtest")
+        v.get_account_info = MagicMock(return_value=(10000.0, 10000.0))
+        return v
+
+    def _validate(self, v):
+        return v.validate_strategy_config(
+            'simple_ma', {'position_size_usd': 200, 'max_positions': 2},
+            ['BTC'], {'BTC': 50000.0},
+        )
+
+    def test_report_logged_at_info(self, caplog):
+        with caplog.at_level(logging.INFO, logger='validation.margin_validator'):
+            assert self._validate(self._validator()).is_valid
+        assert "POSITION SIZES:" in caplog.text
+
+    def test_report_skipped_when_info_disabled(self, caplog):
+        with caplog.at_level(logging.WARNING, logger='validation.margin_validator'):
+            assert self._validate(self._validator()).is_valid
+        assert caplog.records == []
+
+    def test_log_report_false_skips_report(self, caplog):
+        v = self._validator()
+        with caplog.at_level(logging.INFO, logger='validation.margin_validator'):
+            result = v.validate_strategy_config(
+                'simple_ma', {'position_size_usd': 200, 'max_positions': 2},
+                ['BTC'], {'BTC': 50000.0}, log_report=False,
+            )
+        assert result.is_valid
+        assert caplog.records == []
+
+    def test_non_positive_sizing_fails_before_account_fetch(self):
+        v = self._validator()
+        for config in ({'position_size_usd': 0}, {'max_positions': 0}):
+            result = v.validate_strategy_config('simple_ma', config, ['BTC'], {'BTC': 50000.0})
+            assert not result.is_valid
+        v.get_account_info.assert_not_called()
+
+    def test_insufficient_margin_recommendations(self):
+        v = self._validator()
+        v.get_account_info.return_value = (50.0, 50.0)
+        v.MIN_ORDER_VALUES = {'default': 10.0}
+        v.INITIAL_MARGIN_MULTIPLIER = 3.0
+        v.SAFETY_BUFFER = 1.5
+        result = v.validate_strategy_config(
+            'simple_ma', {'position_size_usd': 100, 'max_positions': 3},
+            ['BTC'], {'BTC': 50000.0}, log_report=False,
+        )
+        assert not result.is_valid
+        assert result.recommendations == [
+            "Reduce position_size_usd to $111.11 or less",
+            "Or reduce max_positions to 3 or less",
+            "Or add at least $85.00 to your account",
+        ]
+
+
+class TestMinimumOrderValues:
+
+    def _validator(self, min_values):
+        from validation.margin_validator import MarginValidator
+        v = MarginValidator(MagicMock(), "0xtest")
+        v.MIN_ORDER_VALUES = min_values
+        v.get_account_info = MagicMock(return_value=(10000.0, 10000.0))
+        return v
+
+    def test_per_coin_minimum_overrides_default(self):
+        v = self._validator({'default': 10.0, 'BTC': 500.0})
+        result = v.validate_strategy_config(
+            'simple_ma', {'position_size_usd': 200, 'max_positions': 2},
+            ['BTC', 'ETH'], {'BTC': 50000.0, 'ETH': 3000.0},
+        )
+        assert not result.is_valid
+        assert result.recommendations == ["Increase position_size_usd to at least $500.00"]
+
+    def test_unlisted_coins_use_default(self):
+        v = self._validator({'default': 10.0, 'BTC': 500.0})
+        result = v.validate_strategy_config(
+            'simple_ma', {'position_size_usd': 200, 'max_positions': 2},
+            ['ETH', 'SOL'], {'ETH': 3000.0, 'SOL': 150.0},
+        )
+        assert result.is_valid
+
+
+class TestValidationResult:
+
+    def test_slotted_record(self):
+        from validation import ValidationResult
+        result = ValidationResult(is_valid=True, message="ok")
+        assert not hasattr(result, '__dict__')
+        assert result.recommendations is None
@@ -1,6 +1,11 @@
-"""Tests for TTLCacheEntry and TTLCacheMap."""
+"""Tests for TTLCacheEntry, TTLCacheMap and SingleFlight."""
 
-from ttl_cache import TTLCacheEntry, TTLCacheMap
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ttl_cache import SingleFlight, TTLCacheEntry, TTLCacheMap
 
 
 class TestTTLCacheEntry:
@@ -77,3 +82,71 @@ class TestTTLCacheMap:
         cache.set(("0xabc", "dex1"), {"balance": 100})
         assert cache.get(("0xabc", "dex1")) == {"balance": 100}
         assert cache.get(("0xabc", "dex2")) is None
+
+
+class TestSingleFlight:
+
+    def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"mids": 1}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flights.do("mids", fetch)))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        while not flights._calls:
+            pass
+        # Let the followers reach the in-flight future before releasing.
+        threading.Event().wait(0.05)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 4
+        assert all(r is results[0] for r in results)
+        assert flights._calls == {}
+
+    def test_sequential_calls_run_again(self):
+        flights = SingleFlight()
+        fetch = MagicMock(side_effect=[1, 2])
+        assert flights.do("k", fetch) == 1
+        assert flights.do("k", fetch) == 2
+
+    def test_exception_propagates_and_clears_key(self):
+        flights = SingleFlight()
+        with pytest.raises(ConnectionError):
+            flights.do("k", MagicMock(side_effect=ConnectionError("down")))
+        assert flights._calls == {}
+        assert flights.do("k", lambda: 3) == 3
+
+    def test_order_manager_user_state_miss_coalesced(self):
+        from order_manager import OrderManager
+
+        release = threading.Event()
+        info = MagicMock()
+
+        def user_state(address):
+            release.wait(5)
+            return {"assetPositions": []}
+
+        info.user_state.side_effect = user_state
+        om = OrderManager(MagicMock(), info, "0xabc")
+        with patch("order_manager.api_wrapper") as wrapper:
+            wrapper.call.side_effect = lambda fn, *a, **kw: fn(*a, **kw)
+            threads = [threading.Thread(target=om.get_all_positions) for _ in range(3)]
+            for t in threads:
+                t.start()
+            threading.Event().wait(0.05)
+            release.set()
+            for t in threads:
+                t.join(5)
+
+        assert info.user_state.call_count == 1
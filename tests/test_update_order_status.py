@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch, call
 import pytest
 
 from order_manager import OrderManager, OrderStatus, Order, OrderSide
-from ttl_cache import TTLCacheEntry
+from ttl_cache import SingleFlight, TTLCacheEntry
 
 
 # ---------------------------------------------------------------------------
@@ -24,6 +24,7 @@ def _make_order_manager(active_orders=None):
     om.default_slippage = 0.01
     om.active_orders = dict(active_orders) if active_orders else {}
     om._open_orders_cache = TTLCacheEntry(ttl=5.0)
+    om._flights = SingleFlight()
     return om
 
 
@@ -207,6 +208,8 @@ class TestMultiDexUpdateOrderStatus:
         om.hip3_dexes = ["xyz"]
         om.registry = MagicMock()
         om.market_data_ext = MagicMock()
+        om._fetch_workers = 1
+        om._fetch_pool = None
         return om
 
     @patch("hip3.multi_dex_order_manager.api_wrapper")
@@ -272,3 +275,31 @@ class TestMultiDexUpdateOrderStatus:
 
         om.market_data_ext.get_user_fills_dex.assert_not_called()
         assert 101 in om.active_orders
+
+    @patch("hip3.multi_dex_order_manager.api_wrapper")
+    def test_tolerates_feed_removing_orders_mid_scan(self, mock_wrapper):
+        """The WS order feed may prune active_orders while the scan runs."""
+
+        class _FeedPopsOnLookup(int):
+            # Hashed when checked against the open-order set, i.e. mid-scan.
+            armed = False
+
+            def __hash__(self):
+                if _FeedPopsOnLookup.armed:
+                    _FeedPopsOnLookup.armed = False
+                    om.active_orders.pop(202, None)
+                return int.__hash__(self)
+
+        first = _make_order(201, coin="xyz:GOLD")
+        second = _make_order(202, coin="xyz:SILVER")
+        om = self._make_multi_dex_om({_FeedPopsOnLookup(201): first, 202: second})
+
+        mock_wrapper.call.return_value = []
+        om.market_data_ext.get_open_orders_dex.return_value = []
+        om.market_data_ext.get_user_fills_dex.return_value = [{"oid": 201, "sz": "1.0"}]
+
+        _FeedPopsOnLookup.armed = True
+        om.update_order_status()
+
+        assert first.status == OrderStatus.FILLED
+        assert om.active_orders == {}
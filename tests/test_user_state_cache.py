@@ -88,3 +88,26 @@ class TestUserStateCache:
         info = MagicMock()
         mgr = OrderManager(exchange, info, '0xabc')
         assert mgr._user_state_cache_ttl == 2.0
+
+
+class TestPositionIndex:
+
+    def test_index_built_once_per_snapshot(self):
+        mgr = _make_order_manager()
+        mgr.info.user_state.return_value = _make_user_state([
+            {'coin': 'BTC', 'szi': '0.1'},
+            {'coin': 'ETH', 'szi': '-1.0'},
+        ])
+
+        assert mgr.get_position('BTC')['szi'] == '0.1'
+        index = mgr._position_index
+        assert mgr.get_position('ETH')['szi'] == '-1.0'
+        assert mgr._position_index is index
+
+    def test_refetched_snapshot_rebuilds_index(self):
+        mgr = _make_order_manager(user_state_cache_ttl=0.0)
+        mgr.info.user_state.return_value = _make_user_state([{'coin': 'BTC', 'szi': '0.1'}])
+        assert mgr.get_position('BTC')['szi'] == '0.1'
+
+        mgr.info.user_state.return_value = _make_user_state([])
+        assert mgr.get_position('BTC') is None
@@ -0,0 +1,115 @@
+"""Tests for the event-driven main loop wake-up (WS_MIN_CYCLE_INTERVAL)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def bot():
+    """Create a minimal HyperliquidBot with only the wait-loop state set."""
+    from bot import HyperliquidBot
+    b = HyperliquidBot.__new__(HyperliquidBot)
+    b.main_loop_interval = 10.0
+    b._ws_min_cycle_interval = 0.0
+    b._cycle_wakeup = threading.Event()
+    b._shutdown_event = threading.Event()
+    b.ws_feed = None
+    return b
+
+
+class TestWaitForNextCycle:
+
+    @patch('bot.HyperliquidBot._sleep')
+    def test_disabled_sleeps_full_interval(self, mock_sleep, bot):
+        """WS_MIN_CYCLE_INTERVAL=0 keeps the legacy fixed sleep."""
+        bot.ws_feed = MagicMock()
+        bot._wait_for_next_cycle(cycle_start=0.0)
+        mock_sleep.assert_called_once_with(10.0)
+
+    @patch('bot.HyperliquidBot._sleep')
+    def test_no_feed_sleeps_full_interval(self, mock_sleep, bot):
+        """Without a live WS feed there is nothing to wake us — plain sleep."""
+        bot._ws_min_cycle_interval = 1.0
+        bot._wait_for_next_cycle(cycle_start=0.0)
+        mock_sleep.assert_called_once_with(10.0)
+
+    @patch('bot.HyperliquidBot._sleep')
+    @patch('bot.time.monotonic', return_value=100.2)
+    def test_wakeup_respects_floor(self, mock_mono, mock_sleep, bot):
+        """A pending wake-up still waits out the minimum cycle interval."""
+        bot._ws_min_cycle_interval = 1.0
+        bot.ws_feed = MagicMock()
+        bot._on_ws_book_update('BTC', [])
+        bot._wait_for_next_cycle(cycle_start=100.0)
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.8)
+        assert not bot._cycle_wakeup.is_set()
+
+    @patch('bot.HyperliquidBot._sleep')
+    @patch('bot.time.monotonic', return_value=102.0)
+    def test_wakeup_returns_without_full_interval(self, mock_mono, mock_sleep, bot):
+        """Past the floor, a pushed update ends the wait immediately."""
+        bot._ws_min_cycle_interval = 1.0
+        bot.ws_feed = MagicMock()
+        bot._cycle_wakeup = MagicMock()
+        bot._wait_for_next_cycle(cycle_start=100.0)
+        mock_sleep.assert_not_called()
+        bot._cycle_wakeup.wait.assert_called_once_with(timeout=pytest.approx(8.0))
+        bot._cycle_wakeup.clear.assert_called_once()
+
+    @patch('bot.HyperliquidBot._sleep')
+    @patch('bot.time.monotonic', return_value=111.0)
+    def test_overrun_cycle_does_not_wait(self, mock_mono, mock_sleep, bot):
+        """A cycle that already exceeded main_loop_interval starts the next at once."""
+        bot._ws_min_cycle_interval = 1.0
+        bot.ws_feed = MagicMock()
+        bot._cycle_wakeup = MagicMock()
+        bot._wait_for_next_cycle(cycle_start=100.0)
+        mock_sleep.assert_not_called()
+        bot._cycle_wakeup.wait.assert_not_called()
+
+
+class TestShutdownWakeup:
+
+    def test_sleep_returns_early_on_shutdown(self, bot):
+        bot._shutdown_event.set()
+        start = time.monotonic()
+        bot._sleep(10.0)
+        assert time.monotonic() - start < 1.0
+
+    @patch('bot.time.sleep')
+    def test_signal_handler_wakes_loop_and_cancels(self, mock_sleep, bot):
+        bot.running = True
+        bot.strategy = MagicMock()
+        bot.order_manager = MagicMock()
+        for attr in ('imbalance_guard', 'adverse_tracker', 'close_refresh_guard',
+                     'velocity_guard', 'bbo_guard', 'fill_feed', 'order_update_feed'):
+            setattr(bot, attr, None)
+        bot._signal_handler(2, None)
+        assert bot.running is False
+        assert bot._shutdown_event.is_set()
+        assert bot._cycle_wakeup.is_set()
+        bot.order_manager.cancel_all_orders.assert_called_once()
+        mock_sleep.assert_not_called()
+        # Pools are released after the loop exits, not mid-cycle.
+        bot.strategy.shutdown.assert_not_called()
+
+    def test_worker_pools_released_after_loop(self, bot):
+        bot.strategy = MagicMock()
+        bot.order_manager = MagicMock()
+        bot._release_worker_pools()
+        bot.strategy.shutdown.assert_called_once()
+        bot.order_manager.shutdown.assert_called_once()
+
+
+class TestWsSocketOptions:
+
+    def test_websocket_client_sets_tcp_nodelay(self):
+        """The SDK's WebSocketApp connects with websocket-client's default
+        socket options; pushed book updates rely on Nagle being disabled."""
+        import socket
+        from websocket._socket import DEFAULT_SOCKET_OPTION
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in DEFAULT_SOCKET_OPTION
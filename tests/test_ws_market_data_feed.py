@@ -202,3 +202,64 @@ class TestMarketDataFeed:
         stale = feed.stale_coins(max_age=1.0)
         assert "ETH" in stale
         assert "BTC" not in stale
+
+
+class TestAllMidsSubscription:
+    """Optional allMids subscription forwarding snapshots to a mids sink."""
+
+    def _make_feed(self, sink):
+        info = MagicMock()
+        info.ws_manager = MagicMock()
+        info.subscribe.side_effect = lambda sub, cb: 7 if sub["type"] == "allMids" else 1
+        return MarketDataFeed(info, MagicMock(), ["BTC"], mids_sink=sink), info
+
+    def _mids_callback(self, info):
+        for call in info.subscribe.call_args_list:
+            if call.args[0] == {"type": "allMids"}:
+                return call.args[1]
+        raise AssertionError("allMids not subscribed")
+
+    def test_not_subscribed_without_sink(self):
+        info = MagicMock()
+        info.ws_manager = MagicMock()
+        info.subscribe.return_value = 1
+        MarketDataFeed(info, MagicMock(), ["BTC"]).start()
+        assert all(c.args[0]["type"] == "l2Book" for c in info.subscribe.call_args_list)
+
+    def test_snapshot_forwarded_to_sink(self):
+        sink = MagicMock()
+        feed, info = self._make_feed(sink)
+        feed.start()
+        self._mids_callback(info)({"channel": "allMids", "data": {"mids": {"BTC": "50000.5"}}})
+        sink.assert_called_once_with({"BTC": "50000.5"})
+
+    def test_stop_unsubscribes_mids(self):
+        feed, info = self._make_feed(MagicMock())
+        feed.start()
+        feed.stop()
+        info.unsubscribe.assert_any_call({"type": "allMids"}, 7)
+
+    def test_sink_error_counted_not_raised(self):
+        sink = MagicMock(side_effect=ValueError("boom"))
+        feed, info = self._make_feed(sink)
+        feed.start()
+        self._mids_callback(info)({"data": {"mids": {"BTC": "1"}}})
+        assert feed.stats["errors"] == 1
+
+    def test_order_manager_cache_serves_ws_mids(self):
+        from order_manager import OrderManager
+        om = OrderManager(MagicMock(), MagicMock(), "0xaaa")
+        om.update_mids_from_ws({"BTC": "50000"})
+        assert om._get_mid_price("BTC") == 50000.0
+        om.info.all_mids.assert_not_called()
+
+    def test_ws_snapshot_installed_without_copy(self):
+        """The decoded allMids dict is cached as-is; only the coins that are
+        actually priced get parsed to float, on read."""
+        from order_manager import OrderManager
+        om = OrderManager(MagicMock(), MagicMock(), "0xaaa")
+        mids = {"BTC": "50000", "ETH": "3000"}
+        om.update_mids_from_ws(mids)
+        assert om._get_cached_mids() is mids
+        assert om._get_mid_price("ETH") == 3000.0
+        assert mids["BTC"] == "50000"
@@ -0,0 +1,152 @@
+"""Tests for the WS orderUpdates feed and push-based active_orders updates."""
+
+from unittest.mock import MagicMock, patch
+
+from order_manager import Order, OrderManager, OrderSide, OrderStatus
+from ttl_cache import TTLCacheEntry
+from ws.order_update_feed import OrderUpdateFeed
+
+
+def _make_feed():
+    info = MagicMock()
+    info.ws_manager = MagicMock()
+    info.subscribe.return_value = 7
+    sink = MagicMock()
+    feed = OrderUpdateFeed(info, "0xabc", sink)
+    return feed, info, sink
+
+
+def _make_order(oid, size=1.0):
+    return Order(
+        id=oid, coin="BTC", side=OrderSide.BUY, size=size, price=100.0,
+        order_type={"limit": {"tif": "Gtc"}},
+    )
+
+
+def _make_order_manager(orders):
+    om = OrderManager.__new__(OrderManager)
+    om.active_orders = {o.id: o for o in orders}
+    om._open_orders_cache = TTLCacheEntry(ttl=5.0)
+    return om
+
+
+def _update(oid, status, sz="0.0", orig_sz="1.0"):
+    return {"order": {"coin": "BTC", "oid": oid, "sz": sz, "origSz": orig_sz}, "status": status}
+
+
+class TestOrderUpdateFeedLifecycle:
+
+    def test_start_subscribes(self):
+        feed, info, _ = _make_feed()
+        feed.start()
+        sub_arg = info.subscribe.call_args[0][0]
+        assert sub_arg == {"type": "orderUpdates", "user": "0xabc"}
+        assert feed.is_running
+
+    def test_stop_unsubscribes(self):
+        feed, info, _ = _make_feed()
+        feed.start()
+        feed.stop()
+        info.unsubscribe.assert_called_once()
+        assert not feed.is_running
+
+    def test_no_ws_manager_disables(self):
+        info = MagicMock()
+        info.ws_manager = None
+        feed = OrderUpdateFeed(info, "0xabc", MagicMock())
+        feed.start()
+        assert not feed.is_running
+        info.subscribe.assert_not_called()
+
+    def test_callback_forwards_updates(self):
+        feed, info, sink = _make_feed()
+        feed.start()
+        callback = info.subscribe.call_args[0][1]
+        updates = [_update(1, "filled")]
+        callback({"channel": "orderUpdates", "data": updates})
+        sink.assert_called_once_with(updates)
+        assert feed.stats["updates"] == 1
+
+    def test_sink_error_is_counted(self):
+        feed, info, sink = _make_feed()
+        sink.side_effect = RuntimeError("boom")
+        feed.start()
+        info.subscribe.call_args[0][1]({"data": [_update(1, "filled")]})
+        assert feed.stats["errors"] == 1
+
+
+class TestApplyOrderUpdates:
+
+    def test_filled_order_removed_with_filled_size(self):
+        order = _make_order(1)
+        om = _make_order_manager([order])
+        assert om.apply_order_updates([_update(1, "filled", sz="0.0", orig_sz="1.0")]) == 1
+        assert om.active_orders == {}
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_size == 1.0
+
+    def test_cancel_and_reject_statuses(self):
+        a, b, c = _make_order(1), _make_order(2), _make_order(3)
+        om = _make_order_manager([a, b, c])
+        om.apply_order_updates([
+            _update(1, "canceled"), _update(2, "marginCanceled"), _update(3, "perpMarginRejected"),
+        ])
+        assert om.active_orders == {}
+        assert a.status == OrderStatus.CANCELLED
+        assert b.status == OrderStatus.CANCELLED
+        assert c.status == OrderStatus.REJECTED
+
+    def test_open_and_unknown_orders_ignored(self):
+        order = _make_order(1)
+        om = _make_order_manager([order])
+        om._open_orders_cache.set([{"oid": 1}])
+        assert om.apply_order_updates([_update(1, "open"), _update(99, "filled")]) == 0
+        assert 1 in om.active_orders
+        assert om._open_orders_cache.get() == [{"oid": 1}]
+
+    def test_removal_invalidates_open_orders_cache(self):
+        om = _make_order_manager([_make_order(1)])
+        om._open_orders_cache.set([{"oid": 1}])
+        om.apply_order_updates([_update(1, "canceled")])
+        assert om._open_orders_cache.get() is None
+
+
+class TestOrderReconcileThrottle:
+
+    def _bot(self, feed_running):
+        from bot import HyperliquidBot
+        b = HyperliquidBot.__new__(HyperliquidBot)
+        b.order_manager = MagicMock()
+        b.order_update_feed = MagicMock(is_running=feed_running) if feed_running is not None else None
+        b._order_reconcile_interval = 30.0
+        b._next_order_reconcile = 0.0
+        return b
+
+    def test_polls_every_cycle_without_feed(self):
+        b = self._bot(None)
+        b._update_order_status()
+        b._update_order_status()
+        assert b.order_manager.update_order_status.call_count == 2
+
+    @patch('bot.time.monotonic')
+    def test_feed_running_reconciles_on_interval(self, mock_time):
+        b = self._bot(True)
+        mock_time.return_value = 100.0
+        b._update_order_status()
+        mock_time.return_value = 110.0
+        b._update_order_status()
+        assert b.order_manager.update_order_status.call_count == 1
+        mock_time.return_value = 130.0
+        b._update_order_status()
+        assert b.order_manager.update_order_status.call_count == 2
+
+    def test_stopped_feed_falls_back_to_polling(self):
+        b = self._bot(False)
+        b._next_order_reconcile = float('inf')
+        b._update_order_status()
+        b.order_manager.update_order_status.assert_called_once()
+
+    def test_sink_routes_to_current_order_manager(self):
+        b = self._bot(True)
+        b._on_ws_order_updates([_update(1, "filled")])
+        b.order_manager.apply_order_updates.assert_called_once()
@@ -1,14 +1,19 @@
 """Lightweight TTL cache for reducing redundant API calls within a bot cycle.
 
-Provides two classes:
+Provides three classes:
 - TTLCacheEntry: single-value cache with TTL (e.g. meta, user_state)
 - TTLCacheMap: keyed cache with TTL (e.g. per-coin market data, per-DEX mids)
+- SingleFlight: coalesces concurrent cache misses for the same key into
+  one fetch (signal workers, HIP-3 fetch pool and WS threads can all miss
+  at once)
 
-Both use time.monotonic() for timing.
+The caches use time.monotonic() for timing.
 """
 
+import threading
 import time
-from typing import Generic, Hashable, Optional, TypeVar
+from concurrent.futures import Future
+from typing import Callable, Generic, Hashable, Optional, TypeVar
 
 T = TypeVar('T')
 K = TypeVar('K', bound=Hashable)
@@ -63,3 +68,37 @@ class TTLCacheMap(Generic[K, T]):
     def invalidate_all(self) -> None:
         """Clear all cached entries."""
         self._data.clear()
+
+
+class SingleFlight(Generic[K, T]):
+    """Run at most one call per key at a time; concurrent callers share its outcome.
+
+    The first caller for *key* runs *fn*; callers arriving while it is in
+    flight block and receive the same result (or exception).  Nothing is
+    retained once the call finishes -- pair it with a TTL cache that *fn*
+    fills, and check that cache before calling :meth:`do`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[K, Future] = {}
+
+    def do(self, key: K, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -13,7 +13,7 @@ from rate_limiter import API_ERRORS
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation check"""
     is_valid: bool
@@ -22,7 +22,11 @@ class ValidationResult:
 
 
 class MarginValidator:
-    """Validates margin requirements and trading configuration"""
+    """Validates margin requirements and trading configuration.
+
+    Used once, at start-up, by ``HyperliquidBot._validate_trading_configuration``;
+    none of its report formatting runs on the trading loop.
+    """
 
     # Leverage and margin requirements (derived from default leverage)
     DEFAULT_LEVERAGE = 10.0
@@ -52,6 +56,10 @@ class MarginValidator:
         With Portfolio Margin, spot balances (USDC, USDH, etc.) count as
         collateral for perp trading.  If the perp ``accountValue`` is zero
         we fall back to the spot clearinghouse to capture available capital.
+
+        The snapshot comes from the shared ``account_utils`` TTL cache, so
+        back-to-back validations reuse one ``user_state`` fetch; call
+        ``invalidate_snapshot_cache`` to force a fresh read.
         """
         try:
             snapshot = get_account_snapshot(self.info, self.account_address)
@@ -65,18 +73,17 @@ class MarginValidator:
         strategy_name: str,
         strategy_config: Dict,
         coins: List[str],
-        current_prices: Dict[str, float]
+        current_prices: Dict[str, float],
+        log_report: bool = True,
     ) -> ValidationResult:
-        """Validate if strategy configuration is viable with current account"""
+        """Validate if strategy configuration is viable with current account.
 
-        account_value, available_balance = self.get_account_info()
+        ``log_report=False`` skips the INFO report for programmatic checks
+        that only need the result; warnings and failure recommendations
+        are still logged.
+        """
 
-        if account_value <= 0:
-            return ValidationResult(
-                is_valid=False,
-                message="Could not retrieve account information",
-                recommendations=["Check API connection and credentials"]
-            )
+        report = log_report and logger.isEnabledFor(logging.INFO)
 
         # Extract strategy parameters
         if strategy_name == 'grid_trading':
@@ -88,6 +95,23 @@ class MarginValidator:
             position_size = strategy_config.get('position_size_usd', 100)
             max_positions = strategy_config.get('max_positions', 3)
 
+        # Reject non-positive sizing before spending a round-trip on the account
+        if position_size <= 0 or max_positions <= 0:
+            return ValidationResult(
+                is_valid=False,
+                message="Position size and max positions must be positive",
+                recommendations=["Set the position size and max_positions above 0"]
+            )
+
+        account_value, available_balance = self.get_account_info()
+
+        if account_value <= 0:
+            return ValidationResult(
+                is_valid=False,
+                message="Could not retrieve account information",
+                recommendations=["Check API connection and credentials"]
+            )
+
         # Get strategy risk multiplier
         risk_multiplier = self.STRATEGY_RISK_MULTIPLIERS.get(strategy_name, 1.0)
 
@@ -99,48 +123,51 @@ class MarginValidator:
         base_margin_required = total_exposure * self.MARGIN_REQUIREMENT * self.INITIAL_MARGIN_MULTIPLIER
         margin_required_with_buffer = base_margin_required * self.SAFETY_BUFFER * risk_multiplier
 
-        # Check minimum order values for each coin
+        # Check minimum order values for each coin.  This and the report's
+        # size loop run once at start-up over the configured coins, where
+        # plain loops are cheaper than building NumPy arrays for them.
         min_order_issues = []
+        min_order_values = self.MIN_ORDER_VALUES
+        default_min = min_order_values['default']
         for coin in coins:
-            min_value = self.MIN_ORDER_VALUES.get(coin, self.MIN_ORDER_VALUES['default'])
+            min_value = min_order_values.get(coin, default_min)
             if position_size < min_value:
                 min_order_issues.append(f"{coin}: ${position_size:.2f} < ${min_value:.2f} minimum")
 
-        # Calculate position sizes in coin units
-        position_sizes_in_units = {}
-        for coin in coins:
-            if coin in current_prices and current_prices[coin] > 0:
-                size_in_units = position_size / current_prices[coin]
-                position_sizes_in_units[coin] = size_in_units
-
-        # Generate validation report
-        logger.info("=" * 60)
-        logger.info("MARGIN VALIDATION REPORT")
-        logger.info("=" * 60)
-        logger.info(f"Strategy: {strategy_name}")
-        logger.info(f"Coins: {', '.join(coins)}")
-        logger.info("-" * 60)
-        logger.info("ACCOUNT STATUS:")
-        logger.info(f"  Account Value: ${account_value:.2f}")
-        logger.info(f"  Available Balance: ${available_balance:.2f}")
-        logger.info("-" * 60)
-        logger.info("STRATEGY CONFIGURATION:")
-        logger.info(f"  Position Size: ${position_size:.2f}")
-        logger.info(f"  Max Positions: {max_positions}")
-        logger.info(f"  Total Exposure: ${total_exposure:.2f}")
-        logger.info(f"  Risk Multiplier: {risk_multiplier}x ({strategy_name})")
-        logger.info("-" * 60)
-        logger.info("MARGIN REQUIREMENTS:")
-        logger.info(f"  Base Margin (10%): ${base_margin_required:.2f}")
-        logger.info(f"  With Safety Buffer: ${margin_required_with_buffer:.2f}")
-        logger.info(f"  Account Coverage: {(account_value/margin_required_with_buffer)*100:.1f}%")
-
-        # Position sizes for each coin
-        if position_sizes_in_units:
+        # Generate validation report (only formatted when INFO is enabled)
+        if report:
+            logger.info("=" * 60)
+            logger.info("MARGIN VALIDATION REPORT")
+            logger.info("=" * 60)
+            logger.info(f"Strategy: {strategy_name}")
+            logger.info(f"Coins: {', '.join(coins)}")
             logger.info("-" * 60)
-            logger.info("POSITION SIZES:")
-            for coin, size in position_sizes_in_units.items():
-                logger.info(f"  {coin}: {size:.6f} units (${position_size:.2f})")
+            logger.info("ACCOUNT STATUS:")
+            logger.info(f"  Account Value: ${account_value:.2f}")
+            logger.info(f"  Available Balance: ${available_balance:.2f}")
+            logger.info("-" * 60)
+            logger.info("STRATEGY CONFIGURATION:")
+            logger.info(f"  Position Size: ${position_size:.2f}")
+            logger.info(f"  Max Positions: {max_positions}")
+            logger.info(f"  Total Exposure: ${total_exposure:.2f}")
+            logger.info(f"  Risk Multiplier: {risk_multiplier}x ({strategy_name})")
+            logger.info("-" * 60)
+            logger.info("MARGIN REQUIREMENTS:")
+            logger.info(f"  Base Margin (10%): ${base_margin_required:.2f}")
+            logger.info(f"  With Safety Buffer: ${margin_required_with_buffer:.2f}")
+            logger.info(f"  Account Coverage: {(account_value/margin_required_with_buffer)*100:.1f}%")
+
+            # Position sizes for each coin, in coin units (report only)
+            position_sizes_in_units = {}
+            for coin in coins:
+                if coin in current_prices and current_prices[coin] > 0:
+                    size_in_units = position_size / current_prices[coin]
+                    position_sizes_in_units[coin] = size_in_units
+            if position_sizes_in_units:
+                logger.info("-" * 60)
+                logger.info("POSITION SIZES:")
+                for coin, size in position_sizes_in_units.items():
+                    logger.info(f"  {coin}: {size:.6f} units (${position_size:.2f})")
 
         # Validation results
         validation_passed = True
@@ -161,7 +188,7 @@ class MarginValidator:
         # Check minimum order values
         if min_order_issues:
             validation_passed = False
-            recommendations.append(f"Increase position_size_usd to at least ${max(self.MIN_ORDER_VALUES.values()):.2f}")
+            recommendations.append(f"Increase position_size_usd to at least ${max(min_order_values.values()):.2f}")
             for issue in min_order_issues:
                 logger.warning(f"  Minimum order value issue: {issue}")
 
@@ -176,11 +203,13 @@ class MarginValidator:
                 recommendations.append(
                     f"Or reduce position_size_per_grid to ${max_grid_size:.2f}")
 
-        logger.info("-" * 60)
+        if report:
+            logger.info("-" * 60)
         if validation_passed:
-            logger.info("✅ VALIDATION PASSED")
-            logger.info(f"Margin utilization: {(margin_required_with_buffer/account_value)*100:.1f}%")
-            logger.info(f"Free margin after max positions: ${account_value - margin_required_with_buffer:.2f}")
+            if report:
+                logger.info("✅ VALIDATION PASSED")
+                logger.info(f"Margin utilization: {(margin_required_with_buffer/account_value)*100:.1f}%")
+                logger.info(f"Free margin after max positions: ${account_value - margin_required_with_buffer:.2f}")
             message = "Configuration is valid for trading"
         else:
             logger.error("❌ VALIDATION FAILED")
@@ -189,7 +218,8 @@ class MarginValidator:
             for i, rec in enumerate(recommendations, 1):
                 logger.error(f"  {i}. {rec}")
 
-        logger.info("=" * 60)
+        if report:
+            logger.info("=" * 60)
 
         return ValidationResult(
             is_valid=validation_passed,
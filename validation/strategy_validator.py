@@ -64,6 +64,8 @@ def _validate_common(config: Dict) -> List[str]:
             )
     if 'account_cap_pct' in config:
         errors += _range('account_cap_pct', config['account_cap_pct'], 0.0, 1.0)
+    if 'signal_workers' in config:
+        errors += _positive_int('signal_workers', config['signal_workers'])
 
     return errors
 
@@ -1,5 +1,6 @@
 from ws.market_data_feed import MarketDataFeed
 from ws.fill_feed import FillFeed
+from ws.order_update_feed import OrderUpdateFeed
 from ws.bbo_guard import BboGuard
 from ws.imbalance_guard import ImbalanceGuard
 from ws.close_refresh_guard import CloseRefreshGuard
@@ -8,7 +9,7 @@ from ws.adverse_selection_tracker import AdverseSelectionTracker
 from ws.ws_reconnector import WsReconnector
 
 __all__ = [
-    "MarketDataFeed", "FillFeed", "BboGuard", "ImbalanceGuard",
+    "MarketDataFeed", "FillFeed", "OrderUpdateFeed", "BboGuard", "ImbalanceGuard",
     "CloseRefreshGuard", "BboVelocityGuard", "AdverseSelectionTracker",
     "WsReconnector",
 ]
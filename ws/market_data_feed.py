@@ -5,6 +5,18 @@ Subscribes to ``l2Book`` for each trading coin and pushes updates into
 continues to run at its normal interval but almost always hits the
 warm cache, eliminating REST L2 calls during normal operation.
 
+With a *mids_sink*, the feed also subscribes to ``allMids`` and hands
+each ``{coin: mid}`` snapshot to the sink (normally
+:meth:`OrderManager.update_mids_from_ws`), so mid-price lookups stop
+polling ``all_mids`` over REST.
+
+Frames are read and decoded by the SDK's ``WebsocketManager``
+(websocket-client on its own thread, stdlib ``json`` with the C scanner);
+the callbacks here receive the decoded dicts and do O(1) work per message
+-- one top-of-book parse per ``l2Book`` push, a reference swap per
+``allMids`` snapshot.  Hyperliquid only serves JSON text frames, so there
+is no binary framing to opt into.
+
 Usage::
 
     feed = MarketDataFeed(info, market_data, coins)
@@ -16,7 +28,7 @@ Usage::
 import logging
 import threading
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +41,13 @@ class MarketDataFeed:
         info: Any,
         market_data: Any,
         coins: List[str],
+        mids_sink: Optional[Callable[[Dict[str, str]], None]] = None,
     ) -> None:
         self.info = info
         self.market_data = market_data
         self.coins = list(coins)
+        self._mids_sink = mids_sink
+        self._mids_sub_id: Optional[int] = None
 
         self._subscription_ids: Dict[str, int] = {}
         self._lock = threading.Lock()
@@ -59,6 +74,8 @@ class MarketDataFeed:
         self._running = True
         for coin in self.coins:
             self._subscribe_coin(coin)
+        if self._mids_sink is not None:
+            self._subscribe_mids()
 
         logger.info(
             "[ws] MarketDataFeed started — subscribed to %d coins: %s",
@@ -79,6 +96,12 @@ class MarketDataFeed:
                 except Exception:
                     pass
             self._subscription_ids.clear()
+            if self._mids_sub_id is not None:
+                try:
+                    self.info.unsubscribe({"type": "allMids"}, self._mids_sub_id)
+                except Exception:
+                    pass
+                self._mids_sub_id = None
         logger.info(
             "[ws] MarketDataFeed stopped (updates=%d, errors=%d)",
             self._update_count,
@@ -103,6 +126,31 @@ class MarketDataFeed:
             self._error_count += 1
             logger.error("[ws] Failed to subscribe l2Book for %s: %s", coin, e)
 
+    def _subscribe_mids(self) -> None:
+        """Subscribe to allMids and forward snapshots to the mids sink."""
+        try:
+            self._mids_sub_id = self.info.subscribe(
+                {"type": "allMids"},
+                self._on_all_mids,
+            )
+            logger.debug("[ws] Subscribed allMids (id=%d)", self._mids_sub_id)
+        except Exception as e:
+            self._error_count += 1
+            logger.error("[ws] Failed to subscribe allMids: %s", e)
+
+    def _on_all_mids(self, msg: Dict) -> None:
+        """Callback invoked on the SDK WebSocket thread."""
+        if not self._running:
+            return
+        try:
+            mids = msg.get("data", {}).get("mids")
+            if mids:
+                self._mids_sink(mids)
+        except Exception as e:
+            self._error_count += 1
+            if self._error_count <= 5 or self._error_count % 100 == 0:
+                logger.error("[ws] Error processing allMids update: %s", e)
+
     def _on_l2_update(self, msg: Dict) -> None:
         """Callback invoked on the SDK WebSocket thread."""
         if not self._running:
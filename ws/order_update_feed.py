@@ -0,0 +1,130 @@
+"""WebSocket order-status feed for ``OrderManager.active_orders``.
+
+Subscribes to ``orderUpdates`` and forwards each pushed batch to a sink
+(the bot routes it to :meth:`OrderManager.apply_order_updates`), so orders
+leave ``active_orders`` within milliseconds of being filled or cancelled
+instead of on the next ``open_orders`` / ``user_fills`` poll.  The REST
+poll stays as a periodic reconciliation (``ORDER_RECONCILE_INTERVAL``) to
+cover pushes lost across a reconnect.
+
+Usage::
+
+    feed = OrderUpdateFeed(info, account_address, order_manager.apply_order_updates)
+    feed.start()
+    ...
+    feed.stop()
+"""
+
+import logging
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class OrderUpdateFeed:
+    """Push-based order status via WebSocket orderUpdates subscription."""
+
+    def __init__(
+        self,
+        info: Any,
+        account_address: str,
+        sink: Callable[[List[Dict]], Any],
+    ) -> None:
+        self.info = info
+        self.account_address = account_address
+        self._sink = sink
+
+        self._subscription_id: int = -1
+        self._running = False
+        self._update_count = 0
+        self._error_count = 0
+
+    # ------------------------------------------------------------------ #
+    #  Lifecycle
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        """Subscribe to orderUpdates. Non-blocking."""
+        if self.info.ws_manager is None:
+            logger.warning("[ws-order] WebSocket manager not available, order update feed disabled")
+            return
+
+        self._running = True
+        try:
+            self._subscription_id = self.info.subscribe(
+                {"type": "orderUpdates", "user": self.account_address},
+                self._on_order_updates,
+            )
+            logger.info("[ws-order] OrderUpdateFeed started for %s", self.account_address)
+        except Exception as e:
+            self._error_count += 1
+            self._running = False
+            logger.error("[ws-order] Failed to subscribe orderUpdates: %s", e)
+
+    def stop(self) -> None:
+        """Unsubscribe and stop the feed."""
+        self._running = False
+        if self._subscription_id >= 0:
+            try:
+                self.info.unsubscribe(
+                    {"type": "orderUpdates", "user": self.account_address},
+                    self._subscription_id,
+                )
+            except Exception:
+                pass
+            self._subscription_id = -1
+        logger.info(
+            "[ws-order] OrderUpdateFeed stopped (updates=%d, errors=%d)",
+            self._update_count,
+            self._error_count,
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Callback
+    # ------------------------------------------------------------------ #
+
+    def _on_order_updates(self, msg: Dict) -> None:
+        """Handle orderUpdates WebSocket message.
+
+        Message format::
+
+            {
+                "channel": "orderUpdates",
+                "data": [
+                    {
+                        "order": {"coin": "BTC", "oid": 123, "sz": "0.0", "origSz": "0.1", ...},
+                        "status": "filled",
+                        "statusTimestamp": 1700000000000
+                    },
+                    ...
+                ]
+            }
+        """
+        if not self._running:
+            return
+        try:
+            updates = msg.get("data") or []
+            if not updates:
+                return
+            self._update_count += len(updates)
+            self._sink(updates)
+        except Exception as e:
+            self._error_count += 1
+            if self._error_count <= 5 or self._error_count % 100 == 0:
+                logger.error("[ws-order] Error processing order updates: %s", e)
+
+    # ------------------------------------------------------------------ #
+    #  Observability
+    # ------------------------------------------------------------------ #
+
+    @property
+    def is_running(self) -> bool:
+        return self._running and self._subscription_id >= 0
+
+    @property
+    def stats(self) -> Dict:
+        return {
+            "running": self._running,
+            "updates": self._update_count,
+            "errors": self._error_count,
+        }
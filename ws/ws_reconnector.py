@@ -120,6 +120,9 @@ class WsReconnector:
         if bot.fill_feed:
             bot.fill_feed.stop()
             bot.fill_feed = None
+        if bot.order_update_feed:
+            bot.order_update_feed.stop()
+            bot.order_update_feed = None
         if bot.ws_feed:
             # Stop the underlying SDK WebSocket manager thread
             ws_mgr = getattr(bot.ws_feed.info, 'ws_manager', None)
@@ -134,19 +137,33 @@ class WsReconnector:
     def _rebuild(self, bot: "HyperliquidBot") -> None:  # noqa: F821
         """Create fresh WS Info + feeds + guards."""
         from hyperliquid.info import Info as WsInfo
-        from ws import MarketDataFeed, FillFeed, BboGuard, ImbalanceGuard, CloseRefreshGuard, BboVelocityGuard
+        from ws import (
+            MarketDataFeed, FillFeed, OrderUpdateFeed, BboGuard, ImbalanceGuard, CloseRefreshGuard, BboVelocityGuard,
+        )
         from config import Config
 
         perp_dexs = bot._build_perp_dexs()
         ws_info = WsInfo(
             base_url=Config.API_URL,
             skip_ws=False,
+            meta=getattr(bot, '_base_meta', None),
+            spot_meta=getattr(bot, '_base_spot_meta', None),
             perp_dexs=perp_dexs,
             timeout=bot.api_timeout,
         )
 
-        bot.ws_feed = MarketDataFeed(ws_info, bot.market_data, bot.coins)
+        bot.ws_feed = MarketDataFeed(
+            ws_info, bot.market_data, bot.coins,
+            mids_sink=bot._on_ws_all_mids if bot._ws_all_mids else None,
+        )
         bot.ws_feed.start()
+        if bot._ws_min_cycle_interval > 0:
+            bot.ws_feed.add_listener(bot._on_ws_book_update)
+        if bot._ws_order_updates:
+            bot.order_update_feed = OrderUpdateFeed(
+                ws_info, bot.account_address, bot._on_ws_order_updates,
+            )
+            bot.order_update_feed.start()
 
         tracker = getattr(bot.strategy, 'order_tracker', None)
         if tracker is not None: